@@ -0,0 +1,38 @@
+from datetime import date
+from typing import Literal, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
+from app.api.scraping import get_api_key
+from app.db.export import FORMATS, ExportFilters, stream_export
+from app.core.logging_config import get_logger
+
+logger = get_logger(__name__)
+router = APIRouter()
+
+
+@router.get("/{kind}", summary="Stream a bulk export of events or clubs")
+async def export(
+    kind: Literal["events", "clubs"],
+    format: Literal["ndjson", "csv", "parquet"] = "ndjson",
+    source: Optional[str] = Query(None, description="Events from this source only"),
+    date_from: Optional[date] = Query(None, description="Events on or after this date"),
+    date_to: Optional[date] = Query(None, description="Events on or before this date"),
+    verified: Optional[bool] = Query(None, description="Only verified (true) or unverified (false) events"),
+    api_key: str = Depends(get_api_key),
+):
+    """
+    Every matching row, streamed from a server-side cursor in constant memory.
+    Arrays and JSON objects are JSON text in CSV. Parquet needs pyarrow on the server.
+    """
+    filters = ExportFilters(source=source, date_from=date_from, date_to=date_to, verified=verified)
+    try:
+        chunks = stream_export(kind, format, filters)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    media_type, extension = FORMATS[format]
+    logger.info(f"Exporting {kind} as {format} (source={source}, from={date_from}, to={date_to}, verified={verified})")
+    return StreamingResponse(
+        chunks,
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{kind}-{date.today():%Y%m%d}.{extension}"'},
+    )
@@ -1,11 +1,64 @@
-from fastapi import APIRouter, HTTPException, UploadFile, File, Form
+from fastapi import APIRouter, BackgroundTasks, HTTPException, Request, UploadFile, File, Form
+from fastapi.concurrency import run_in_threadpool
+from fastapi.routing import APIRoute
 from pydantic import BaseModel
-from typing import Literal
-from app.core.supabase_client import SUPABASE_URL, supabase
+from starlette.types import Message, Receive
+from typing import Callable, Dict, Literal, Optional
+import asyncio
+import hashlib
+import hmac
+import time
+from app.core.config import settings
+from app.core.storage import get_storage
+from app.core.image_variants import CONTENT_TYPES, VARIANT_SIZES, generate_variants, variant_path
 from app.core.logging_config import get_logger
 
 logger = get_logger(__name__)
-router = APIRouter()
+
+MAX_UPLOAD_BYTES = 10 * 1024 * 1024  # 10 MB
+# Room for the multipart framing and form fields around the file itself
+MAX_REQUEST_BYTES = MAX_UPLOAD_BYTES + 64 * 1024
+UPLOAD_CHUNK_BYTES = 256 * 1024
+ALLOWED_CONTENT_TYPES = {"image/jpeg", "image/jpg", "image/png", "image/webp", "image/avif", "image/gif"}
+
+def too_large(max_bytes: int = MAX_UPLOAD_BYTES) -> HTTPException:
+    return HTTPException(status_code=413, detail=f"File too large. Maximum size is {max_bytes // (1024 * 1024)} MB.")
+
+def limit_receive(receive: Receive, max_bytes: int) -> Receive:
+    """Wrap an ASGI receive so the body stops being read once it passes max_bytes."""
+    received = 0
+
+    async def limited() -> Message:
+        nonlocal received
+        message = await receive()
+        if message["type"] == "http.request":
+            received += len(message.get("body", b""))
+            if received > max_bytes:
+                raise too_large()
+        return message
+
+    return limited
+
+class BodyLimitRoute(APIRoute):
+    """
+    Rejects request bodies over MAX_REQUEST_BYTES before FastAPI parses them:
+    a multipart form is spooled to disk in full before the endpoint runs, so
+    checking the file there is too late. A declared Content-Length is refused
+    up front; a chunked body is cut off as soon as it passes the limit.
+    """
+
+    def get_route_handler(self) -> Callable:
+        handler = super().get_route_handler()
+
+        async def limited_handler(request: Request):
+            content_length = request.headers.get("content-length")
+            if content_length and content_length.isdigit() and int(content_length) > MAX_REQUEST_BYTES:
+                raise too_large()
+            return await handler(Request(request.scope, limit_receive(request.receive, MAX_REQUEST_BYTES)))
+
+        return limited_handler
+
+router = APIRouter(route_class=BodyLimitRoute)
 
 class GenerateUploadUrlRequest(BaseModel):
     type: Literal["club", "event"]
@@ -15,48 +68,201 @@ class GenerateUploadUrlRequest(BaseModel):
     index: int  # 1, 2, or 3
     file: UploadFile
 
-@router.post("/generate-upload-url/")
-async def generate_upload_url(
-    type: Literal["club", "event"] = Form(...),
-    event_date: str = Form(...),  # YYYY-MM-DD
-    event_name: str = Form(...),
-    file_ext: str = Form(...),  # e.g. 'jpeg', 'png'
-    index: int = Form(...),  # 1, 2, or 3
-    file: UploadFile = File(...)
-):
+class PresignUploadRequest(BaseModel):
+    type: Literal["club", "event"]
+    event_date: str  # YYYY-MM-DD
+    event_name: str
+    file_ext: str  # e.g. 'jpeg', 'png'
+    index: int  # 1, 2, or 3
+    content_type: str
+    size: Optional[int] = None  # bytes, checked against MAX_UPLOAD_BYTES when given
+
+class CompleteUploadRequest(BaseModel):
+    path: str
+    upload_token: str  # from /presign-upload/
+
+def validate_upload_target(type: str, index: int) -> None:
     if index not in [1, 2, 3]:
         raise HTTPException(status_code=400, detail="Index must be 1, 2, or 3.")
 
     if type not in ["club", "event"]:
         raise HTTPException(status_code=400, detail="Invalid type. Must be 'club' or 'event'.")
 
-    bucket = "runzaarwebsite"
+def validate_content_type(content_type: Optional[str]) -> None:
+    if content_type not in ALLOWED_CONTENT_TYPES:
+        raise HTTPException(status_code=415, detail=f"Unsupported file type: {content_type}")
 
+def build_file_path(type: str, event_date: str, event_name: str, index: int, file_ext: str) -> str:
     safe_event_name = event_name.replace(" ", "_").replace("/", "-")
+    safe_ext = file_ext.lower().lstrip(".").replace("/", "")
     if type == "club":
-        file_path = f"clubs/{safe_event_name}/{safe_event_name}_{index}.{file_ext}"
-    else:
-        file_path = f"events/{event_date}/{safe_event_name}_{index}.{file_ext}"
+        return f"clubs/{safe_event_name}/{safe_event_name}_{index}.{safe_ext}"
+    return f"events/{event_date.replace('/', '-')}/{safe_event_name}_{index}.{safe_ext}"
+
+def sign_upload(path: str, expires_at: int) -> str:
+    """Token binding an upload path to an expiry, so only paths we presigned can be completed."""
+    digest = hmac.new(settings.UPLOAD_SIGNING_SECRET.encode(), f"{path}:{expires_at}".encode(), hashlib.sha256).hexdigest()
+    return f"{expires_at}.{digest}"
+
+def verify_upload_token(path: str, token: str) -> bool:
+    expires_at, _, _ = token.partition(".")
+    if not expires_at.isdigit() or int(expires_at) < time.time():
+        return False
+    return hmac.compare_digest(sign_upload(path, int(expires_at)), token)
+
+def variant_urls(bucket: str, file_path: str, formats=tuple(CONTENT_TYPES)) -> Dict[str, Dict[str, str]]:
+    storage = get_storage()
+    return {
+        variant: {fmt: storage.public_url(bucket, variant_path(file_path, variant, fmt)) for fmt in formats}
+        for variant in VARIANT_SIZES
+    }
+
+async def read_upload(file: UploadFile, max_bytes: int = MAX_UPLOAD_BYTES) -> bytes:
+    """Read an upload in chunks, rejecting it as soon as it exceeds max_bytes."""
+    if file.size is not None and file.size > max_bytes:
+        raise too_large(max_bytes)
 
+    buffer = bytearray()
+    while True:
+        chunk = await file.read(UPLOAD_CHUNK_BYTES)
+        if not chunk:
+            break
+        buffer.extend(chunk)
+        if len(buffer) > max_bytes:
+            raise too_large(max_bytes)
+    if not buffer:
+        raise HTTPException(status_code=400, detail="Uploaded file is empty.")
+    return bytes(buffer)
+
+async def upload_object(bucket: str, file_path: str, data: bytes, content_type: str):
+    """Upload to storage in a worker thread so the blocking client doesn't stall the event loop."""
+    return await run_in_threadpool(get_storage().upload, bucket, file_path, data, content_type)
+
+async def upload_variants(bucket: str, file_path: str, data: bytes) -> Dict[str, Dict[str, str]]:
+    """Re-encode the original into resized WebP/AVIF variants and upload them next to it."""
+    rendered = await generate_variants(data)
+    storage = get_storage()
+    uploads = []
+    variants: Dict[str, Dict[str, str]] = {}
+    for (variant, fmt), variant_bytes in rendered.items():
+        path = variant_path(file_path, variant, fmt)
+        uploads.append(upload_object(bucket, path, variant_bytes, CONTENT_TYPES[fmt]))
+        variants.setdefault(variant, {})[fmt] = storage.public_url(bucket, path)
+    await asyncio.gather(*uploads)
+    return variants
+
+async def process_uploaded_image(bucket: str, file_path: str) -> None:
+    """Background task: fetch a directly uploaded original and build its variants."""
     try:
-        
-        file_bytes = await file.read()
-        result = supabase.storage.from_(bucket).upload(file_path, file_bytes, {"content-type": file.content_type, "upsert": "true"} )
+        storage = get_storage()
+        size = await run_in_threadpool(storage.object_size, bucket, file_path)
+        if size is None or size > MAX_UPLOAD_BYTES:
+            logger.warning(f"Skipping variants for missing or oversized upload {file_path} ({size} bytes).")
+            return
+        data = await run_in_threadpool(storage.download, bucket, file_path)
+        if len(data) > MAX_UPLOAD_BYTES:
+            logger.warning(f"Skipping variants for oversized upload {file_path} ({len(data)} bytes).")
+            return
+        await upload_variants(bucket, file_path, data)
+        logger.info(f"Image variants generated for {file_path}")
+    except Exception as e:
+        logger.error(f"Failed to generate image variants for {file_path}: {str(e)}", exc_info=True)
 
-        logger.info(f"File uploaded successfully: {result}")
+@router.post("/presign-upload/")
+async def presign_upload(request: PresignUploadRequest):
+    """
+    Return a short-lived signed URL the client uploads the image to directly,
+    so image bytes never pass through the API. Call /complete-upload/ afterwards,
+    with the returned upload_token, to generate the resized variants.
+    """
+    validate_upload_target(request.type, request.index)
+    validate_content_type(request.content_type)
+    if request.size is not None and request.size > MAX_UPLOAD_BYTES:
+        raise too_large()
+
+    bucket = settings.STORAGE_BUCKET
+    file_path = build_file_path(request.type, request.event_date, request.event_name, request.index, request.file_ext)
+    storage = get_storage()
+
+    try:
+        signed = await run_in_threadpool(
+            storage.presign_upload, bucket, file_path, request.content_type,
+            settings.UPLOAD_URL_EXPIRES_SECONDS, MAX_UPLOAD_BYTES
+        )
+    except Exception as e:
+        logger.error(f"Failed to create signed upload URL for {file_path}: {str(e)}")
+        raise HTTPException(status_code=500, detail="Failed to create upload URL.")
+
+    return {
+        **signed,
+        # Expires with the advertised window: the URL itself on S3, only this token on Supabase
+        "upload_token": sign_upload(file_path, int(time.time()) + signed["expires_in"]),
+        "public_url": storage.public_url(bucket, file_path),
+        "bucket": bucket,
+        "path": file_path
+    }
+
+@router.post("/complete-upload/", status_code=202)
+async def complete_upload(request: CompleteUploadRequest, background_tasks: BackgroundTasks):
+    """Schedule variant generation for an image uploaded through a signed URL."""
+    if not request.path.startswith(("clubs/", "events/")) or ".." in request.path:
+        raise HTTPException(status_code=400, detail="Invalid upload path.")
+    if not verify_upload_token(request.path, request.upload_token):
+        raise HTTPException(status_code=403, detail="Invalid or expired upload token.")
+
+    bucket = settings.STORAGE_BUCKET
+    size = await run_in_threadpool(get_storage().object_size, bucket, request.path)
+    if size is None:
+        raise HTTPException(status_code=404, detail="Uploaded file not found.")
+    if size > MAX_UPLOAD_BYTES:
+        raise too_large()
+
+    background_tasks.add_task(process_uploaded_image, bucket, request.path)
+    return {
+        "message": "Processing scheduled",
+        "public_url": get_storage().public_url(bucket, request.path),
+        "variants": variant_urls(bucket, request.path),
+        "path": request.path
+    }
+
+@router.post("/generate-upload-url/", deprecated=True)
+async def generate_upload_url(
+    type: Literal["club", "event"] = Form(...),
+    event_date: str = Form(...),  # YYYY-MM-DD
+    event_name: str = Form(...),
+    file_ext: str = Form(...),  # e.g. 'jpeg', 'png'
+    index: int = Form(...),  # 1, 2, or 3
+    file: UploadFile = File(...)
+):
+    """Proxy upload through the API. Prefer /presign-upload/, which keeps bytes off the API worker."""
+    validate_upload_target(type, index)
+    validate_content_type(file.content_type)
 
-        # Build URLs
-        upload_url = f"{SUPABASE_URL}/storage/v1/object/{bucket}/{file_path}"
-        public_url = f"{SUPABASE_URL}/storage/v1/object/public/{bucket}/{file_path}"
+    bucket = settings.STORAGE_BUCKET
+    file_path = build_file_path(type, event_date, event_name, index, file_ext)
 
-        return {
-            "message": "Upload successful",
-            "upload_url": upload_url,
-            "public_url": public_url,
-            "bucket": bucket,
-            "path": file_path
-        }
+    file_bytes = await read_upload(file)
 
+    try:
+        result = await upload_object(bucket, file_path, file_bytes, file.content_type)
+        logger.info(f"File uploaded successfully: {result}")
     except Exception as e:
         logger.error(f"Failed to upload file: {str(e)}")
-        raise HTTPException(status_code=500, detail="Failed to upload file.")
\ No newline at end of file
+        raise HTTPException(status_code=500, detail="Failed to upload file.")
+
+    # Variants are best effort: the original is already stored and usable
+    try:
+        variants = await upload_variants(bucket, file_path, file_bytes)
+    except Exception as e:
+        logger.error(f"Failed to generate image variants for {file_path}: {str(e)}", exc_info=True)
+        variants = {}
+
+    storage = get_storage()
+    return {
+        "message": "Upload successful",
+        "upload_url": storage.object_url(bucket, file_path),
+        "public_url": storage.public_url(bucket, file_path),
+        "variants": variants,
+        "bucket": bucket,
+        "path": file_path
+    }
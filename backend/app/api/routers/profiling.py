@@ -0,0 +1,61 @@
+from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import FileResponse
+from pydantic import BaseModel, Field
+import os
+from app.api.scraping import get_api_key
+from app.core.profiling import control, profile_dir
+from app.core.logging_config import get_logger
+
+logger = get_logger(__name__)
+router = APIRouter()
+
+PROFILE_SUFFIXES = (".collapsed", ".queries.json")
+
+
+class ProfileRequestsBody(BaseModel):
+    count: int = Field(5, ge=1, le=100)
+    path_prefix: str = "/api/"
+
+
+def list_profiles():
+    directory = profile_dir()
+    if not os.path.isdir(directory):
+        return []
+    return sorted((f for f in os.listdir(directory) if f.endswith(PROFILE_SUFFIXES)), reverse=True)
+
+
+@router.get("", summary="Profiler status and recorded profiles")
+async def profiler_status(api_key: str = Depends(get_api_key)):
+    return {**control.status(), "profiles": list_profiles()}
+
+
+@router.post("/requests", summary="Profile the next N requests")
+async def profile_requests(body: ProfileRequestsBody, api_key: str = Depends(get_api_key)):
+    """
+    Sample the next `count` requests whose path starts with `path_prefix`.
+    Only this worker process is armed.
+    """
+    control.arm_requests(body.count, body.path_prefix)
+    logger.info(f"Profiler armed for the next {body.count} requests under {body.path_prefix}")
+    return control.status()
+
+
+@router.post("/scrape", summary="Profile the next scrape run")
+async def profile_scrape(api_key: str = Depends(get_api_key)):
+    control.arm_scrape()
+    logger.info("Profiler armed for the next scrape run")
+    return control.status()
+
+
+@router.delete("", summary="Disarm the profiler")
+async def disarm_profiler(api_key: str = Depends(get_api_key)):
+    control.disarm()
+    return control.status()
+
+
+@router.get("/{name}", summary="Download a recorded profile")
+async def download_profile(name: str, api_key: str = Depends(get_api_key)):
+    """`.collapsed` files load directly into speedscope or flamegraph.pl; `.queries.json` holds the DB query log."""
+    if name not in list_profiles():
+        raise HTTPException(status_code=404, detail="Profile not found")
+    return FileResponse(os.path.join(profile_dir(), name), filename=name)
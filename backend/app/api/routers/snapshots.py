@@ -0,0 +1,38 @@
+import os
+import re
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.responses import FileResponse
+from app.core.compression import negotiate
+from app.db.snapshot import MANIFEST, SUFFIXES, ist_today, read_manifest, snapshot_dir
+
+router = APIRouter()
+
+HASHED_NAME = re.compile(r"^(events|clubs)\.[0-9a-f]{16}\.json$")
+
+
+@router.get("/manifest.json", summary="Current snapshot files")
+async def snapshot_manifest():
+    """Names of the current events and clubs snapshot files. Short-lived; the files it names are immutable."""
+    manifest = read_manifest()
+    # A snapshot from before today's rollover would still list past events
+    if manifest is None or manifest.get("date") != ist_today().isoformat():
+        raise HTTPException(status_code=404, detail="No current snapshot")
+    return FileResponse(
+        os.path.join(snapshot_dir(), MANIFEST),
+        media_type="application/json",
+        headers={"Cache-Control": "public, max-age=60"},
+    )
+
+
+@router.get("/{name}", summary="Download a snapshot file")
+async def snapshot_file(name: str, request: Request):
+    """A content-hashed snapshot, pre-compressed in the best encoding the client accepts."""
+    path = os.path.join(snapshot_dir(), name)
+    if not HASHED_NAME.match(name) or not os.path.isfile(path):
+        raise HTTPException(status_code=404, detail="Snapshot not found")
+    headers = {"Cache-Control": "public, max-age=31536000, immutable", "Vary": "Accept-Encoding"}
+    encoding = negotiate(request.headers.get("accept-encoding"))
+    if encoding and os.path.isfile(path + SUFFIXES[encoding]):
+        path += SUFFIXES[encoding]
+        headers["Content-Encoding"] = encoding
+    return FileResponse(path, media_type="application/json", headers=headers)
@@ -1,22 +1,49 @@
-from datetime import date, datetime, timedelta
-from fastapi import APIRouter, HTTPException, Depends, Request, Body
-from typing import List
+from datetime import date
+from fastapi import APIRouter, BackgroundTasks, HTTPException, Depends, Request, Response, Body, Query
+from fastapi.responses import StreamingResponse
+from typing import List, Literal, Optional
+from sqlalchemy import func, select
 from sqlalchemy.orm import Session
-from app.schemas.event import Event, EventCreate, ShowEvent, EventSubmission
+from app.schemas.event import Event, EventCreate, ShowEvent, EventSubmission, NearbyEvent, EventFacets, EventChanges
 from app.models.event import Event as EventModel
 from app.schemas.club import Club, ClubCreate, ClubSubmission
 from app.models.club import Club as ClubModel
+from app.schemas.search import SearchResponse, SearchResult
+from app.schemas.home import HomePage
+from app.db.search import search_catalog
+from app.db.geo import nearby_event_ids
+from app.db.facets import apply_facet_delta, get_facets
+from app.db.snapshot import ist_today, refresh_snapshot_in_new_session
+from app.db.home import home_page
+from app.db.changes import event_changes, parse_cursor
+from app.db.fieldsets import CLUB_FIELDS, EVENT_FIELDS, encode_rows, parse_fields
+from app.db.taxonomy import assign_city_ids, link_categories, city_id, category_id
+from app.models.category import event_categories
+from app.scrapers.geocoding import geocode_fields, bounding_box
 from app.db.base import SessionLocal
+from app.core.cache_bus import CLUBS, EVENTS, publish
+from app.core.response_cache import cached_json
+from app.core.live_updates import event_stream, live_hub
 from app.api.scraping import router as scraping_router
-from app.core.logging_config import get_logger
-from app.core.config import Settings
+from app.core.logging_config import get_logger, SAMPLED
+from app.core.config import settings
 from app.api.routers.image_upload import router as image_upload_router
-import requests
+from app.api.routers.profiling import router as profiling_router
+from app.api.routers.snapshots import router as snapshots_router
+from app.api.routers.export import router as export_router
 import uuid
+from pydantic import TypeAdapter
 from slugify import slugify
 
+# Serializers for cached responses (pydantic-core writes the JSON directly)
+SHOW_EVENTS = TypeAdapter(List[ShowEvent])
+EVENT = TypeAdapter(Event)
+CLUBS_LIST = TypeAdapter(List[Club])
+CLUB = TypeAdapter(Club)
+FACETS = TypeAdapter(EventFacets)
+HOME = TypeAdapter(HomePage)
+CHANGES = TypeAdapter(EventChanges)
 
-settings = Settings()
 
 logger = get_logger(__name__)
 
@@ -30,6 +57,18 @@ logger.info("Scraping router included.")
 router.include_router(image_upload_router, prefix="/media", tags=["media"])
 logger.info("Image upload router included.")
 
+# Include the admin profiler router
+router.include_router(profiling_router, prefix="/admin/profiling", tags=["admin"])
+logger.info("Profiling router included.")
+
+# Include the admin bulk export router
+router.include_router(export_router, prefix="/admin/export", tags=["admin"])
+logger.info("Export router included.")
+
+# Include the static events/clubs snapshot router
+router.include_router(snapshots_router, prefix="/snapshots", tags=["snapshots"])
+logger.info("Snapshot router included.")
+
 # Dependency
 def get_db():
     # logger.debug("Creating database session.")
@@ -41,6 +80,7 @@ def get_db():
         db.close()
 
 def verify_recaptcha(token: str) -> bool:
+    import requests  # only submissions need it; keeps it out of API startup
     url = "https://www.google.com/recaptcha/api/siteverify"
     data = {"secret": settings.RECAPTCHA_SECRET, "response": token}
     response = requests.post(url, data=data)
@@ -57,29 +97,56 @@ def generate_unique_id(db, model, name_field, name_value):
     return unique_id
 
 @router.get("/events", response_model=List[ShowEvent])
-async def get_events(request: Request, db: Session = Depends(get_db)):
-    logger.info(f"GET /events request from {request.client.host}")
+async def get_events(
+    request: Request,
+    city: Optional[str] = None,
+    category: Optional[str] = None,
+    fields: Optional[str] = Query(None, description="Comma-separated fields to return, e.g. title,date,location"),
+    format: Literal["json", "columns"] = Query("json", description="columns: column-oriented JSON"),
+    db: Session = Depends(get_db),
+):
+    logger.info("GET /events request from %s", request.client.host, extra=SAMPLED)
+    today = ist_today()  # same rollover as the static snapshot of this list
     try:
-        today = date.today() # - timedelta(days=1)  # Get today's date minus one day
-        verified_events = events = db.query(EventModel).all()
-        # verified_events = db.query(EventModel).filter(EventModel.is_verified == True).all()
-        # filter events in Python by parsing string dates
-        filtered_events = []
-        for event in verified_events:
-            event_date = datetime.strptime(event.date, "%d %b %Y").date()
-            validated_event = ShowEvent.model_validate(event)
+        selected = parse_fields(fields, EVENT_FIELDS)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if selected is None and format != "json":
+        selected = EVENT_FIELDS
 
-            if event_date >= today:
-                filtered_events.append(validated_event)
+    def build() -> bytes:
+        if selected:
+            # Only the requested columns leave the database
+            query = db.query(*(getattr(EventModel, f) for f in selected))
+        else:
+            query = db.query(EventModel)
+        # Upcoming only; event_day() is NULL for free-text dates ("Date TBD"), which drops them
+        query = query.filter(func.event_day(EventModel.date) >= today)
+        # Aliases resolve to the canonical id ("bombay" -> Mumbai); unknown names match nothing
+        if city:
+            query = query.filter(EventModel.city_id == (city_id(db, city) or -1))
+        if category:
+            query = query.filter(EventModel.id.in_(
+                select(event_categories.c.event_id).where(event_categories.c.category_id == (category_id(db, category) or -1))
+            ))
+        if selected:
+            return encode_rows([row._asdict() for row in query.all()], selected, format)
 
-        return filtered_events
+        # verified_events = db.query(EventModel).filter(EventModel.is_verified == True).all()
+        return SHOW_EVENTS.dump_json([ShowEvent.model_validate(event) for event in query.all()])
+
+    try:
+        key = f"events:{today}:{city or ''}:{category or ''}"
+        if selected:
+            key += f":{','.join(selected)}:{format}"
+        return cached_json(request, key, (EVENTS,), build)
     except Exception as e:
         logger.error(f"Error fetching events: {e}")
         raise HTTPException(status_code=500, detail="Error fetching events")
 
 @router.post("/events", response_model=Event)
-async def create_event(submission: EventSubmission, request: Request, db: Session = Depends(get_db)):
-    logger.info(f"POST /events request from {request.client.host} with payload: {submission}")
+async def create_event(submission: EventSubmission, request: Request, background_tasks: BackgroundTasks, db: Session = Depends(get_db)):
+    logger.info(f"POST /events request from {request.client.host} for event: {submission.title}")
     if not verify_recaptcha(submission.recaptcha_token):
         raise HTTPException(status_code=400, detail="Invalid reCAPTCHA. Please try again.")
     try:
@@ -88,69 +155,214 @@ async def create_event(submission: EventSubmission, request: Request, db: Sessio
         event_data["is_verified"] = False
         event_data["source"] = "User Submitted"
         event_data["id"] = generate_unique_id(db, EventModel, "title", event_data["title"])
+        event_data.update(geocode_fields(event_data["location"], event_data.get("address")))
+        assign_city_ids(db, [event_data])
         db_event = EventModel(**event_data)
         db.add(db_event)
+        db.flush()
+        link_categories(db, [event_data])
+        apply_facet_delta(db, added=[event_data])
+        publish(db, EVENTS)
         db.commit()
         db.refresh(db_event)
         logger.info(f"Event created with ID: {db_event.id}")
+        background_tasks.add_task(refresh_snapshot_in_new_session)
         return db_event
     except Exception as e:
         db.rollback()
         logger.error(f"Error creating event: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail=str(e))
 
+@router.get("/events/facets", response_model=EventFacets)
+async def get_event_facets(request: Request, db: Session = Depends(get_db)):
+    """Upcoming event counts per city, category, month and price band"""
+    logger.info("GET /events/facets request from %s", request.client.host, extra=SAMPLED)
+    try:
+        return cached_json(request, f"facets:{date.today()}", (EVENTS,), lambda: FACETS.dump_json(get_facets(db)))
+    except Exception as e:
+        logger.error(f"Error fetching event facets: {e}", exc_info=True)
+        raise HTTPException(status_code=500, detail="Error fetching event facets")
+
+@router.get("/home", response_model=HomePage)
+async def get_home(
+    request: Request,
+    events: int = Query(8, ge=1, le=50),
+    clubs: int = Query(3, ge=0, le=50),
+    db: Session = Depends(get_db),
+):
+    """Everything the homepage shows: the next upcoming events, featured clubs and city/category counts"""
+    logger.info("GET /home request from %s", request.client.host, extra=SAMPLED)
+    today = date.today()
+    try:
+        return cached_json(
+            request, f"home:{today}:{events}:{clubs}", (EVENTS, CLUBS),
+            lambda: HOME.dump_json(HOME.validate_python(home_page(db, today, events, clubs), from_attributes=True)),
+        )
+    except Exception as e:
+        logger.error(f"Error building home page: {e}", exc_info=True)
+        raise HTTPException(status_code=500, detail="Error building home page")
+
+@router.get("/events/changes", response_model=EventChanges)
+async def get_event_changes(
+    request: Request,
+    since: Optional[str] = Query(None, description="Cursor from the previous response; omit for a full sync"),
+    db: Session = Depends(get_db),
+):
+    """
+    Upcoming events inserted or updated since the cursor, with the ids of
+    events that expired or were deleted. Apply by id, then pass the returned
+    cursor next time. "reset" means replace the local copy entirely.
+    """
+    logger.info("GET /events/changes?since=%s request from %s", since, request.client.host, extra=SAMPLED)
+    try:
+        since_at = parse_cursor(since) if since else None
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    try:
+        changes = CHANGES.validate_python(event_changes(db, since_at, date.today()), from_attributes=True)
+        return Response(content=CHANGES.dump_json(changes), media_type="application/json")
+    except Exception as e:
+        logger.error(f"Error fetching event changes: {e}", exc_info=True)
+        raise HTTPException(status_code=500, detail="Error fetching event changes")
+
+@router.get("/events/live")
+async def live_event_updates(request: Request):
+    """
+    Server-Sent Events stream of data changes. Each "change" event carries the
+    changed topics ("events", "clubs"), sent once the write commits; refetch or
+    call /events/changes. "resync" means updates may have been missed.
+    """
+    queue = live_hub.subscribe()
+    if queue is None:
+        logger.warning(f"Live updates at capacity ({live_hub.max_clients} clients); refusing {request.client.host}")
+        raise HTTPException(status_code=503, detail="Too many live update clients", headers={"Retry-After": "30"})
+    logger.info("Live updates client %s connected (%s total)", request.client.host, live_hub.client_count, extra=SAMPLED)
+    return StreamingResponse(
+        event_stream(queue),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+@router.get("/events/nearby", response_model=List[NearbyEvent])
+async def get_nearby_events(
+    request: Request,
+    lat: Optional[float] = Query(None, ge=-90, le=90),
+    lon: Optional[float] = Query(None, ge=-180, le=180),
+    radius_km: float = Query(25, gt=0, le=500),
+    bbox: Optional[str] = Query(None, description="min_lon,min_lat,max_lon,max_lat"),
+    limit: int = Query(50, ge=1, le=200),
+    db: Session = Depends(get_db),
+):
+    """Upcoming events within radius_km of lat/lon, or inside bbox, nearest first"""
+    logger.info("GET /events/nearby request from %s", request.client.host, extra=SAMPLED)
+    if bbox:
+        try:
+            min_lon, min_lat, max_lon, max_lat = (float(v) for v in bbox.split(","))
+        except ValueError:
+            raise HTTPException(status_code=422, detail="bbox must be min_lon,min_lat,max_lon,max_lat")
+        if min_lat > max_lat or min_lon > max_lon:
+            raise HTTPException(status_code=422, detail="bbox minimums must not exceed maximums")
+        box = (min_lat, min_lon, max_lat, max_lon)
+        # Distances are measured from the given point, else the box centre
+        if lat is None or lon is None:
+            lat, lon = (min_lat + max_lat) / 2, (min_lon + max_lon) / 2
+        radius = None
+    elif lat is not None and lon is not None:
+        box = bounding_box(lat, lon, radius_km)
+        radius = radius_km
+    else:
+        raise HTTPException(status_code=422, detail="Pass lat and lon, or bbox")
+
+    try:
+        hits = nearby_event_ids(db, lat, lon, box, radius_km=radius, limit=limit)
+        events = {e.id: e for e in db.query(EventModel).filter(EventModel.id.in_([i for i, _ in hits]))} if hits else {}
+        return [
+            NearbyEvent(**ShowEvent.model_validate(events[event_id]).model_dump(), distance_km=round(distance, 2))
+            for event_id, distance in hits if event_id in events
+        ]
+    except Exception as e:
+        logger.error(f"Error fetching nearby events: {e}", exc_info=True)
+        raise HTTPException(status_code=500, detail="Error fetching nearby events")
+
 @router.get("/events/{event_id}", response_model=Event)
 async def get_event(event_id: str, request: Request, db: Session = Depends(get_db)):
-    logger.info(f"GET /events/{event_id} request from {request.client.host}")
-    try:
+    logger.info("GET /events/%s request from %s", event_id, request.client.host, extra=SAMPLED)
+    def build() -> bytes:
         event = db.query(EventModel).filter(EventModel.id == event_id).first()
         if not event:
             logger.warning(f"Event with ID {event_id} not found.")
             raise HTTPException(status_code=404, detail="Event not found")
-        logger.info(f"Retrieved event with ID: {event_id}")
-        return event
+        logger.info("Retrieved event with ID: %s", event_id, extra=SAMPLED)
+        return EVENT.dump_json(EVENT.validate_python(event, from_attributes=True))
+
+    try:
+        return cached_json(request, f"event:{event_id}", (EVENTS,), build)
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error getting event {event_id}: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get("/events/source/{source}", response_model=List[Event])
 async def get_events_by_source(source: str, request: Request, db: Session = Depends(get_db)):
-    logger.info(f"GET /events/source/{source} request from {request.client.host}")
+    logger.info("GET /events/source/%s request from %s", source, request.client.host, extra=SAMPLED)
     """Get events from a specific source from database"""
     try:
         events = db.query(EventModel).filter(EventModel.source.ilike(f"%{source}%")).all()
-        logger.info(f"Retrieved {len(events)} events from source: {source}")
+        logger.info("Retrieved %s events from source: %s", len(events), source, extra=SAMPLED)
         return events
     except Exception as e:
         logger.error(f"Error getting events by source {source}: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get("/clubs", response_model=List[Club])
-async def get_clubs(request: Request, db: Session = Depends(get_db)):
-    logger.info(f"GET /clubs request from {request.client.host}")
+async def get_clubs(
+    request: Request,
+    fields: Optional[str] = Query(None, description="Comma-separated fields to return, e.g. name,location,logo_url"),
+    format: Literal["json", "columns"] = Query("json", description="columns: column-oriented JSON"),
+    db: Session = Depends(get_db),
+):
+    logger.info("GET /clubs request from %s", request.client.host, extra=SAMPLED)
     """Get all running clubs from database"""
     try:
+        selected = parse_fields(fields, CLUB_FIELDS)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if selected is None and format != "json":
+        selected = CLUB_FIELDS
+
+    def build() -> bytes:
+        if selected:
+            rows = [row._asdict() for row in db.query(*(getattr(ClubModel, f) for f in selected)).all()]
+            return encode_rows(rows, selected, format)
         clubs = db.query(ClubModel).all()
-        logger.info(f"Retrieved {len(clubs)} clubs from database.")
-        return clubs
+        logger.info("Retrieved %s clubs from database.", len(clubs), extra=SAMPLED)
+        return CLUBS_LIST.dump_json(CLUBS_LIST.validate_python(clubs, from_attributes=True))
+
+    try:
+        key = f"clubs:{','.join(selected)}:{format}" if selected else "clubs"
+        return cached_json(request, key, (CLUBS,), build)
     except Exception as e:
         logger.error(f"Error getting clubs: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.post("/clubs", response_model=Club)
-async def create_club(submission: ClubSubmission, request: Request, db: Session = Depends(get_db)):
-    logger.info(f"POST /clubs request from {request.client.host} with payload: {submission}")
+async def create_club(submission: ClubSubmission, request: Request, background_tasks: BackgroundTasks, db: Session = Depends(get_db)):
+    logger.info(f"POST /clubs request from {request.client.host} for club: {submission.name}")
     if not verify_recaptcha(submission.recaptcha_token):
         raise HTTPException(status_code=400, detail="Invalid reCAPTCHA. Please try again.")
     try:
         club_data = submission.model_dump()
         club_data.pop("recaptcha_token", None)
         club_data["id"] = generate_unique_id(db, ClubModel, "name", club_data["name"])
+        club_data.update(geocode_fields(club_data["location"], club_data.get("address")))
         db_club = ClubModel(**club_data)
         db.add(db_club)
+        publish(db, CLUBS)
         db.commit()
         db.refresh(db_club)
         logger.info(f"Club created with ID: {db_club.id}")
+        background_tasks.add_task(refresh_snapshot_in_new_session)
         return db_club
     except Exception as e:
         db.rollback()
@@ -159,15 +371,49 @@ async def create_club(submission: ClubSubmission, request: Request, db: Session
 
 @router.get("/clubs/{club_id}", response_model=Club)
 async def get_club(club_id: str, request: Request, db: Session = Depends(get_db)):
-    logger.info(f"GET /clubs/{club_id} request from {request.client.host}")
-    try:
-        print(f"Getting club with ID: {club_id}")
+    logger.info("GET /clubs/%s request from %s", club_id, request.client.host, extra=SAMPLED)
+    def build() -> bytes:
         club = db.query(ClubModel).filter(ClubModel.id == club_id).first()
         if not club:
             logger.warning(f"Club with ID {club_id} not found.")
             raise HTTPException(status_code=404, detail="Club not found")
-        logger.info(f"Retrieved club with ID: {club_id}")
-        return club
+        logger.info("Retrieved club with ID: %s", club_id, extra=SAMPLED)
+        return CLUB.dump_json(CLUB.validate_python(club, from_attributes=True))
+
+    try:
+        return cached_json(request, f"club:{club_id}", (CLUBS,), build)
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error getting club {club_id}: {e}", exc_info=True)
-        raise HTTPException(status_code=500, detail=str(e)) 
\ No newline at end of file
+        raise HTTPException(status_code=500, detail=str(e)) 
+@router.get("/search", response_model=SearchResponse)
+async def search(
+    request: Request,
+    q: str = Query(..., min_length=1, max_length=100),
+    type: Literal["all", "event", "club"] = "all",
+    upcoming: bool = True,
+    limit: int = Query(20, ge=1, le=50),
+    offset: int = Query(0, ge=0),
+    db: Session = Depends(get_db),
+):
+    """Ranked, typo-tolerant search over events and clubs"""
+    logger.info("GET /search?q=%s request from %s", q, request.client.host, extra=SAMPLED)
+    try:
+        total, hits = search_catalog(db, q, kind=type, upcoming=upcoming, limit=limit, offset=offset)
+        event_ids = [hit_id for kind, hit_id, _ in hits if kind == "event"]
+        club_ids = [hit_id for kind, hit_id, _ in hits if kind == "club"]
+        events = {e.id: e for e in db.query(EventModel).filter(EventModel.id.in_(event_ids))} if event_ids else {}
+        clubs = {c.id: c for c in db.query(ClubModel).filter(ClubModel.id.in_(club_ids))} if club_ids else {}
+
+        results = []
+        for kind, hit_id, score in hits:
+            if kind == "event" and hit_id in events:
+                results.append(SearchResult(type=kind, id=hit_id, score=score, event=ShowEvent.model_validate(events[hit_id])))
+            elif kind == "club" and hit_id in clubs:
+                results.append(SearchResult(type=kind, id=hit_id, score=score, club=Club.model_validate(clubs[hit_id])))
+        logger.info("Search for %r matched %s results", q, total, extra=SAMPLED)
+        return SearchResponse(query=q, total=total, limit=limit, offset=offset, results=results)
+    except Exception as e:
+        logger.error(f"Error searching for {q!r}: {e}", exc_info=True)
+        raise HTTPException(status_code=500, detail="Error searching events and clubs")
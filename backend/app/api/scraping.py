@@ -2,7 +2,6 @@ from fastapi import APIRouter, Depends, HTTPException, Body, BackgroundTasks, Re
 from fastapi.security import APIKeyHeader
 from typing import Annotated
 
-from app.scrapers.scraper_manager import ScraperManager
 from app.core.config import settings # Assuming you have a settings module for config
 from app.core.logging_config import get_logger # Import the new logger
 
@@ -13,6 +12,11 @@ router = APIRouter()
 API_KEY_NAME = "X-API-Key" 
 api_key_header = APIKeyHeader(name=API_KEY_NAME, auto_error=False)
 
+def new_scraper_manager():
+    """Imported on first use, so API startup doesn't load the scraping stack (aiohttp, bs4, lxml)"""
+    from app.scrapers.scraper_manager import ScraperManager
+    return ScraperManager()
+
 async def get_api_key(api_key: str = Depends(api_key_header)):
     logger.debug("Attempting API key validation.")
     if api_key == settings.SCRAPING_API_KEY: # Store your actual key in settings
@@ -39,7 +43,7 @@ async def trigger_scrape_all(
          raise HTTPException(status_code=403, detail="Invalid secret message")
     logger.info("Secret message validated for /trigger-scrape.")
 
-    scraper_manager = ScraperManager() # You might want to manage this instance via dependency injection
+    scraper_manager = new_scraper_manager() # You might want to manage this instance via dependency injection
 
     async def scrape_task():
         logger.info("Starting background scraping task for all sources...")
@@ -68,7 +72,7 @@ async def trigger_scrape_source(
         raise HTTPException(status_code=403, detail="Invalid secret message")
     logger.info(f"Secret message validated for /trigger-source-scrape/{source_name}.")
 
-    scraper_manager = ScraperManager() 
+    scraper_manager = new_scraper_manager() 
 
     async def scrape_task():
         logger.info(f"Starting background scraping task for source: {source_name}...")
@@ -96,7 +100,7 @@ async def clear_scraper_cache(
         raise HTTPException(status_code=403, detail="Invalid secret message")
     logger.info("Secret message validated for /clear-cache.")
 
-    scraper_manager = ScraperManager()
+    scraper_manager = new_scraper_manager()
     scraper_manager.clear_cache(source=source if source else None)
     if source:
         logger.info(f"Cache cleared for source: {source}")
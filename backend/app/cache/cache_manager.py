@@ -24,15 +24,16 @@ class CacheManager:
         """Get the cache file path for a specific source"""
         return os.path.join(self.cache_dir, f"{source.lower()}_events.json")
     
-    def is_cache_valid(self, source: str) -> bool:
-        """Check if cache for a source is still valid"""
+    def is_cache_valid(self, source: str, ttl_hours: float = None) -> bool:
+        """Check if cache for a source is still valid, optionally with a per-source TTL"""
         cache_file = self._get_cache_file(source)
         
         if not os.path.exists(cache_file):
             return False
             
+        cache_duration = timedelta(hours=ttl_hours) if ttl_hours is not None else self.cache_duration
         file_modified_time = datetime.fromtimestamp(os.path.getmtime(cache_file))
-        return datetime.now() - file_modified_time < self.cache_duration
+        return datetime.now() - file_modified_time < cache_duration
     
     def get_cached_events(self, source: str) -> List[Dict[str, Any]]:
         """Get events from cache for a specific source"""
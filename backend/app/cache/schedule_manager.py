@@ -0,0 +1,143 @@
+from typing import Dict, Any, List, Optional
+import json
+import os
+from datetime import datetime, timedelta
+from pathlib import Path
+from app.core.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# Months when most Indian races are announced and registrations open/close
+RACE_SEASON_MONTHS = {10, 11, 12, 1, 2}
+
+
+class SourceScheduleManager:
+    """
+    Tracks how often each scraper source yields new or changed events and
+    derives a per-source crawl interval (and cache TTL) from it.
+
+    The change rate is an exponentially weighted average of "did this run
+    produce changes" (1) or not (0). A source that changes on every run is
+    crawled every `min_interval_hours`, one that never changes every
+    `max_interval_hours`. During race season the interval is shortened by
+    `season_factor`.
+    """
+
+    def __init__(
+        self,
+        cache_dir: str = None,
+        min_interval_hours: float = 3,
+        max_interval_hours: float = 72,
+        default_interval_hours: float = 24,
+        smoothing: float = 0.3,
+        season_factor: float = 0.5,
+    ):
+        if cache_dir is None:
+            backend_dir = Path(__file__).parent.parent.parent
+            cache_dir = os.path.join(backend_dir, "cache")
+        self.cache_dir = cache_dir
+        self.state_file = os.path.join(self.cache_dir, "source_schedule.json")
+        self.min_interval_hours = min_interval_hours
+        self.max_interval_hours = max_interval_hours
+        self.default_interval_hours = default_interval_hours
+        self.smoothing = smoothing
+        self.season_factor = season_factor
+
+        if not os.path.exists(self.cache_dir):
+            os.makedirs(self.cache_dir)
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        if not os.path.exists(self.state_file):
+            return {}
+        try:
+            with open(self.state_file, 'r') as f:
+                return json.load(f)
+        except Exception as e:
+            logger.error(f"Error reading schedule state, starting fresh: {e}")
+            return {}
+
+    def _save(self, state: Dict[str, Dict[str, Any]]) -> None:
+        tmp_file = f"{self.state_file}.tmp"
+        try:
+            with open(tmp_file, 'w') as f:
+                json.dump(state, f, indent=2)
+            os.replace(tmp_file, self.state_file)
+        except Exception as e:
+            logger.error(f"Error saving schedule state: {e}")
+
+    def _initial_change_rate(self) -> float:
+        """Change rate that maps onto the default interval."""
+        span = self.max_interval_hours - self.min_interval_hours
+        if span <= 0:
+            return 0.0
+        return (self.max_interval_hours - self.default_interval_hours) / span
+
+    def interval_hours(self, source: str, now: Optional[datetime] = None) -> float:
+        """Current crawl interval for a source, in hours."""
+        now = now or datetime.now()
+        entry = self._load().get(source)
+        change_rate = entry["change_rate"] if entry else self._initial_change_rate()
+
+        interval = self.max_interval_hours - (self.max_interval_hours - self.min_interval_hours) * change_rate
+        if now.month in RACE_SEASON_MONTHS:
+            interval *= self.season_factor
+        return max(self.min_interval_hours, min(self.max_interval_hours, interval))
+
+    def cache_ttl_hours(self, source: str) -> float:
+        """Cached events stay valid until the source is next due."""
+        return self.interval_hours(source)
+
+    def is_due(self, source: str, now: Optional[datetime] = None) -> bool:
+        """Check whether a source should be crawled now"""
+        now = now or datetime.now()
+        entry = self._load().get(source)
+        if not entry or not entry.get("last_scraped"):
+            return True
+        last_scraped = datetime.fromisoformat(entry["last_scraped"])
+        return now - last_scraped >= timedelta(hours=self.interval_hours(source, now))
+
+    def due_sources(self, sources: List[str], now: Optional[datetime] = None) -> List[str]:
+        return [source for source in sources if self.is_due(source, now)]
+
+    def record_run(self, source: str, total_events: int, changed_events: int, now: Optional[datetime] = None) -> float:
+        """
+        Record the outcome of a crawl and return the new interval in hours.
+        """
+        now = now or datetime.now()
+        state = self._load()
+        entry = state.get(source, {
+            "change_rate": self._initial_change_rate(),
+            "runs": 0,
+        })
+
+        observed = 1.0 if changed_events > 0 else 0.0
+        entry["change_rate"] = (1 - self.smoothing) * entry["change_rate"] + self.smoothing * observed
+        entry["runs"] = entry.get("runs", 0) + 1
+        entry["last_scraped"] = now.isoformat()
+        entry["last_total"] = total_events
+        entry["last_changed"] = changed_events
+        state[source] = entry
+        self._save(state)
+
+        interval = self.interval_hours(source, now)
+        logger.info(
+            f"{source}: {changed_events}/{total_events} events new or changed, "
+            f"change rate {entry['change_rate']:.2f}, next crawl in {interval:.1f} hours."
+        )
+        return interval
+
+    def get_state(self) -> Dict[str, Dict[str, Any]]:
+        """Current per-source schedule, including the derived interval"""
+        state = self._load()
+        for source, entry in state.items():
+            entry["interval_hours"] = round(self.interval_hours(source), 2)
+        return state
+
+    def reset(self, source: str = None) -> None:
+        """Forget observations for a specific source or all sources"""
+        if source:
+            state = self._load()
+            state.pop(source, None)
+            self._save(state)
+        elif os.path.exists(self.state_file):
+            os.remove(self.state_file)
@@ -0,0 +1,113 @@
+"""
+Cross-process cache invalidation over Postgres LISTEN/NOTIFY.
+
+Writers call publish() inside their transaction; Postgres delivers the
+notification to every listening connection only if and when that
+transaction commits. Each API worker runs one CacheBusListener thread on a
+dedicated connection, drops the matching response_cache entries and
+forwards the change to live SSE clients (app.core.live_updates). Scraper
+processes only publish.
+"""
+import select
+import threading
+from typing import Optional
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+from app.core.logging_config import get_logger, SAMPLED
+from app.core.response_cache import response_cache
+from app.core.live_updates import live_hub
+
+logger = get_logger(__name__)
+
+CHANNEL = "runzaar_cache"
+EVENTS = "events"
+CLUBS = "clubs"
+
+
+def publish(db: Session, *topics: str) -> None:
+    """Announce that `topics` change when `db`'s current transaction commits."""
+    db.execute(text("SELECT pg_notify(:channel, :payload)"), {"channel": CHANNEL, "payload": ",".join(sorted(set(topics)))})
+
+
+class CacheBusListener(threading.Thread):
+    """
+    LISTENs on CHANNEL and invalidates the local response cache. The cache is
+    enabled only while listening; after a disconnect it is cleared (missed
+    notifications can't be replayed) and the listener reconnects with backoff.
+    """
+
+    def __init__(self, poll_seconds: float = 5.0):
+        super().__init__(name="cache-bus", daemon=True)
+        self.poll_seconds = poll_seconds
+        self._stop_event = threading.Event()
+
+    def stop(self) -> None:
+        self._stop_event.set()
+
+    def _connect(self):
+        from app.db.base import get_engine
+        engine = get_engine()
+        if engine.dialect.driver != "psycopg2":
+            return None
+        cargs, cparams = engine.dialect.create_connect_args(engine.url)
+        conn = engine.dialect.connect(*cargs, **cparams)
+        conn.autocommit = True
+        with conn.cursor() as cursor:
+            cursor.execute(f"LISTEN {CHANNEL}")
+        return conn
+
+    def run(self) -> None:
+        backoff = 1.0
+        while not self._stop_event.is_set():
+            conn = None
+            try:
+                conn = self._connect()
+                if conn is None:
+                    logger.warning("Cache bus needs a psycopg2 Postgres connection; response cache stays off.")
+                    return
+                response_cache.invalidate()
+                response_cache.enabled = True
+                # Changes may have been missed while disconnected
+                live_hub.resync()
+                logger.info(f"Listening for cache invalidations on '{CHANNEL}'.")
+                backoff = 1.0
+                while not self._stop_event.is_set():
+                    if select.select([conn], [], [], self.poll_seconds)[0]:
+                        conn.poll()
+                        while conn.notifies:
+                            topics = [t for t in conn.notifies.pop(0).payload.split(",") if t]
+                            dropped = response_cache.invalidate(topics or None)
+                            if topics:
+                                live_hub.publish(topics)
+                            else:
+                                live_hub.resync()
+                            logger.info("Invalidated %s cached responses for %s", dropped, topics, extra=SAMPLED)
+            except Exception as e:
+                logger.warning(f"Cache bus connection lost ({e}); retrying in {backoff:.0f}s.")
+            finally:
+                response_cache.enabled = False
+                response_cache.invalidate()
+                if conn is not None:
+                    try:
+                        conn.close()
+                    except Exception:
+                        pass
+            self._stop_event.wait(backoff)
+            backoff = min(backoff * 2, 60.0)
+
+
+_listener: Optional[CacheBusListener] = None
+
+
+def start_listener() -> None:
+    global _listener
+    if _listener is None or not _listener.is_alive():
+        _listener = CacheBusListener()
+        _listener.start()
+
+
+def stop_listener() -> None:
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
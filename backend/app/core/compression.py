@@ -0,0 +1,149 @@
+"""
+Response compression: Accept-Encoding negotiation, one-shot compression for
+cached payloads (app.core.response_cache) and a streaming middleware for
+everything else.
+
+gzip is always available; brotli is used when the `brotli` package is
+installed and the client accepts it.
+"""
+import os
+import zlib
+from typing import Dict, Optional, Tuple
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# Responses smaller than this go out uncompressed; headers and framing would eat the saving
+COMPRESSION_MIN_BYTES = int(os.getenv("COMPRESSION_MIN_BYTES", "1024"))
+
+# Preference order when the client accepts several equally
+ENCODINGS: Tuple[str, ...] = ("br", "gzip") if brotli is not None else ("gzip",)
+
+COMPRESSIBLE_TYPES = ("application/json", "application/x-ndjson", "text/", "application/javascript", "image/svg+xml")
+
+# Cached payloads are compressed once per data version, so spend more CPU on them
+# than on a per-request stream
+STATIC_LEVELS = {"gzip": 9, "br": 9}
+STREAM_LEVELS = {"gzip": 6, "br": 4}
+
+
+def negotiate(accept_encoding: Optional[str]) -> Optional[str]:
+    """The best encoding we support that `accept_encoding` allows, or None for identity."""
+    if not accept_encoding:
+        return None
+    weights: Dict[str, float] = {}
+    for part in accept_encoding.split(","):
+        coding, _, params = part.strip().partition(";")
+        weight = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                weight = float(params[2:])
+            except ValueError:
+                weight = 0.0
+        weights[coding.strip().lower()] = weight
+    best, best_weight = None, 0.0
+    for encoding in ENCODINGS:
+        weight = weights.get(encoding, weights.get("*", 0.0))
+        if weight > best_weight:
+            best, best_weight = encoding, weight
+    return best
+
+
+def compress(body: bytes, encoding: str) -> bytes:
+    """Compress a complete body in one go."""
+    if encoding == "br":
+        return brotli.compress(body, quality=STATIC_LEVELS["br"])
+    compressor = zlib.compressobj(STATIC_LEVELS["gzip"], zlib.DEFLATED, 31)  # wbits 31: gzip container
+    return compressor.compress(body) + compressor.flush()
+
+
+def is_compressible(content_type: str) -> bool:
+    return content_type.startswith(COMPRESSIBLE_TYPES) and not content_type.startswith("text/event-stream")
+
+
+class _StreamEncoder:
+    def __init__(self, encoding: str):
+        if encoding == "br":
+            self._compressor = brotli.Compressor(quality=STREAM_LEVELS["br"])
+            self.process, self._finish = self._compressor.process, self._compressor.finish
+        else:
+            self._compressor = zlib.compressobj(STREAM_LEVELS["gzip"], zlib.DEFLATED, 31)
+            self.process, self._finish = self._compressor.compress, self._compressor.flush
+
+    def finish(self) -> bytes:
+        return self._finish()
+
+
+class CompressionMiddleware:
+    """
+    Compresses responses of at least `minimum_size` bytes as they stream.
+    Responses that already carry a Content-Encoding (pre-compressed cache
+    hits) and non-text media types pass through untouched.
+    """
+
+    def __init__(self, app: ASGIApp, minimum_size: int = COMPRESSION_MIN_BYTES):
+        self.app = app
+        self.minimum_size = minimum_size
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        encoding = negotiate(Headers(scope=scope).get("accept-encoding"))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start: Optional[Message] = None
+        encoder: Optional[_StreamEncoder] = None
+        passthrough = False
+
+        async def send_compressed(message: Message) -> None:
+            nonlocal start, encoder, passthrough
+            if message["type"] == "http.response.start":
+                headers = Headers(raw=message["headers"])
+                passthrough = "content-encoding" in headers or not is_compressible(headers.get("content-type", ""))
+                if passthrough:
+                    await send(message)
+                else:
+                    # Held back until the first body chunk shows whether compression pays
+                    start = message
+                return
+            if passthrough or message["type"] != "http.response.body":
+                await send(message)
+                return
+
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+            if start is not None:
+                headers = MutableHeaders(raw=start["headers"])
+                headers.add_vary_header("Accept-Encoding")
+                if len(body) < self.minimum_size and not more_body:
+                    passthrough = True
+                    await send(start)
+                    await send(message)
+                    return
+                encoder = _StreamEncoder(encoding)
+                headers["Content-Encoding"] = encoding
+                chunk = encoder.process(body)
+                if more_body:
+                    del headers["Content-Length"]
+                else:
+                    chunk += encoder.finish()
+                    headers["Content-Length"] = str(len(chunk))
+                await send(start)
+                start = None
+                await send({"type": "http.response.body", "body": chunk, "more_body": more_body})
+                return
+
+            chunk = encoder.process(body)
+            if not more_body:
+                chunk += encoder.finish()
+            await send({"type": "http.response.body", "body": chunk, "more_body": more_body})
+
+        await self.app(scope, receive, send_compressed)
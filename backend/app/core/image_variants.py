@@ -0,0 +1,80 @@
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Optional, Tuple
+from io import BytesIO
+import asyncio
+import os
+from app.core.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# Longest edge in pixels for each variant served to the frontend
+VARIANT_SIZES = {
+    "thumb": 320,
+    "display": 1280,
+}
+
+# Encoder settings per output format; AVIF is skipped if Pillow was built without it
+FORMAT_OPTIONS = {
+    "webp": {"format": "WEBP", "quality": 80, "method": 4},
+    "avif": {"format": "AVIF", "quality": 55, "speed": 8},
+}
+
+CONTENT_TYPES = {
+    "webp": "image/webp",
+    "avif": "image/avif",
+}
+
+_executor: Optional[ProcessPoolExecutor] = None
+
+
+def _get_executor() -> ProcessPoolExecutor:
+    """Lazily create the worker pool used for CPU-bound re-encoding."""
+    global _executor
+    if _executor is None:
+        max_workers = int(os.getenv("IMAGE_WORKERS", max(1, (os.cpu_count() or 2) // 2)))
+        _executor = ProcessPoolExecutor(max_workers=max_workers)
+        logger.info(f"Image processing pool started with {max_workers} workers.")
+    return _executor
+
+
+def variant_path(file_path: str, variant: str, fmt: str) -> str:
+    """events/2025-01-01/Run_1.jpeg -> events/2025-01-01/Run_1_thumb.webp"""
+    stem, _ = os.path.splitext(file_path)
+    return f"{stem}_{variant}.{fmt}"
+
+
+def render_variants(data: bytes) -> Dict[Tuple[str, str], bytes]:
+    """
+    Decode an uploaded image once and encode every (variant, format) pair.
+    Runs inside the worker pool, so it must stay a picklable module-level function.
+    """
+    from PIL import Image, ImageOps, features
+
+    formats = [fmt for fmt in FORMAT_OPTIONS if features.check(fmt)]
+    with Image.open(BytesIO(data)) as source:
+        image = ImageOps.exif_transpose(source)
+        if image.mode not in ("RGB", "RGBA"):
+            image = image.convert("RGBA" if "transparency" in image.info else "RGB")
+
+        outputs = {}
+        # Largest first so each smaller variant is resized from an already reduced image
+        for variant, size in sorted(VARIANT_SIZES.items(), key=lambda item: -item[1]):
+            image.thumbnail((size, size), Image.LANCZOS)
+            for fmt in formats:
+                buffer = BytesIO()
+                image.save(buffer, **FORMAT_OPTIONS[fmt])
+                outputs[(variant, fmt)] = buffer.getvalue()
+    return outputs
+
+
+async def generate_variants(data: bytes) -> Dict[Tuple[str, str], bytes]:
+    """Re-encode an image into thumbnail/display WebP and AVIF variants off the event loop."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_get_executor(), render_variants, data)
+
+
+def shutdown() -> None:
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
@@ -0,0 +1,48 @@
+"""
+Pick one process on the host to run once-per-instance background jobs.
+
+Under the production profile several workers import the same app, and each
+runs the lifespan. The first worker to take a non-blocking exclusive lock on
+SCHEDULER_LOCK_FILE becomes the leader and keeps the lock until it exits; if
+it dies the OS releases the lock and the next worker to try takes over.
+"""
+import os
+from typing import Optional
+from app.core.logging_config import get_logger
+
+try:
+    import fcntl
+except ImportError:  # Windows dev machines run a single process anyway
+    fcntl = None
+
+logger = get_logger(__name__)
+
+LOCK_FILE = os.getenv("SCHEDULER_LOCK_FILE", "/tmp/runzaar-scheduler.lock")
+
+_lock_fd: Optional[int] = None
+
+
+def is_leader() -> bool:
+    """True if this process holds (or just acquired) the leader lock."""
+    global _lock_fd
+    if _lock_fd is not None or fcntl is None:
+        return True
+    fd = os.open(LOCK_FILE, os.O_CREAT | os.O_RDWR, 0o644)
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        os.close(fd)
+        return False
+    _lock_fd = fd
+    logger.info(f"Process {os.getpid()} is now the leader for background jobs.")
+    return True
+
+
+def _reset_after_fork() -> None:
+    # flock locks are shared with the parent's open file; a forked child must take its own
+    global _lock_fd
+    _lock_fd = None
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
@@ -0,0 +1,98 @@
+"""
+Server-Sent Events fan-out for data changes (/api/events/live).
+
+Each API worker keeps one LiveHub. The cache bus listener thread
+(app.core.cache_bus) hands it every committed change notification, and the
+hub copies a compact SSE message into each connected client's bounded
+queue. A client that falls behind does not hold up the others: when its
+queue is full, the backlog is replaced by a single "resync" message telling
+it to refetch. Connections per worker are capped at LIVE_MAX_CLIENTS.
+"""
+import asyncio
+import json
+import os
+from typing import Iterable, Optional, Set
+from app.core.logging_config import get_logger, SAMPLED
+
+logger = get_logger(__name__)
+
+LIVE_MAX_CLIENTS = int(os.getenv("LIVE_MAX_CLIENTS", "500"))
+LIVE_QUEUE_SIZE = int(os.getenv("LIVE_QUEUE_SIZE", "16"))
+# Comment lines keep idle connections open through proxies and reveal dead clients
+LIVE_HEARTBEAT_SECONDS = float(os.getenv("LIVE_HEARTBEAT_SECONDS", "15"))
+
+
+def sse_message(event: str, data: dict) -> str:
+    return f"event: {event}\ndata: {json.dumps(data, separators=(',', ':'))}\n\n"
+
+
+RESYNC = sse_message("resync", {})
+
+
+class LiveHub:
+    def __init__(self, max_clients: int = LIVE_MAX_CLIENTS, queue_size: int = LIVE_QUEUE_SIZE):
+        self.max_clients = max_clients
+        self.queue_size = queue_size
+        self._clients: Set[asyncio.Queue] = set()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    @property
+    def full(self) -> bool:
+        return len(self._clients) >= self.max_clients
+
+    @property
+    def client_count(self) -> int:
+        return len(self._clients)
+
+    def subscribe(self) -> Optional[asyncio.Queue]:
+        """A queue of SSE messages for a new client, or None when at capacity. Call on the event loop."""
+        if self.full:
+            return None
+        self._loop = asyncio.get_running_loop()
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        self._clients.add(queue)
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue) -> None:
+        self._clients.discard(queue)
+
+    def publish(self, topics: Iterable[str]) -> None:
+        """Announce changed topics to every client. Safe to call from any thread."""
+        self._send_threadsafe(sse_message("change", {"topics": sorted(topics)}))
+
+    def resync(self) -> None:
+        """Tell every client to refetch, e.g. after notifications may have been missed."""
+        self._send_threadsafe(RESYNC)
+
+    def _send_threadsafe(self, message: str) -> None:
+        loop = self._loop
+        if loop is None or not self._clients or loop.is_closed():
+            return
+        loop.call_soon_threadsafe(self._fan_out, message)
+
+    def _fan_out(self, message: str) -> None:
+        for queue in list(self._clients):
+            try:
+                queue.put_nowait(message)
+            except asyncio.QueueFull:
+                # Slow client: anything queued is superseded by one full refetch
+                while not queue.empty():
+                    queue.get_nowait()
+                queue.put_nowait(RESYNC)
+                logger.info("Live client fell behind; sent resync", extra=SAMPLED)
+
+
+live_hub = LiveHub()
+
+
+async def event_stream(queue: asyncio.Queue):
+    """SSE body for one subscribed client; unsubscribes when the client goes away."""
+    try:
+        yield "retry: 5000\n\n"
+        while True:
+            try:
+                yield await asyncio.wait_for(queue.get(), LIVE_HEARTBEAT_SECONDS)
+            except asyncio.TimeoutError:
+                yield ": ping\n\n"
+    finally:
+        live_hub.unsubscribe(queue)
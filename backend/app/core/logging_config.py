@@ -1,30 +1,166 @@
+import atexit
+import json
 import logging
-import sys
 import os
-from logging.handlers import TimedRotatingFileHandler
+import queue
+import random
+import sys
+import threading
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener, TimedRotatingFileHandler
+from typing import Dict, Optional
 
-LOG_FILE = "app/cache/app.log"
-os.makedirs(os.path.dirname(LOG_FILE), exist_ok=True)
+LOG_FILE = os.getenv("LOG_FILE", "app/cache/app.log")
+LOG_FORMAT = os.getenv("LOG_FORMAT", "json")  # "json" or "text"
+LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
+# Per-module overrides by logger name prefix, e.g. "app.scrapers=DEBUG,app.api.routes=WARNING"
+LOG_LEVELS = os.getenv("LOG_LEVELS", "")
+# Share of sampled (per-request / per-event) debug and info lines that are kept
+LOG_SAMPLE_RATE = float(os.getenv("LOG_SAMPLE_RATE", "0.05"))
 
 FORMATTER = logging.Formatter("%(asctime)s - %(filename)s - %(message)s")
 
+# Pass as `extra=SAMPLED` on high-volume lines so only LOG_SAMPLE_RATE of them are emitted
+SAMPLED = {"sampled": True}
+
+_RESERVED_ATTRS = set(vars(logging.makeLogRecord({}))) | {"message", "asctime", "sampled"}
+
+_queue_handler: Optional[QueueHandler] = None
+_listener: Optional[QueueListener] = None
+_lock = threading.Lock()
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per line; `extra` fields are included as top-level keys."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        payload = {
+            "ts": datetime.fromtimestamp(record.created, tz=timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "module": record.filename,
+            "line": record.lineno,
+        }
+        for key, value in record.__dict__.items():
+            if key not in _RESERVED_ATTRS and not key.startswith("_"):
+                payload[key] = value
+        if record.exc_info:
+            payload["exc_info"] = self.formatException(record.exc_info)
+        return json.dumps(payload, default=str)
+
+
+class SamplingFilter(logging.Filter):
+    """Keep only `rate` of records marked sampled; warnings and errors always pass."""
+
+    def __init__(self, rate: float):
+        super().__init__()
+        self.rate = rate
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if getattr(record, "sampled", False) and record.levelno < logging.WARNING:
+            return random.random() < self.rate
+        return True
+
+
+class _InProcessQueueHandler(QueueHandler):
+    """
+    The listener runs in the same process, so records don't need to be
+    pickle-safe: only merge the message args and leave formatting (and
+    traceback rendering) to the listener thread.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        if record.args:
+            record.msg = record.getMessage()
+            record.args = None
+        return record
+
+
+def _parse_levels(spec: str) -> Dict[str, int]:
+    levels = {}
+    for item in spec.split(","):
+        if "=" in item:
+            name, level = item.split("=", 1)
+            levels[name.strip()] = logging.getLevelName(level.strip().upper())
+    return levels
+
+
+MODULE_LEVELS = _parse_levels(LOG_LEVELS)
+
+
+def level_for(logger_name: str) -> int:
+    """Most specific LOG_LEVELS prefix match for a logger, falling back to LOG_LEVEL."""
+    best = None
+    for prefix in MODULE_LEVELS:
+        if logger_name == prefix or logger_name.startswith(prefix + "."):
+            if best is None or len(prefix) > len(best):
+                best = prefix
+    return MODULE_LEVELS[best] if best else logging.getLevelName(LOG_LEVEL.upper())
+
+
 def get_console_handler():
     console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setFormatter(FORMATTER)
+    console_handler.setFormatter(JsonFormatter() if LOG_FORMAT == "json" else FORMATTER)
     return console_handler
 
+
+class _LazyFileHandler(TimedRotatingFileHandler):
+    """Creates the log directory and opens the file on the first record, not at import."""
+
+    def _open(self):
+        os.makedirs(os.path.dirname(self.baseFilename), exist_ok=True)
+        return super()._open()
+
+
 def get_file_handler():
-    file_handler = TimedRotatingFileHandler(LOG_FILE, when='midnight')
-    file_handler.setFormatter(FORMATTER)
+    file_handler = _LazyFileHandler(LOG_FILE, when='midnight', delay=True)
+    file_handler.setFormatter(JsonFormatter() if LOG_FORMAT == "json" else FORMATTER)
     return file_handler
 
+
+def _start_pipeline() -> QueueHandler:
+    """Create the shared queue handler and start the listener thread that does the I/O."""
+    global _queue_handler, _listener
+    with _lock:
+        if _queue_handler is None:
+            log_queue = queue.SimpleQueue()
+            _queue_handler = _InProcessQueueHandler(log_queue)
+            _queue_handler.addFilter(SamplingFilter(LOG_SAMPLE_RATE))
+            _listener = QueueListener(log_queue, get_console_handler(), get_file_handler(), respect_handler_level=True)
+            _listener.start()
+            atexit.register(stop_logging)
+    return _queue_handler
+
+
+def stop_logging() -> None:
+    """Flush queued records and stop the listener thread."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+def _restart_after_fork() -> None:
+    # The listener thread does not survive fork(); give the child its own. Only the
+    # parent writes LOG_FILE: forked workers (gunicorn) each rotating the same file
+    # at midnight would race and lose lines, so they log to stdout alone.
+    global _listener
+    if _queue_handler is not None:
+        _listener = QueueListener(_queue_handler.queue, get_console_handler(), respect_handler_level=True)
+        _listener.start()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_restart_after_fork)
+
+
 def get_logger(logger_name="my_app"):
     logger = logging.getLogger(logger_name)
-    logger.setLevel(logging.DEBUG)
+    logger.setLevel(level_for(logger_name))
 
     if not logger.handlers:  # ensure we don't add multiple handlers
-        logger.addHandler(get_console_handler())
-        logger.addHandler(get_file_handler())
+        logger.addHandler(_start_pipeline())
 
     logger.propagate = False
     return logger
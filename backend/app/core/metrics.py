@@ -0,0 +1,134 @@
+import os
+import time
+from typing import Optional
+from prometheus_client import CONTENT_TYPE_LATEST, CollectorRegistry, Counter, Histogram, generate_latest, multiprocess
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+# API
+HTTP_REQUEST_SECONDS = Histogram(
+    "http_request_duration_seconds",
+    "Request latency by route template",
+    ["method", "route", "status"],
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10),
+)
+
+# Database
+DB_QUERIES = Counter("db_queries_total", "SQL statements executed", ["operation"])
+DB_QUERY_SECONDS = Histogram(
+    "db_query_duration_seconds",
+    "SQL statement execution time",
+    ["operation"],
+    buckets=(0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5),
+)
+
+# Scrapers, labelled by ScraperManager.source_name
+SCRAPE_PAGES = Counter("scrape_pages_fetched_total", "Upstream responses received", ["source"])
+SCRAPE_BYTES = Counter("scrape_bytes_total", "Upstream response body bytes", ["source"])
+SCRAPE_PARSE_SECONDS = Histogram(
+    "scrape_parse_duration_seconds",
+    "Time spent parsing HTML/JSON responses",
+    ["source"],
+    buckets=(0.001, 0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5),
+)
+SCRAPE_RETRIES = Counter("scrape_retries_total", "Upstream requests retried after a transient error", ["source"])
+SCRAPE_EVENTS = Counter("scrape_events_total", "Events yielded by a scrape", ["source"])
+SCRAPE_REJECTS = Counter("scrape_events_rejected_total", "Scraped events dropped by ingest validation", ["source", "reason"])
+SCRAPE_FAILURES = Counter("scrape_failures_total", "Scrapes that failed or were skipped by an open circuit", ["source"])
+# Hit ratio: rate(scrape_cache_lookups_total{result="hit"}) / rate(scrape_cache_lookups_total)
+SCRAPE_CACHE_LOOKUPS = Counter("scrape_cache_lookups_total", "Source cache lookups", ["source", "result"])
+SCRAPE_SECONDS = Histogram(
+    "scrape_duration_seconds",
+    "Wall time of a full scrape of one source",
+    ["source"],
+    buckets=(1, 5, 10, 30, 60, 120, 300, 600),
+)
+
+# SmartScraper pipeline
+SMART_SCRAPER_STAGE_SECONDS = Histogram(
+    "smart_scraper_stage_duration_seconds",
+    "SmartScraper time per stage",
+    ["stage"],
+    buckets=(0.01, 0.05, 0.1, 0.5, 1, 5, 10, 30, 60, 300),
+)
+
+
+def render_latest():
+    """
+    Metrics in the Prometheus text exposition format, with their content type.
+    Under multiple workers (PROMETHEUS_MULTIPROC_DIR set, see gunicorn.conf.py)
+    every worker's samples are aggregated, whichever worker serves the scrape.
+    """
+    if os.getenv("PROMETHEUS_MULTIPROC_DIR"):
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        return generate_latest(registry), CONTENT_TYPE_LATEST
+    return generate_latest(), CONTENT_TYPE_LATEST
+
+
+def _operation(statement: str) -> str:
+    verb = statement.lstrip().split(None, 1)[0].upper() if statement.strip() else ""
+    return verb if verb in ("SELECT", "INSERT", "UPDATE", "DELETE") else "OTHER"
+
+
+def instrument_engine(engine: Engine) -> None:
+    """Count and time every statement the engine executes."""
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_start", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after(conn, cursor, statement, parameters, context, executemany):
+        elapsed = time.perf_counter() - conn.info["query_start"].pop()
+        operation = _operation(statement)
+        DB_QUERIES.labels(operation).inc()
+        DB_QUERY_SECONDS.labels(operation).observe(elapsed)
+
+    @event.listens_for(engine, "handle_error")
+    def _error(context):
+        # Keep the start-time stack balanced when a statement fails
+        starts = context.connection.info.get("query_start") if context.connection is not None else None
+        if starts:
+            starts.pop()
+
+
+class PrometheusMiddleware:
+    """
+    ASGI middleware recording request latency per route template
+    ("/api/events/{event_id}", not the raw path) to keep label cardinality bounded.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status: Optional[int] = None
+        stream_started: Optional[float] = None
+
+        async def send_wrapper(message):
+            nonlocal status, stream_started
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                # Live SSE streams stay open for minutes; time them to the response start
+                if any(k == b"content-type" and v.startswith(b"text/event-stream") for k, v in message["headers"]):
+                    stream_started = time.perf_counter()
+            await send(message)
+
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        except Exception:
+            status = 500
+            raise
+        finally:
+            route = scope.get("route")
+            HTTP_REQUEST_SECONDS.labels(
+                scope["method"],
+                route.path if route is not None else "unmatched",
+                str(status or 500),
+            ).observe((stream_started or time.perf_counter()) - start)
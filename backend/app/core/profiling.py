@@ -0,0 +1,229 @@
+import json
+import os
+import re
+import sys
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from app.core.config import settings
+from app.core.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# Queries of the profile running in the current context (None when not profiling)
+_query_log: ContextVar[Optional[List[Dict[str, Any]]]] = ContextVar("profile_query_log", default=None)
+
+
+def profile_dir() -> str:
+    if settings.PROFILE_DIR:
+        return settings.PROFILE_DIR
+    # Next to the scraper cache, at backend/cache/profiles
+    return os.path.join(Path(__file__).parent.parent.parent, "cache", "profiles")
+
+
+class SamplingProfiler:
+    """
+    Samples the call stack of one thread every `interval` seconds from a
+    background thread and counts identical stacks. Async endpoints and
+    scrapes run on the event loop thread, so samples also include any other
+    coroutine that happened to be running at the time.
+    """
+
+    def __init__(self, thread_id: Optional[int] = None, interval: float = 0.005):
+        self.thread_id = thread_id or threading.get_ident()
+        self.interval = interval
+        self.samples: Counter = Counter()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        self._thread = threading.Thread(target=self._run, name="sampling-profiler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is not None:
+                self.samples[self._stack(frame)] += 1
+
+    @staticmethod
+    def _stack(frame) -> str:
+        frames = []
+        while frame is not None:
+            code = frame.f_code
+            frames.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{frame.f_lineno})")
+            frame = frame.f_back
+        return ";".join(reversed(frames))
+
+    def collapsed(self) -> str:
+        """Folded stacks ("root;child;leaf count"), readable by flamegraph.pl, speedscope and inferno."""
+        return "".join(f"{stack} {count}\n" for stack, count in self.samples.most_common())
+
+
+class ProfilerControl:
+    """What the admin has armed: the next N matching requests and/or the next scrape run."""
+
+    def __init__(self):
+        self.requests_remaining = 0
+        self.path_prefix = "/api/"
+        self.scrape_armed = False
+        self._active = False
+        self._lock = threading.Lock()
+
+    def arm_requests(self, count: int, path_prefix: str = "/api/") -> None:
+        with self._lock:
+            self.requests_remaining = count
+            self.path_prefix = path_prefix
+
+    def arm_scrape(self) -> None:
+        with self._lock:
+            self.scrape_armed = True
+
+    def disarm(self) -> None:
+        with self._lock:
+            self.requests_remaining = 0
+            self.scrape_armed = False
+
+    def claim_request(self, path: str) -> bool:
+        """Take one armed request slot; only one profile runs at a time."""
+        with self._lock:
+            if self._active or self.requests_remaining <= 0 or not path.startswith(self.path_prefix):
+                return False
+            self.requests_remaining -= 1
+            self._active = True
+            return True
+
+    def claim_scrape(self) -> bool:
+        with self._lock:
+            if self._active or not self.scrape_armed:
+                return False
+            self.scrape_armed = False
+            self._active = True
+            return True
+
+    def release(self) -> None:
+        with self._lock:
+            self._active = False
+
+    def status(self) -> Dict[str, Any]:
+        return {
+            "requests_remaining": self.requests_remaining,
+            "path_prefix": self.path_prefix,
+            "scrape_armed": self.scrape_armed,
+            "active": self._active,
+        }
+
+
+control = ProfilerControl()
+
+
+def _write_profile(name: str, profiler: SamplingProfiler, queries: List[Dict[str, Any]], elapsed: float) -> str:
+    directory = profile_dir()
+    os.makedirs(directory, exist_ok=True)
+    slug = re.sub(r"[^A-Za-z0-9_.-]+", "_", name).strip("_")[:80]
+    base = os.path.join(directory, f"{datetime.now().strftime('%Y%m%d-%H%M%S-%f')}-{slug}")
+
+    with open(f"{base}.collapsed", "w") as f:
+        f.write(profiler.collapsed())
+
+    by_statement: Dict[str, Dict[str, float]] = {}
+    for query in queries:
+        summary = by_statement.setdefault(query["statement"], {"count": 0, "total_ms": 0.0})
+        summary["count"] += 1
+        summary["total_ms"] += query["duration_ms"]
+    with open(f"{base}.queries.json", "w") as f:
+        json.dump({
+            "name": name,
+            "elapsed_ms": round(elapsed * 1000, 3),
+            "samples": sum(profiler.samples.values()),
+            "query_count": len(queries),
+            "query_total_ms": round(sum(q["duration_ms"] for q in queries), 3),
+            "by_statement": sorted(
+                ({"statement": s, **v} for s, v in by_statement.items()),
+                key=lambda item: -item["total_ms"],
+            ),
+            "queries": queries,
+        }, f, indent=2)
+    return base
+
+
+@contextmanager
+def profile(name: str):
+    """Sample the current thread and log DB queries until the block exits, then write both to PROFILE_DIR."""
+    profiler = SamplingProfiler(interval=settings.PROFILE_INTERVAL_MS / 1000)
+    queries: List[Dict[str, Any]] = []
+    token = _query_log.set(queries)
+    start = time.perf_counter()
+    profiler.start()
+    try:
+        yield
+    finally:
+        profiler.stop()
+        _query_log.reset(token)
+        try:
+            base = _write_profile(name, profiler, queries, time.perf_counter() - start)
+            logger.info(f"Profile for {name} written to {base}.collapsed")
+        except OSError as e:
+            logger.error(f"Failed to write profile for {name}: {e}")
+
+
+def attach_query_log(engine: Engine) -> None:
+    """Record statements and timings into the active profile, if any."""
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before(conn, cursor, statement, parameters, context, executemany):
+        if _query_log.get() is not None:
+            context._profile_start = time.perf_counter()
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after(conn, cursor, statement, parameters, context, executemany):
+        queries = _query_log.get()
+        start = getattr(context, "_profile_start", None)
+        if queries is not None and start is not None:
+            queries.append({
+                "statement": statement,
+                "duration_ms": round((time.perf_counter() - start) * 1000, 3),
+                "rows": cursor.rowcount,
+            })
+
+
+class ProfilingMiddleware:
+    """ASGI middleware that profiles requests while `control` has armed slots left."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not control.claim_request(scope["path"]):
+            await self.app(scope, receive, send)
+            return
+        try:
+            with profile(f"{scope['method']} {scope['path']}"):
+                await self.app(scope, receive, send)
+        finally:
+            control.release()
+
+
+@contextmanager
+def profile_scrape_if_armed(name: str):
+    """Profile the enclosed scrape run if one has been armed, otherwise do nothing."""
+    if not control.claim_scrape():
+        yield
+        return
+    try:
+        with profile(name):
+            yield
+    finally:
+        control.release()
@@ -0,0 +1,122 @@
+"""
+Per-worker cache of serialized API responses.
+
+Entries are tagged with topics ("events", "clubs"). Writers publish the
+topics they change on a Postgres channel (app.core.cache_bus), and every
+worker drops the tagged entries when the notification arrives, so entries
+can live long without going stale. The cache only serves while this worker's
+listener is connected; without it, a write in another process could go
+unnoticed.
+
+Each entry keeps the identity body plus its compressed variants, made once
+when the entry is filled, so hits are served in the client's preferred
+Accept-Encoding without compressing per request.
+"""
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, Iterable, Optional, Tuple
+from fastapi import Request, Response
+from app.core.compression import COMPRESSION_MIN_BYTES, ENCODINGS, compress, negotiate
+from app.core.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# Safety net only; invalidation normally comes from the cache bus
+RESPONSE_CACHE_TTL_SECONDS = float(os.getenv("RESPONSE_CACHE_TTL_SECONDS", "3600"))
+RESPONSE_CACHE_MAX_ENTRIES = int(os.getenv("RESPONSE_CACHE_MAX_ENTRIES", "512"))
+
+# Body per content coding; "identity" is always present
+Variants = Dict[str, bytes]
+Entry = Tuple[float, Tuple[str, ...], Variants]
+
+
+class ResponseCache:
+    def __init__(self, max_entries: int = RESPONSE_CACHE_MAX_ENTRIES, ttl_seconds: float = RESPONSE_CACHE_TTL_SECONDS):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.enabled = False  # set by the cache bus listener while it is connected
+        self._entries: "OrderedDict[str, Entry]" = OrderedDict()
+        # Bumped on every invalidation so a fill that raced with a write is discarded
+        self._generations: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def generation(self, topics: Iterable[str]) -> Tuple[int, ...]:
+        with self._lock:
+            return tuple(self._generations.get(topic, 0) for topic in topics)
+
+    def get(self, key: str) -> Optional[Variants]:
+        if not self.enabled:
+            return None
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry[2]
+
+    def set(self, key: str, variants: Variants, topics: Tuple[str, ...], generation: Tuple[int, ...]) -> None:
+        with self._lock:
+            if not self.enabled or tuple(self._generations.get(t, 0) for t in topics) != generation:
+                return
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, topics, variants)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, topics: Optional[Iterable[str]] = None) -> int:
+        """Drop entries tagged with any of `topics`, or everything. Returns entries dropped."""
+        with self._lock:
+            if topics is None:
+                # Every entry is also tagged "*" (see cached_json)
+                dropped = len(self._entries)
+                self._entries.clear()
+                self._generations["*"] = self._generations.get("*", 0) + 1
+                return dropped
+            topics = set(topics)
+            for topic in topics:
+                self._generations[topic] = self._generations.get(topic, 0) + 1
+            stale = [key for key, (_, tags, _) in self._entries.items() if topics.intersection(tags)]
+            for key in stale:
+                del self._entries[key]
+            return len(stale)
+
+
+response_cache = ResponseCache()
+
+
+def encode_variants(body: bytes) -> Variants:
+    """The identity body plus every supported compressed variant worth sending."""
+    variants = {"identity": body}
+    if len(body) >= COMPRESSION_MIN_BYTES:
+        for encoding in ENCODINGS:
+            variants[encoding] = compress(body, encoding)
+    return variants
+
+
+def cached_json(request: Request, key: str, topics: Tuple[str, ...], build: Callable[[], bytes]) -> Response:
+    """
+    The JSON body cached under `key`, or build() (serialized JSON bytes),
+    cached if no write to `topics` happened meanwhile. Served in the best
+    encoding the request accepts.
+    """
+    variants = response_cache.get(key)
+    if variants is None:
+        generation = response_cache.generation(topics + ("*",))
+        body = build()
+        if not response_cache.enabled:
+            # Not cacheable right now; the compression middleware handles it per request
+            return Response(content=body, media_type="application/json")
+        variants = encode_variants(body)
+        response_cache.set(key, variants, topics + ("*",), generation)
+    encoding = negotiate(request.headers.get("accept-encoding"))
+    headers = {"Vary": "Accept-Encoding"}
+    if encoding in variants:
+        headers["Content-Encoding"] = encoding
+    else:
+        encoding = "identity"
+    return Response(content=variants[encoding], media_type="application/json", headers=headers)
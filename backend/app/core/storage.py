@@ -0,0 +1,130 @@
+from typing import Any, Dict, Optional
+from functools import lru_cache
+from app.core.config import settings
+from app.core.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# Supabase signed upload URLs have a fixed lifetime set by the storage server;
+# the client can't ask for a shorter one
+SUPABASE_SIGNED_UPLOAD_SECONDS = 2 * 60 * 60
+
+
+class SupabaseStorage:
+    """Image storage backed by Supabase Storage (also works against a local Supabase stack)."""
+
+    def __init__(self):
+        from app.core.supabase_client import SUPABASE_URL, get_supabase
+        self.base_url = SUPABASE_URL
+        self.client = get_supabase()
+
+    def public_url(self, bucket: str, path: str) -> str:
+        return f"{self.base_url}/storage/v1/object/public/{bucket}/{path}"
+
+    def object_url(self, bucket: str, path: str) -> str:
+        return f"{self.base_url}/storage/v1/object/{bucket}/{path}"
+
+    def presign_upload(self, bucket: str, path: str, content_type: str, expires_in: int, max_bytes: int) -> Dict[str, Any]:
+        # Supabase signed upload URLs carry no size condition; the bucket's file size
+        # limit applies, and /complete-upload/ checks the stored object's size.
+        # Nor can they be shortened: the URL stays usable for the server's fixed
+        # lifetime, so expires_in (and with it the upload token, which
+        # /complete-upload/ requires) is what enforces the configured window.
+        signed = self.client.storage.from_(bucket).create_signed_upload_url(path)
+        return {
+            "upload_url": signed["signed_url"],
+            "method": "PUT",
+            "headers": {"Content-Type": content_type, "x-upsert": "true"},
+            "expires_in": min(expires_in, SUPABASE_SIGNED_UPLOAD_SECONDS),
+        }
+
+    def upload(self, bucket: str, path: str, data: bytes, content_type: str) -> Any:
+        return self.client.storage.from_(bucket).upload(path, data, {"content-type": content_type, "upsert": "true"})
+
+    def download(self, bucket: str, path: str) -> bytes:
+        return self.client.storage.from_(bucket).download(path)
+
+    def object_size(self, bucket: str, path: str) -> Optional[int]:
+        """Size of a stored object in bytes, or None if it doesn't exist."""
+        try:
+            info = self.client.storage.from_(bucket).info(path)
+        except Exception:
+            return None
+        size = info.get("size") if isinstance(info, dict) else None
+        return int(size) if size is not None else None
+
+
+class S3Storage:
+    """
+    Image storage on any S3-compatible service (AWS S3, MinIO, LocalStack).
+    Requires boto3, which is not part of requirements.txt.
+    """
+
+    def __init__(self):
+        try:
+            import boto3
+            from botocore.config import Config
+        except ImportError as e:
+            raise RuntimeError("STORAGE_BACKEND=s3 requires boto3: pip install boto3") from e
+
+        self.client = boto3.client(
+            "s3",
+            endpoint_url=settings.STORAGE_ENDPOINT_URL,
+            aws_access_key_id=settings.STORAGE_ACCESS_KEY_ID,
+            aws_secret_access_key=settings.STORAGE_SECRET_ACCESS_KEY,
+            region_name=settings.STORAGE_REGION,
+            config=Config(signature_version="s3v4", s3={"addressing_style": "path"}),
+        )
+        self.public_base_url = (settings.STORAGE_PUBLIC_URL or settings.STORAGE_ENDPOINT_URL or "").rstrip("/")
+
+    def public_url(self, bucket: str, path: str) -> str:
+        return f"{self.public_base_url}/{bucket}/{path}"
+
+    def object_url(self, bucket: str, path: str) -> str:
+        return self.public_url(bucket, path)
+
+    def presign_upload(self, bucket: str, path: str, content_type: str, expires_in: int, max_bytes: int) -> Dict[str, Any]:
+        # A presigned POST, unlike a presigned PUT, lets the policy cap the object size
+        post = self.client.generate_presigned_post(
+            bucket,
+            path,
+            Fields={"Content-Type": content_type},
+            Conditions=[{"Content-Type": content_type}, ["content-length-range", 1, max_bytes]],
+            ExpiresIn=expires_in,
+        )
+        return {
+            "upload_url": post["url"],
+            "method": "POST",
+            "fields": post["fields"],
+            "expires_in": expires_in,
+        }
+
+    def upload(self, bucket: str, path: str, data: bytes, content_type: str) -> Any:
+        return self.client.put_object(Bucket=bucket, Key=path, Body=data, ContentType=content_type)
+
+    def download(self, bucket: str, path: str) -> bytes:
+        return self.client.get_object(Bucket=bucket, Key=path)["Body"].read()
+
+    def object_size(self, bucket: str, path: str) -> Optional[int]:
+        """Size of a stored object in bytes, or None if it doesn't exist."""
+        from botocore.exceptions import ClientError
+        try:
+            return self.client.head_object(Bucket=bucket, Key=path)["ContentLength"]
+        except ClientError:
+            return None
+
+
+STORAGE_BACKENDS = {
+    "supabase": SupabaseStorage,
+    "s3": S3Storage,
+}
+
+
+@lru_cache(maxsize=None)
+def get_storage(backend: Optional[str] = None):
+    """Return the configured storage backend (created once per process)."""
+    backend = (backend or settings.STORAGE_BACKEND).lower()
+    if backend not in STORAGE_BACKENDS:
+        raise ValueError(f"Unknown STORAGE_BACKEND '{backend}'. Choose from {list(STORAGE_BACKENDS)}")
+    logger.info(f"Using {backend} image storage.")
+    return STORAGE_BACKENDS[backend]()
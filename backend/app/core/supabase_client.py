@@ -1,9 +1,12 @@
-from supabase import create_client, Client
-from app.core.config import Settings
+from functools import lru_cache
+from app.core.config import settings
 
-settings = Settings()
-
-SUPABASE_URL = f"https://{settings.SUPABASE_PROJECT_ID}.supabase.co"
+SUPABASE_URL = (settings.SUPABASE_URL or f"https://{settings.SUPABASE_PROJECT_ID}.supabase.co").rstrip("/")
 SUPABASE_KEY = settings.SUPABASE_ANON_KEY
 
-supabase: Client = create_client(SUPABASE_URL, SUPABASE_KEY) 
\ No newline at end of file
+
+@lru_cache(maxsize=None)
+def get_supabase():
+    """The Supabase client, created (and the SDK imported) on first use."""
+    from supabase import create_client
+    return create_client(SUPABASE_URL, SUPABASE_KEY)
@@ -1,12 +1,39 @@
+from functools import lru_cache
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import Session, sessionmaker
 from sqlalchemy import create_engine
+from sqlalchemy.engine import Engine
 from app.core.config import settings
 from app.core.logging_config import get_logger
+from app.core.metrics import instrument_engine
+from app.core.profiling import attach_query_log
 
 logger = get_logger(__name__)
 
-engine = create_engine(settings.DATABASE_URL)
-logger.info(f"Database engine created for URL: {settings.DATABASE_URL}")
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-Base = declarative_base() 
\ No newline at end of file
+
+@lru_cache(maxsize=None)
+def get_engine() -> Engine:
+    """The process-wide engine, created (and the DB driver imported) on first use."""
+    engine = create_engine(settings.get_database_url, pool_pre_ping=True)
+    logger.info(f"Database engine created for URL: {engine.url}")
+    instrument_engine(engine)
+    attach_query_log(engine)
+    return engine
+
+
+class LazySession(Session):
+    """Binds to get_engine() when no bind is given, so importing SessionLocal connects nothing."""
+
+    def __init__(self, bind=None, **kwargs):
+        super().__init__(bind=bind or get_engine(), **kwargs)
+
+
+def __getattr__(name: str):
+    # `from app.db.base import engine` keeps working, but builds the engine only then
+    if name == "engine":
+        return get_engine()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+SessionLocal = sessionmaker(class_=LazySession, autocommit=False, autoflush=False)
+Base = declarative_base()
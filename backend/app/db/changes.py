@@ -0,0 +1,112 @@
+"""
+Delta sync for the upcoming-events list (/api/events/changes).
+
+A cursor is the database's clock (localtimestamp, the clock updated_at and
+created_at are written with) when a sync was served. Changes since a cursor:
+
+- inserted / updated: upcoming events with updated_at after it, through the
+  updated_at index; created_at tells the two apart.
+- expired: events whose date has passed since the cursor's day, or that
+  were edited to a past date, through the event_day index.
+- deleted: ids from event_tombstones, filled by a trigger on events, so
+  deletes from any process are recorded.
+
+updated_at is stamped at transaction start, so a transaction that commits
+after a sync can carry an older stamp. The returned cursor is therefore
+held back by CHANGES_OVERLAP_SECONDS; clients apply changes by id, so
+seeing a row twice is harmless. Tombstones older than
+CHANGES_RETENTION_DAYS are pruned, and an older cursor gets a full reset.
+"""
+import os
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, Optional
+from sqlalchemy import delete, func, or_, select, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+from app.core.logging_config import get_logger
+from app.models.event import Event
+from app.models.event_tombstone import EventTombstone
+
+logger = get_logger(__name__)
+
+CHANGES_OVERLAP_SECONDS = int(os.getenv("CHANGES_OVERLAP_SECONDS", "60"))
+CHANGES_RETENTION_DAYS = int(os.getenv("CHANGES_RETENTION_DAYS", "30"))
+
+TOMBSTONE_FUNCTION = """
+CREATE OR REPLACE FUNCTION events_tombstone() RETURNS trigger LANGUAGE plpgsql AS $$
+BEGIN
+    IF TG_OP = 'DELETE' THEN
+        INSERT INTO event_tombstones (event_id, removed_at) VALUES (OLD.id, localtimestamp)
+        ON CONFLICT (event_id) DO UPDATE SET removed_at = EXCLUDED.removed_at;
+        RETURN OLD;
+    END IF;
+    -- A re-inserted id is live again
+    DELETE FROM event_tombstones WHERE event_id = NEW.id;
+    RETURN NEW;
+END $$
+"""
+
+
+def ensure_change_tracking(engine: Engine) -> None:
+    """Create the updated_at index, the tombstone table and its trigger (idempotent)."""
+    EventTombstone.__table__.create(bind=engine, checkfirst=True)
+    with engine.begin() as conn:
+        conn.execute(text("CREATE INDEX IF NOT EXISTS ix_events_updated_at ON events (updated_at)"))
+        conn.execute(text(TOMBSTONE_FUNCTION))
+        conn.execute(text("DROP TRIGGER IF EXISTS events_tombstone ON events"))
+        conn.execute(text(
+            "CREATE TRIGGER events_tombstone AFTER INSERT OR DELETE ON events "
+            "FOR EACH ROW EXECUTE FUNCTION events_tombstone()"
+        ))
+    logger.info("Event change tracking ensured.")
+
+
+def parse_cursor(cursor: str) -> datetime:
+    """Raises ValueError for a cursor this API did not issue."""
+    since = datetime.fromisoformat(cursor)
+    # Cursors are the database's naive local clock; an offset can't be compared with it
+    if since.tzinfo is not None:
+        raise ValueError("Cursor must not carry a timezone offset")
+    return since
+
+
+def event_changes(db: Session, since: Optional[datetime], today: date) -> Dict[str, Any]:
+    """
+    Upcoming events changed since `since`, plus the ids that left the list, and
+    the cursor for the next call. With no `since`, or one older than the
+    tombstone retention, every upcoming event comes back as inserted and
+    "reset" tells the client to drop what it has.
+    """
+    now = db.execute(select(func.localtimestamp())).scalar()
+    cursor = (now - timedelta(seconds=CHANGES_OVERLAP_SECONDS)).isoformat()
+    event_day = func.event_day(Event.date)
+    upcoming = db.query(Event).filter(event_day >= today)
+
+    if since is None or since < now - timedelta(days=CHANGES_RETENTION_DAYS):
+        return {"cursor": cursor, "reset": True, "inserted": upcoming.all(), "updated": [], "expired": [], "deleted": []}
+
+    changed = upcoming.filter(Event.updated_at > since).all()
+    expired = db.execute(
+        select(Event.id).where(
+            event_day < today,
+            or_(event_day >= since.date(), Event.updated_at > since),
+        )
+    ).scalars().all()
+    deleted = db.execute(select(EventTombstone.event_id).where(EventTombstone.removed_at > since)).scalars().all()
+    return {
+        "cursor": cursor,
+        "reset": False,
+        "inserted": [e for e in changed if e.created_at > since],
+        "updated": [e for e in changed if e.created_at <= since],
+        "expired": list(expired),
+        "deleted": list(deleted),
+    }
+
+
+def prune_tombstones(db: Session) -> int:
+    """Drop tombstones past the retention window. Returns rows deleted."""
+    cutoff = func.localtimestamp() - timedelta(days=CHANGES_RETENTION_DAYS)
+    deleted = db.execute(delete(EventTombstone).where(EventTombstone.removed_at < cutoff)).rowcount
+    db.commit()
+    logger.info(f"Pruned {deleted} event tombstones.")
+    return deleted
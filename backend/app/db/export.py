@@ -0,0 +1,201 @@
+"""
+Streaming bulk export of events and clubs as NDJSON, CSV or Parquet.
+
+Rows come from a server-side cursor (yield_per) and are encoded one
+partition at a time, so memory stays flat however large the table is. Used
+by /api/admin/export and `python -m app.scripts.export`.
+
+Parquet requires pyarrow, which is not part of requirements.txt.
+"""
+import csv
+import io
+from datetime import date
+from typing import Any, Dict, Iterator, List, Optional, Sequence
+from pydantic_core import to_json
+from sqlalchemy import ARRAY, JSON, Boolean, Date, DateTime, Float, Integer, Table, func, select
+from sqlalchemy.orm import Session
+from app.core.logging_config import get_logger
+from app.models.club import Club
+from app.models.event import Event
+
+logger = get_logger(__name__)
+
+EXPORT_BATCH_ROWS = 1000
+
+TABLES: Dict[str, Table] = {"events": Event.__table__, "clubs": Club.__table__}
+
+FORMATS = {
+    "ndjson": ("application/x-ndjson", "ndjson"),
+    "csv": ("text/csv", "csv"),
+    "parquet": ("application/vnd.apache.parquet", "parquet"),
+}
+
+
+class ExportFilters:
+    """Row filters; all but `source` need events' columns, so clubs accept none."""
+
+    __slots__ = ("source", "date_from", "date_to", "verified")
+
+    def __init__(self, source: Optional[str] = None, date_from: Optional[date] = None,
+                 date_to: Optional[date] = None, verified: Optional[bool] = None):
+        self.source = source
+        self.date_from = date_from
+        self.date_to = date_to
+        self.verified = verified
+
+    def any(self) -> bool:
+        return any(getattr(self, name) is not None for name in self.__slots__)
+
+
+def export_statement(kind: str, filters: ExportFilters):
+    """The SELECT for an export. Raises ValueError for filters the table can't apply."""
+    table = TABLES[kind]
+    statement = select(*table.columns).order_by(table.c.id)
+    if kind != "events":
+        if filters.any():
+            raise ValueError("Clubs have no source, date or verification status to filter on")
+        return statement
+    if filters.source is not None:
+        statement = statement.where(table.c.source == filters.source)
+    if filters.date_from is not None or filters.date_to is not None:
+        # event_day() parses the free-text date (see app.db.home)
+        event_day = func.event_day(table.c.date)
+        if filters.date_from is not None:
+            statement = statement.where(event_day >= filters.date_from)
+        if filters.date_to is not None:
+            statement = statement.where(event_day <= filters.date_to)
+    if filters.verified is not None:
+        statement = statement.where(table.c.is_verified == filters.verified)
+    return statement
+
+
+def _partitions(db: Session, kind: str, filters: ExportFilters) -> Iterator[List[Dict[str, Any]]]:
+    result = db.execute(export_statement(kind, filters).execution_options(yield_per=EXPORT_BATCH_ROWS))
+    for partition in result.mappings().partitions():
+        yield partition
+
+
+def _ndjson(columns: Sequence[str], partitions: Iterator[List[Dict[str, Any]]]) -> Iterator[bytes]:
+    for rows in partitions:
+        yield b"".join(to_json(dict(row)) + b"\n" for row in rows)
+
+
+def _csv_value(value: Any) -> Any:
+    # Arrays and JSON objects go out as JSON text so they survive the round trip
+    if isinstance(value, (list, dict)):
+        return to_json(value).decode()
+    return value
+
+
+def _csv(columns: Sequence[str], partitions: Iterator[List[Dict[str, Any]]]) -> Iterator[bytes]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(columns)
+    for rows in partitions:
+        writer.writerows([_csv_value(row[c]) for c in columns] for row in rows)
+        yield buffer.getvalue().encode()
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue().encode()
+
+
+class _Drain(io.RawIOBase):
+    """Write-only sink whose contents are handed out chunk by chunk."""
+
+    def __init__(self):
+        self.chunks: List[bytes] = []
+        self.position = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self.chunks.append(bytes(data))
+        self.position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self.position
+
+    def take(self) -> bytes:
+        data, self.chunks = b"".join(self.chunks), []
+        return data
+
+
+def _arrow_type(column, pa):
+    column_type = column.type
+    if isinstance(column_type, ARRAY):
+        return pa.list_(pa.string())
+    if isinstance(column_type, Boolean):
+        return pa.bool_()
+    if isinstance(column_type, Integer):
+        return pa.int64()
+    if isinstance(column_type, Float):
+        return pa.float64()
+    if isinstance(column_type, DateTime):
+        return pa.timestamp("us")
+    if isinstance(column_type, Date):
+        return pa.date32()
+    return pa.string()  # strings, and JSON as text
+
+
+def _parquet(kind: str, columns: Sequence[str], partitions: Iterator[List[Dict[str, Any]]]) -> Iterator[bytes]:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    table = TABLES[kind]
+    schema = pa.schema([(c, _arrow_type(table.c[c], pa)) for c in columns])
+    json_columns = [c for c in columns if isinstance(table.c[c].type, JSON)]
+    sink = _Drain()
+    with pq.ParquetWriter(sink, schema, compression="zstd") as writer:
+        for rows in partitions:
+            data = {c: [row[c] for row in rows] for c in columns}
+            for c in json_columns:
+                data[c] = [None if v is None else to_json(v).decode() for v in data[c]]
+            # One row group per partition; its bytes are flushed to the sink as it is written
+            writer.write_batch(pa.RecordBatch.from_pydict(data, schema=schema))
+            yield sink.take()
+    yield sink.take()  # footer
+
+
+def check_format(format: str) -> None:
+    """Raises ValueError for an unknown format, or Parquet without pyarrow."""
+    if format not in FORMATS:
+        raise ValueError(f"Unknown export format {format!r}; choose one of {', '.join(FORMATS)}")
+    if format == "parquet":
+        try:
+            import pyarrow.parquet  # noqa: F401
+        except ImportError:
+            raise ValueError("Parquet export requires pyarrow: pip install pyarrow")
+
+
+def stream_export(kind: str, format: str, filters: ExportFilters, db: Optional[Session] = None) -> Iterator[bytes]:
+    """
+    Encoded export chunks, one per EXPORT_BATCH_ROWS rows. Opens its own
+    session unless given one, so a streaming response doesn't depend on the
+    request's session outliving the handler.
+    """
+    check_format(format)
+    export_statement(kind, filters)  # validate filters before the first chunk is sent
+    columns = [c.name for c in TABLES[kind].columns]
+
+    def chunks(session: Session) -> Iterator[bytes]:
+        partitions = _partitions(session, kind, filters)
+        if format == "ndjson":
+            yield from _ndjson(columns, partitions)
+        elif format == "csv":
+            yield from _csv(columns, partitions)
+        else:
+            yield from _parquet(kind, columns, partitions)
+
+    if db is not None:
+        return chunks(db)
+
+    def own_session() -> Iterator[bytes]:
+        from app.db.base import SessionLocal
+        with SessionLocal() as session:
+            yield from chunks(session)
+        logger.info(f"Exported {kind} as {format}.")
+
+    return own_session()
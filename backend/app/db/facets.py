@@ -0,0 +1,139 @@
+"""
+Facet counts (city, category, month, price band) for upcoming events.
+
+event_facet_counts holds one row per facet value per event day. Writers apply
+deltas in the same transaction as the event change (apply_facet_delta), and
+because rows are keyed by day, events drop out of "upcoming" by date filter
+alone; refresh_facets rebuilds the table from scratch and prunes past days.
+"""
+from collections import Counter
+from datetime import date, datetime
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from sqlalchemy import delete, func, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+from app.core.cache_bus import EVENTS, publish
+from app.core.logging_config import get_logger
+from app.models.event import Event
+from app.models.event_facet import EventFacetCount
+from app.scrapers.extraction import price_amounts
+from app.scrapers.normalization import normalize_category, normalize_location
+
+logger = get_logger(__name__)
+
+FACETS = ("city", "category", "month", "price_band")
+
+# (upper bound exclusive, label); first match wins
+PRICE_BANDS = [
+    (500, "Under ₹500"),
+    (1000, "₹500–999"),
+    (2000, "₹1,000–1,999"),
+    (float("inf"), "₹2,000+"),
+]
+PRICE_FREE = "Free"
+PRICE_UNKNOWN = "Price TBD"
+PRICE_BAND_ORDER = [PRICE_FREE] + [label for _, label in PRICE_BANDS] + [PRICE_UNKNOWN]
+
+FacetKey = Tuple[str, str, date]
+
+
+def price_band(price: Optional[str]) -> str:
+    """Band for the cheapest amount in a price string like "₹1,200 - ₹2,500"."""
+    if not price:
+        return PRICE_UNKNOWN
+    amounts = price_amounts(price)
+    if "free" in price.lower() or (amounts and min(amounts) == 0):
+        return PRICE_FREE
+    if not amounts:
+        return PRICE_UNKNOWN
+    cheapest = min(amounts)
+    return next(label for bound, label in PRICE_BANDS if cheapest < bound)
+
+
+def _get(event: Any, field: str) -> Any:
+    return event.get(field) if isinstance(event, dict) else getattr(event, field, None)
+
+
+def event_facet_keys(event: Any) -> List[FacetKey]:
+    """Facet rows an event (model or dict) contributes to; none if its date doesn't parse."""
+    try:
+        event_date = datetime.strptime(_get(event, "date") or "", "%d %b %Y").date()
+    except ValueError:
+        return []
+    keys = [
+        ("month", event_date.strftime("%Y-%m"), event_date),
+        ("price_band", price_band(_get(event, "price")), event_date),
+    ]
+    # Stored strings are display copies ("Andheri, Mumbai"); facets count canonical names
+    if _get(event, "location"):
+        keys.append(("city", normalize_location(_get(event, "location")), event_date))
+    for category in {normalize_category(c) for c in _get(event, "categories") or [] if isinstance(c, str)}:
+        keys.append(("category", category, event_date))
+    return keys
+
+
+def apply_facet_delta(db: Session, added: Iterable[Any] = (), removed: Iterable[Any] = ()) -> None:
+    """
+    Add the facet rows of `added` events and subtract those of `removed`
+    (e.g. the pre-update state of an updated event). Runs in the caller's
+    transaction; nothing is committed here.
+    """
+    delta: Counter = Counter()
+    for event in added:
+        delta.update(event_facet_keys(event))
+    for event in removed:
+        delta.subtract(event_facet_keys(event))
+    rows = [
+        {"facet": facet, "value": value, "event_date": day, "count": count}
+        for (facet, value, day), count in delta.items() if count
+    ]
+    if not rows:
+        return
+    stmt = insert(EventFacetCount).values(rows)
+    db.execute(stmt.on_conflict_do_update(
+        index_elements=["facet", "value", "event_date"],
+        set_={"count": EventFacetCount.count + stmt.excluded.count},
+    ))
+    db.execute(delete(EventFacetCount).where(EventFacetCount.count <= 0))
+
+
+def snapshot_facets(event: Event) -> Dict[str, Any]:
+    """The facet-relevant fields of an event, taken before it is modified."""
+    return {field: getattr(event, field) for field in ("date", "location", "categories", "price")}
+
+
+def refresh_facets(db: Session) -> int:
+    """Rebuild the summary from the events table, dropping past days. Returns rows written."""
+    today = date.today()
+    counts: Counter = Counter()
+    for event in db.execute(select(Event.date, Event.location, Event.categories, Event.price)).mappings():
+        counts.update(key for key in event_facet_keys(event) if key[2] >= today)
+    db.execute(delete(EventFacetCount))
+    if counts:
+        db.execute(insert(EventFacetCount), [
+            {"facet": facet, "value": value, "event_date": day, "count": count}
+            for (facet, value, day), count in counts.items()
+        ])
+    publish(db, EVENTS)
+    db.commit()
+    logger.info(f"Rebuilt event facet summary with {len(counts)} rows.")
+    return len(counts)
+
+
+def get_facets(db: Session) -> Dict[str, List[Dict[str, Any]]]:
+    """Counts per facet value over upcoming events."""
+    rows = db.execute(
+        select(EventFacetCount.facet, EventFacetCount.value, func.sum(EventFacetCount.count))
+        .where(EventFacetCount.event_date >= date.today())
+        .group_by(EventFacetCount.facet, EventFacetCount.value)
+    ).all()
+    facets: Dict[str, List[Dict[str, Any]]] = {facet: [] for facet in FACETS}
+    for facet, value, count in rows:
+        if count > 0:
+            facets[facet].append({"value": value, "count": int(count)})
+
+    facets["city"].sort(key=lambda f: (-f["count"], f["value"]))
+    facets["category"].sort(key=lambda f: (-f["count"], f["value"]))
+    facets["month"].sort(key=lambda f: f["value"])
+    facets["price_band"].sort(key=lambda f: PRICE_BAND_ORDER.index(f["value"]))
+    return facets
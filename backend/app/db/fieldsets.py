@@ -0,0 +1,38 @@
+"""
+Sparse fieldsets for list endpoints.
+
+`?fields=title,date,location` selects only those columns (plus the id) and
+returns only those keys. `?format=columns` sends the list column-oriented,
+{"count": n, "columns": {"id": [...], "title": [...]}}, so each key is
+written once instead of once per row.
+"""
+from typing import Any, Dict, List, Optional, Tuple
+from pydantic_core import to_json
+from app.models.club import Club as ClubModel
+from app.models.event import Event as EventModel
+from app.schemas.club import Club
+from app.schemas.event import ShowEvent
+
+# Fields a list may be narrowed to: the response schema's, where the table has the column
+# (not derived attributes such as Event.city). Id first.
+EVENT_FIELDS = ("id",) + tuple(f for f in ShowEvent.model_fields if f != "id" and f in EventModel.__table__.c)
+CLUB_FIELDS = ("id",) + tuple(f for f in Club.model_fields if f != "id" and f in ClubModel.__table__.c)
+
+
+def parse_fields(raw: Optional[str], allowed: Tuple[str, ...]) -> Optional[Tuple[str, ...]]:
+    """The requested fields in schema order, id first, or None for all. Raises ValueError on unknown names."""
+    if not raw:
+        return None
+    requested = {f.strip() for f in raw.split(",") if f.strip()}
+    unknown = requested.difference(allowed)
+    if unknown:
+        raise ValueError(f"Unknown fields: {', '.join(sorted(unknown))}. Allowed: {', '.join(allowed)}")
+    requested.add("id")
+    return tuple(f for f in allowed if f in requested)
+
+
+def encode_rows(rows: List[Dict[str, Any]], fields: Tuple[str, ...], format: str = "json") -> bytes:
+    """Serialize `rows`, keeping only `fields`, as a list of objects or column-oriented."""
+    if format == "columns":
+        return to_json({"count": len(rows), "columns": {f: [row[f] for row in rows] for f in fields}})
+    return to_json([{f: row[f] for f in fields} for row in rows])
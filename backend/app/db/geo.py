@@ -0,0 +1,71 @@
+from typing import List, Optional, Tuple
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+from app.core.logging_config import get_logger
+from app.db.search import EVENT_DAY
+from app.scrapers.geocoding import geocode_fields, geohash_cover, haversine_km
+
+logger = get_logger(__name__)
+
+GEO_TABLES = ("events", "clubs")
+
+
+def ensure_geo_columns(engine: Engine) -> None:
+    """
+    Add the coordinate columns and geohash index to existing tables and
+    geocode rows ingested before they existed (idempotent).
+    """
+    with engine.begin() as conn:
+        for table in GEO_TABLES:
+            conn.execute(text(f"ALTER TABLE {table} ADD COLUMN IF NOT EXISTS latitude double precision"))
+            conn.execute(text(f"ALTER TABLE {table} ADD COLUMN IF NOT EXISTS longitude double precision"))
+            conn.execute(text(f"ALTER TABLE {table} ADD COLUMN IF NOT EXISTS geohash varchar"))
+            # Pattern ops so `geohash LIKE 'prefix%'` is an index range scan under any collation
+            conn.execute(text(f"CREATE INDEX IF NOT EXISTS ix_{table}_geohash ON {table} (geohash varchar_pattern_ops)"))
+
+            rows = conn.execute(text(f"SELECT id, location, address FROM {table} WHERE geohash IS NULL")).all()
+            updates = [{"id": row.id, **geocode_fields(row.location, row.address)} for row in rows]
+            updates = [u for u in updates if u["geohash"] is not None]
+            if updates:
+                conn.execute(
+                    text(f"UPDATE {table} SET latitude = :latitude, longitude = :longitude, geohash = :geohash WHERE id = :id"),
+                    updates,
+                )
+            logger.info(f"Geocoded {len(updates)} of {len(rows)} {table} rows without coordinates.")
+
+
+def nearby_event_ids(
+    db: Session,
+    latitude: float,
+    longitude: float,
+    box: Tuple[float, float, float, float],
+    radius_km: Optional[float] = None,
+    limit: int = 50,
+) -> List[Tuple[str, float]]:
+    """
+    (id, distance_km) of upcoming events inside `box` (min_lat, min_lon,
+    max_lat, max_lon) and, if given, within `radius_km` of the point, nearest
+    (then soonest) first. The geohash index narrows candidates to the cells
+    covering the box.
+    """
+    min_lat, min_lon, max_lat, max_lon = box
+    prefixes = geohash_cover(min_lat, min_lon, max_lat, max_lon)
+    params = {f"p{i}": f"{prefix}%" for i, prefix in enumerate(prefixes)}
+    params.update(min_lat=min_lat, min_lon=min_lon, max_lat=max_lat, max_lon=max_lon)
+    cells = " OR ".join(f"geohash LIKE :p{i}" for i in range(len(prefixes)))
+
+    rows = db.execute(text(
+        f"SELECT id, latitude, longitude, {EVENT_DAY} AS event_date FROM events WHERE ({cells}) "
+        "AND latitude BETWEEN :min_lat AND :max_lat AND longitude BETWEEN :min_lon AND :max_lon "
+        f"AND {EVENT_DAY} >= current_date"
+    ), params).all()
+
+    hits = []
+    for row in rows:
+        distance = haversine_km(latitude, longitude, row.latitude, row.longitude)
+        if radius_km is None or distance <= radius_km:
+            hits.append((distance, row.event_date, row.id))
+    # Most events are geocoded to a city centre, so break distance ties by date
+    hits.sort()
+    return [(event_id, distance) for distance, _, event_id in hits[:limit]]
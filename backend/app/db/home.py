@@ -0,0 +1,54 @@
+"""
+Data for the homepage: the next few upcoming events, featured clubs and
+per-city/category counts, in one response.
+
+Event.date is free text, so "next N events" needs an index on its parsed
+value. to_date is not immutable and raises on impossible dates ("31 Feb"),
+hence the event_day() wrapper, which returns NULL for anything unparseable
+(its exception block makes it parallel unsafe). The counts come from the
+facet summary table (app.db.facets).
+"""
+from datetime import date
+from typing import Any, Dict
+from sqlalchemy import func, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+from app.core.logging_config import get_logger
+from app.db.facets import get_facets
+from app.models.club import Club
+from app.models.event import Event
+
+logger = get_logger(__name__)
+
+EVENT_DAY_FUNCTION = r"""
+CREATE OR REPLACE FUNCTION event_day(value varchar) RETURNS date
+LANGUAGE plpgsql IMMUTABLE AS $$
+BEGIN
+    IF value ~ '^\d{1,2} [A-Za-z]{3} \d{4}$' THEN
+        RETURN to_date(value, 'DD Mon YYYY');
+    END IF;
+    RETURN NULL;
+EXCEPTION WHEN others THEN
+    RETURN NULL;
+END $$
+"""
+
+
+def ensure_event_day_index(engine: Engine) -> None:
+    """Create event_day() and the events index on it (idempotent)."""
+    with engine.begin() as conn:
+        conn.execute(text(EVENT_DAY_FUNCTION))
+        conn.execute(text("CREATE INDEX IF NOT EXISTS ix_events_event_day ON events (event_day(date), id)"))
+    logger.info("Event day index ensured.")
+
+
+def home_page(db: Session, today: date, events: int, clubs: int) -> Dict[str, Any]:
+    """The homepage payload; every part is an index scan or a read of the facet summary."""
+    event_day = func.event_day(Event.date)
+    facets = get_facets(db)
+    return {
+        "events": db.query(Event).filter(event_day >= today).order_by(event_day, Event.id).limit(events).all(),
+        "clubs": db.query(Club).order_by(Club.id).limit(clubs).all(),
+        "cities": facets["city"],
+        "categories": facets["category"],
+    }
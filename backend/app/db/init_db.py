@@ -1,7 +1,12 @@
-from sqlalchemy import create_engine
-from app.core.config import settings
+from sqlalchemy.orm import Session
 from app.models.event import Event
-from app.db.base import Base
+from app.db.base import Base, get_engine
+from app.db.search import ensure_search_indexes
+from app.db.geo import ensure_geo_columns
+from app.db.facets import refresh_facets
+from app.db.taxonomy import ensure_taxonomy
+from app.db.home import ensure_event_day_index
+from app.db.changes import ensure_change_tracking
 from app.core.logging_config import get_logger
 
 logger = get_logger(__name__)
@@ -10,9 +15,20 @@ def init_db():
     logger.info("Initializing database...")
     """Initialize the database with required tables"""
     try:
-        engine = create_engine(settings.get_database_url)
+        engine = get_engine()
         Base.metadata.create_all(bind=engine)
         logger.info("Database tables created (if they didn't exist). Mozambique!")
+        ensure_search_indexes(engine)
+        ensure_geo_columns(engine)
+        ensure_taxonomy(engine)
+        ensure_event_day_index(engine)
+        ensure_change_tracking(engine)
+        with Session(engine) as db:
+            refresh_facets(db)
     except Exception as e:
         logger.error(f"Error initializing database: {e}", exc_info=True)
         raise
+
+
+if __name__ == "__main__":
+    init_db()
@@ -0,0 +1,137 @@
+import re
+from typing import Any, Dict, List, Tuple
+from sqlalchemy import text
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.orm import Session
+from app.core.logging_config import get_logger
+from app.scrapers.normalization import search_variants
+
+logger = get_logger(__name__)
+
+# Weighted document vectors, stored as generated columns so ranking does not
+# re-parse every matching row. Categories are a text[], and array_to_string is
+# not immutable, hence the wrapper function.
+SEARCH_ARRAY_FUNCTION = (
+    "CREATE OR REPLACE FUNCTION search_array_text(text[]) RETURNS text "
+    "LANGUAGE sql IMMUTABLE PARALLEL SAFE AS $$ SELECT coalesce(array_to_string($1, ' '), '') $$"
+)
+EVENT_VECTOR = (
+    "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('english', coalesce(location, '') || ' ' || search_array_text(categories)), 'B') || "
+    "setweight(to_tsvector('english', coalesce(description, '')), 'C')"
+)
+CLUB_VECTOR = (
+    "setweight(to_tsvector('english', coalesce(name, '')), 'A') || "
+    "setweight(to_tsvector('english', coalesce(location, '')), 'B') || "
+    "setweight(to_tsvector('english', coalesce(description, '')), 'C')"
+)
+
+# Event.date is free text ("05 Jan 2026" or "Date TBD"); event_day() (app.db.home) parses
+# it, is NULL rather than an error for anything malformed, and is indexed
+EVENT_DAY = "event_day(date)"
+
+# How much a fuzzy (trigram) match counts relative to the full-text rank
+TRIGRAM_WEIGHT = 0.5
+
+_trigram_available: Dict[str, bool] = {}
+
+
+def ensure_search_indexes(engine: Engine) -> None:
+    """Create the search columns and indexes used by /api/search (idempotent)."""
+    with engine.begin() as conn:
+        conn.execute(text(SEARCH_ARRAY_FUNCTION))
+        for table, vector in (("events", EVENT_VECTOR), ("clubs", CLUB_VECTOR)):
+            conn.execute(text(
+                f"ALTER TABLE {table} ADD COLUMN IF NOT EXISTS search_vector tsvector "
+                f"GENERATED ALWAYS AS ({vector}) STORED"
+            ))
+            conn.execute(text(f"CREATE INDEX IF NOT EXISTS ix_{table}_search ON {table} USING gin (search_vector)"))
+    try:
+        with engine.begin() as conn:
+            conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+            conn.execute(text("CREATE INDEX IF NOT EXISTS ix_events_title_trgm ON events USING gin (title gin_trgm_ops)"))
+            conn.execute(text("CREATE INDEX IF NOT EXISTS ix_events_location_trgm ON events USING gin (location gin_trgm_ops)"))
+            conn.execute(text("CREATE INDEX IF NOT EXISTS ix_clubs_name_trgm ON clubs USING gin (name gin_trgm_ops)"))
+    except Exception as e:
+        logger.warning(f"pg_trgm unavailable, search will not be typo tolerant: {e}")
+    _trigram_available.clear()
+    logger.info("Search indexes ensured.")
+
+
+def trigram_available(conn: Connection) -> bool:
+    """Whether pg_trgm is installed, checked once per database."""
+    url = str(conn.engine.url)
+    if url not in _trigram_available:
+        _trigram_available[url] = conn.execute(
+            text("SELECT EXISTS (SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm')")
+        ).scalar()
+    return _trigram_available[url]
+
+
+def build_tsquery(query: str) -> str:
+    """
+    to_tsquery input matching every word of the query (the last one as a
+    prefix, for search-as-you-type), OR'd across synonym rewrites:
+    "bombay hm" -> "(bombay & hm:*) | (mumbai & half & marathon:*)".
+    """
+    groups = []
+    for variant in search_variants(query):
+        words = re.findall(r"\w+", variant.lower())
+        if words:
+            words[-1] += ":*"
+            groups.append("(" + " & ".join(words) + ")")
+    return " | ".join(groups)
+
+
+def search_catalog(
+    db: Session,
+    query: str,
+    kind: str = "all",
+    upcoming: bool = True,
+    limit: int = 20,
+    offset: int = 0,
+) -> Tuple[int, List[Tuple[str, str, float]]]:
+    """
+    Ranked (kind, id, score) hits for `query` over events and/or clubs, and
+    the total number of hits. Full-text matches are ranked by ts_rank_cd;
+    trigram word similarity on titles, event locations and club names adds
+    typo tolerance when pg_trgm is installed.
+    """
+    tsquery = build_tsquery(query)
+    if not tsquery:
+        return 0, []
+
+    conn = db.connection()
+    fuzzy = trigram_available(conn)
+    params: Dict[str, Any] = {"tsq": tsquery, "q": query, "w": TRIGRAM_WEIGHT, "limit": limit, "offset": offset}
+
+    selects = []
+    if kind in ("all", "event"):
+        score = "ts_rank_cd(search_vector, q.tsq)"
+        match = "search_vector @@ q.tsq"
+        if fuzzy:
+            score += " + :w * greatest(word_similarity(:q, title), word_similarity(:q, location))"
+            match = f"({match} OR :q <% title OR :q <% location)"
+        where = f"{match} AND {EVENT_DAY} >= current_date" if upcoming else match
+        selects.append(f"SELECT 'event' AS kind, id, {score} AS score FROM events, q WHERE {where}")
+    if kind in ("all", "club"):
+        score = "ts_rank_cd(search_vector, q.tsq)"
+        match = "search_vector @@ q.tsq"
+        if fuzzy:
+            score += " + :w * word_similarity(:q, name)"
+            match = f"({match} OR :q <% name)"
+        selects.append(f"SELECT 'club' AS kind, id, {score} AS score FROM clubs, q WHERE {match}")
+
+    hits = "WITH q AS (SELECT to_tsquery('english', :tsq) AS tsq) SELECT {} FROM (" + " UNION ALL ".join(selects) + ") hits"
+    rows = conn.execute(
+        text(hits.format("kind, id, score, count(*) OVER () AS total") + " ORDER BY score DESC, id LIMIT :limit OFFSET :offset"),
+        params,
+    ).all()
+    if rows:
+        total = rows[0].total
+    elif offset:
+        # A page past the end has no row to carry the window count
+        total = conn.execute(text(hits.format("count(*)")), params).scalar()
+    else:
+        total = 0
+    return total, [(row.kind, row.id, float(row.score)) for row in rows]
@@ -0,0 +1,145 @@
+"""
+Static snapshot of upcoming events and clubs.
+
+After each ingest (scraper upserts, submissions) and at the IST date
+rollover, the full /api/events and /api/clubs payloads are written to
+SNAPSHOT_DIR as content-hashed files (events.<hash>.json, plus .gz and .br
+copies) with a small manifest.json pointing at the current ones. Hashed
+files never change, so clients and CDNs may cache them forever; only the
+manifest is short-lived. Unchanged content keeps its name, so a rollover or
+re-ingest that changes nothing costs clients nothing.
+"""
+import hashlib
+import json
+import os
+import tempfile
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+from pydantic import TypeAdapter
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+from app.core.compression import ENCODINGS, compress
+from app.core.config import settings
+from app.core.logging_config import get_logger
+from app.models.club import Club as ClubModel
+from app.models.event import Event as EventModel
+from app.schemas.club import Club
+from app.schemas.event import ShowEvent
+
+logger = get_logger(__name__)
+
+# India has no DST, so a fixed offset needs no tz database
+IST = timezone(timedelta(hours=5, minutes=30), "IST")
+
+MANIFEST = "manifest.json"
+SUFFIXES = {"gzip": ".gz", "br": ".br"}
+
+SHOW_EVENTS = TypeAdapter(List[ShowEvent])
+CLUBS_LIST = TypeAdapter(List[Club])
+
+
+def snapshot_dir() -> str:
+    if settings.SNAPSHOT_DIR:
+        return settings.SNAPSHOT_DIR
+    # Next to the scraper cache, at backend/cache/snapshots
+    return os.path.join(Path(__file__).parent.parent.parent, "cache", "snapshots")
+
+
+def ist_today() -> date:
+    """Event dates are Indian local dates, so "upcoming" rolls over at IST midnight."""
+    return datetime.now(IST).date()
+
+
+def _write_atomic(path: str, data: bytes) -> None:
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), prefix=".tmp-")
+    with os.fdopen(fd, "wb") as f:
+        f.write(data)
+    os.chmod(tmp, 0o644)  # mkstemp creates owner-only files; these are served publicly
+    os.replace(tmp, path)
+
+
+def _write_hashed(directory: str, name: str, body: bytes) -> Dict[str, Any]:
+    """Write `body` and its compressed copies as <name>.<hash>.json; returns its manifest entry."""
+    filename = f"{name}.{hashlib.sha256(body).hexdigest()[:16]}.json"
+    path = os.path.join(directory, filename)
+    if not os.path.exists(path):
+        for encoding in ENCODINGS:
+            _write_atomic(path + SUFFIXES[encoding], compress(body, encoding))
+        # The identity file goes last: its presence marks the set complete
+        _write_atomic(path, body)
+    return {"file": filename, "bytes": len(body)}
+
+
+def read_manifest(directory: Optional[str] = None) -> Optional[Dict[str, Any]]:
+    try:
+        with open(os.path.join(directory or snapshot_dir(), MANIFEST), "rb") as f:
+            return json.loads(f.read())
+    except (OSError, ValueError):
+        return None
+
+
+def upcoming_events(db: Session, today: date) -> List[ShowEvent]:
+    """
+    Events dated today or later, as /api/events returns them. event_day()
+    (app.db.home) skips free-text dates such as "Date TBD" instead of failing
+    the whole snapshot; ordering keeps the content hash stable.
+    """
+    event_day = func.event_day(EventModel.date)
+    events = db.query(EventModel).filter(event_day >= today).order_by(event_day, EventModel.id)
+    return [ShowEvent.model_validate(event) for event in events]
+
+
+def write_snapshot(db: Session, directory: Optional[str] = None) -> Dict[str, Any]:
+    """Write the current snapshot and point the manifest at it. Returns the manifest."""
+    directory = directory or snapshot_dir()
+    os.makedirs(directory, exist_ok=True)
+    today = ist_today()
+    events = upcoming_events(db, today)
+    clubs = CLUBS_LIST.validate_python(db.query(ClubModel).all(), from_attributes=True)
+
+    manifest = {
+        "generated_at": datetime.now(IST).isoformat(timespec="seconds"),
+        "date": today.isoformat(),
+        "events": {**_write_hashed(directory, "events", SHOW_EVENTS.dump_json(events)), "count": len(events)},
+        "clubs": {**_write_hashed(directory, "clubs", CLUBS_LIST.dump_json(clubs)), "count": len(clubs)},
+    }
+    previous = read_manifest(directory)
+    _write_atomic(os.path.join(directory, MANIFEST), json.dumps(manifest).encode())
+    _prune(directory, manifest, previous)
+    logger.info(f"Wrote snapshot for {today}: {len(events)} events ({manifest['events']['file']}), {len(clubs)} clubs.")
+    return manifest
+
+
+def _prune(directory: str, current: Dict[str, Any], previous: Optional[Dict[str, Any]]) -> None:
+    """Drop hashed files no manifest refers to; the previous set stays for clients holding the old manifest."""
+    keep = {current[kind]["file"] for kind in ("events", "clubs")}
+    if previous:
+        keep.update(previous.get(kind, {}).get("file") for kind in ("events", "clubs"))
+    for name in os.listdir(directory):
+        if name == MANIFEST or name.startswith(".tmp-"):
+            continue
+        base = name
+        for suffix in SUFFIXES.values():
+            if base.endswith(suffix):
+                base = base[: -len(suffix)]
+        if base not in keep:
+            try:
+                os.remove(os.path.join(directory, name))
+            except OSError:
+                pass
+
+
+def refresh_snapshot(db: Session) -> None:
+    """write_snapshot for ingest paths: a failed snapshot is logged, never fatal to the write that triggered it."""
+    try:
+        write_snapshot(db)
+    except Exception as e:
+        logger.error(f"Error writing events snapshot: {e}", exc_info=True)
+
+
+def refresh_snapshot_in_new_session() -> None:
+    """refresh_snapshot on its own session, for background tasks and scheduled jobs."""
+    from app.db.base import SessionLocal
+    with SessionLocal() as db:
+        refresh_snapshot(db)
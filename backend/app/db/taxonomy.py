@@ -0,0 +1,150 @@
+"""
+Canonical cities and categories.
+
+Raw location/category strings are resolved once at ingest through the alias
+matchers in app.scrapers.normalization; events then reference cities by
+integer id and categories through the event_categories join table, so
+filters are indexed integer lookups. The location and categories string
+columns are never rewritten: they stay as the display copy the API returns
+(with any locality, e.g. "Andheri, Mumbai"), and geocoding reads them.
+"""
+from typing import Any, Dict, Iterable, List, Optional, Set, Type
+from sqlalchemy import delete, select, text
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.engine import Engine
+from sqlalchemy.event import listens_for
+from sqlalchemy.orm import Session
+from app.core.logging_config import get_logger
+from app.models.category import Category, event_categories
+from app.models.city import City
+from app.scrapers.geocoding import CITY_COORDINATES, geocode
+from app.scrapers.normalization import (
+    CATEGORY_MAP, CITY_MAP, canonical_categories, normalize_category, normalize_location,
+)
+
+logger = get_logger(__name__)
+
+# name -> id, per table; ids never change once assigned. Only committed rows go
+# in here: ids a session inserts wait in its info until it commits, so a
+# rollback can't leave the cache pointing at a row that doesn't exist.
+_ids: Dict[str, Dict[str, int]] = {City.__tablename__: {}, Category.__tablename__: {}}
+_PENDING = "taxonomy_ids"
+
+
+def _pending(db: Session) -> Dict[str, Dict[str, int]]:
+    return db.info.setdefault(_PENDING, {table: {} for table in _ids})
+
+
+@listens_for(Session, "after_commit")
+def _publish_pending(db: Session) -> None:
+    for table, ids in db.info.pop(_PENDING, {}).items():
+        _ids[table].update(ids)
+
+
+@listens_for(Session, "after_rollback")
+def _discard_pending(db: Session) -> None:
+    db.info.pop(_PENDING, None)
+
+
+def _city_row(name: str) -> Dict[str, Any]:
+    place = geocode(name)
+    return {
+        "name": name,
+        "latitude": place.latitude if place else None,
+        "longitude": place.longitude if place else None,
+    }
+
+
+def resolve_ids(db: Session, model: Type, names: Iterable[str], create: bool = True) -> Dict[str, int]:
+    """Ids for canonical names, inserting unknown ones when `create` is set."""
+    cache = _ids[model.__tablename__]
+    pending = _pending(db)[model.__tablename__]
+    wanted = {n for n in names if n}
+    missing = wanted - cache.keys() - pending.keys()
+    if missing and create:
+        rows = [_city_row(n) if model is City else {"name": n} for n in sorted(missing)]
+        inserted = db.execute(
+            insert(model).values(rows).on_conflict_do_nothing(index_elements=["name"]).returning(model.id, model.name)
+        )
+        pending.update({name: row_id for row_id, name in inserted})
+        missing -= pending.keys()
+    if missing:
+        # Rows this session didn't insert: a conflicting insert waits for the
+        # other transaction, so whatever is visible here is committed
+        for row_id, name in db.execute(select(model.id, model.name).where(model.name.in_(missing))):
+            cache[name] = row_id
+    return {n: cache[n] if n in cache else pending[n] for n in wanted if n in cache or n in pending}
+
+
+def preload_ids(db: Session) -> None:
+    """Fill the id caches with every known city and category."""
+    for model in (City, Category):
+        _ids[model.__tablename__].update({name: row_id for row_id, name in db.execute(select(model.id, model.name))})
+
+
+def city_id(db: Session, raw_location: str, create: bool = False) -> Optional[int]:
+    name = normalize_location(raw_location)
+    return resolve_ids(db, City, [name], create=create).get(name)
+
+
+def category_id(db: Session, raw_category: str, create: bool = False) -> Optional[int]:
+    name = normalize_category(raw_category)
+    return resolve_ids(db, Category, [name], create=create).get(name)
+
+
+def assign_city_ids(db: Session, events: List[Dict[str, Any]]) -> None:
+    """Set the city_id of event dicts from their location, creating unseen cities."""
+    cities = {id(e): normalize_location(e["location"]) for e in events if e.get("location")}
+    ids = resolve_ids(db, City, cities.values())
+    for event in events:
+        if id(event) in cities:
+            event["city_id"] = ids.get(cities[id(event)])
+
+
+def link_categories(db: Session, events: List[Dict[str, Any]]) -> None:
+    """
+    Replace the event_categories rows of each event dict (which must have an
+    id and already be flushed) with its canonical categories.
+    """
+    canonical = {e["id"]: canonical_categories(e["categories"]) for e in events if "categories" in e}
+    if not canonical:
+        return
+    ids = resolve_ids(db, Category, (c for categories in canonical.values() for c in categories))
+    db.execute(delete(event_categories).where(event_categories.c.event_id.in_(list(canonical))))
+    links = [
+        {"event_id": event_id, "category_id": ids[c]}
+        for event_id, categories in canonical.items() for c in categories if c in ids
+    ]
+    if links:
+        db.execute(insert(event_categories).values(links))
+
+
+def ensure_taxonomy(engine: Engine) -> None:
+    """
+    Add events.city_id to existing tables, seed the known cities and
+    categories, and resolve events written before the lookup tables existed
+    (idempotent).
+    """
+    for cache in _ids.values():
+        cache.clear()
+    with engine.begin() as conn:
+        conn.execute(text("ALTER TABLE events ADD COLUMN IF NOT EXISTS city_id integer REFERENCES cities(id)"))
+        conn.execute(text("CREATE INDEX IF NOT EXISTS ix_events_city_id ON events (city_id)"))
+
+    with Session(engine) as db:
+        resolve_ids(db, City, set(CITY_MAP.values()) | set(CITY_COORDINATES))
+        resolve_ids(db, Category, set(CATEGORY_MAP.values()))
+
+        linked: Set[str] = set(db.execute(select(event_categories.c.event_id).distinct()).scalars())
+        rows = db.execute(text("SELECT id, location, categories, city_id FROM events")).mappings()
+        pending = [dict(r) for r in rows if r["id"] not in linked or r["city_id"] is None]
+        assign_city_ids(db, pending)
+        for start in range(0, len(pending), 1000):
+            chunk = pending[start:start + 1000]
+            db.execute(
+                text("UPDATE events SET city_id = :city_id WHERE id = :id AND city_id IS DISTINCT FROM :city_id"),
+                [{"id": e["id"], "city_id": e.get("city_id")} for e in chunk],
+            )
+            link_categories(db, chunk)
+        db.commit()
+    logger.info(f"Resolved cities and categories for {len(pending)} events.")
@@ -1,13 +1,20 @@
 from fastapi import FastAPI
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi import Request
+from fastapi.responses import JSONResponse
+from fastapi import Request, Response
 from fastapi.routing import APIRouter
 import os
-import httpx
-from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from contextlib import asynccontextmanager
 
-from app.core.logging_config import get_logger # Import the new logger
+from app.core.logging_config import get_logger, SAMPLED # Import the new logger
+from app.core import image_variants
+from app.core.leader import is_leader
+from app.core.cache_bus import start_listener, stop_listener
+from app.core.compression import CompressionMiddleware
+from app.core.metrics import PrometheusMiddleware, render_latest
+from app.core.profiling import ProfilingMiddleware
+from app.db.snapshot import IST, ist_today, read_manifest, refresh_snapshot_in_new_session
 # from app.scrapers.scraper_manager import ScraperManager  # Commented for now
 from app.api.routes import router as api_router
 
@@ -24,11 +31,19 @@ ALLOWED_ORIGINS = [
     "https://www.runzaar.com",
 ]
 
-# APScheduler setup
-scheduler = AsyncIOScheduler()
 EVENTS_URL = "https://running-events-hub-api.onrender.com/api/"
 
+try:
+    import orjson  # noqa: F401
+    from fastapi.responses import ORJSONResponse as DefaultResponse
+except ImportError:
+    DefaultResponse = JSONResponse
+
 async def scheduled_ping_job():
+    # Every worker schedules the job, but only the leader process pings
+    if not is_leader():
+        return
+    import httpx
     logger.info(f"Pinging URL: {EVENTS_URL}")
     try:
         async with httpx.AsyncClient() as client:
@@ -40,25 +55,68 @@ async def scheduled_ping_job():
     except Exception as e:
         logger.error(f"Unexpected error during ping: {e}", exc_info=True)
 
+async def snapshot_rollover_job():
+    if not is_leader():
+        return
+    await run_in_threadpool(refresh_snapshot_in_new_session)
+
+def prune_tombstones_job():
+    """Forget deletions older than the delta-sync retention window."""
+    if not is_leader():
+        return
+    from app.db.base import SessionLocal
+    from app.db.changes import prune_tombstones
+    try:
+        with SessionLocal() as db:
+            prune_tombstones(db)
+    except Exception as e:
+        logger.error(f"Error pruning event tombstones: {e}", exc_info=True)
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     logger.info("Application startup...")
-    # Startup
+    # Startup; the scheduler is created here rather than at import
+    from apscheduler.schedulers.asyncio import AsyncIOScheduler
+    scheduler = AsyncIOScheduler()
     scheduler.add_job(scheduled_ping_job, "interval", minutes=14, misfire_grace_time=300)
+    # Past events drop out of the static snapshot when the IST date changes
+    scheduler.add_job(snapshot_rollover_job, "cron", hour=0, minute=0, timezone=IST, misfire_grace_time=3600)
+    scheduler.add_job(prune_tombstones_job, "cron", hour=0, minute=30, timezone=IST, misfire_grace_time=3600)
     scheduler.start()
     logger.info("APScheduler started. Ping job scheduled every 14 minutes.")
+    await run_in_threadpool(warm_up)
+    # Cached responses are served only while this worker hears other processes' writes
+    start_listener()
     yield
     # Shutdown
     logger.info("Application shutdown...")
+    stop_listener()
     scheduler.shutdown()
     logger.info("APScheduler shut down.")
+    image_variants.shutdown()
+
+def warm_up():
+    """Open this worker's first DB connection and load the lookup caches before taking traffic."""
+    from app.db.base import SessionLocal
+    from app.db.taxonomy import preload_ids
+    try:
+        with SessionLocal() as db:
+            preload_ids(db)
+        # The snapshot directory may be empty (fresh disk) or from before the last rollover
+        manifest = read_manifest()
+        if is_leader() and (manifest is None or manifest.get("date") != ist_today().isoformat()):
+            refresh_snapshot_in_new_session()
+        logger.info(f"Worker {os.getpid()} warmed up.")
+    except Exception as e:
+        logger.warning(f"Warm-up failed, continuing cold: {e}")
 
 # FastAPI app with lifespan handler
 app = FastAPI(
     title="Running Events Hub API",
     description="API for managing running events and clubs in India",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=DefaultResponse,
 )
 
 # CORS Middleware
@@ -71,15 +129,30 @@ app.add_middleware(
 )
 logger.info(f"CORS middleware added with allowed origins: {ALLOWED_ORIGINS}")
 
+# gzip/brotli for responses not already pre-compressed by the response cache
+app.add_middleware(CompressionMiddleware)
+
+# Admin-armed sampling profiler (see /api/admin/profiling)
+app.add_middleware(ProfilingMiddleware)
+
+# Request latency per route, exposed on /metrics
+app.add_middleware(PrometheusMiddleware)
+
 # API Routes
 app.include_router(api_router, prefix="/api")
 logger.info("API routes included.")
 
 @app.get("/")
 async def root(request: Request): # Add request for logging
-    logger.info(f"Root endpoint accessed by {request.client.host}")
+    logger.info("Root endpoint accessed by %s", request.client.host, extra=SAMPLED)
     return {
         "message": "Welcome to Running Events Hub API",
         "docs_url": "/docs",
         "redoc_url": "/redoc"
-    }
\ No newline at end of file
+    }
+
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    """Prometheus scrape endpoint."""
+    body, content_type = render_latest()
+    return Response(content=body, media_type=content_type)
@@ -0,0 +1,18 @@
+from sqlalchemy import Column, String, Integer, ForeignKey, Table
+from app.db.base import Base
+
+class Category(Base):
+    """Canonical race categories (normalize_category output)"""
+    __tablename__ = "categories"
+
+    id = Column(Integer, primary_key=True)
+    name = Column(String, nullable=False, unique=True)
+
+# Which categories an event offers; the primary key serves event lookups,
+# the category_id index serves category filters
+event_categories = Table(
+    "event_categories",
+    Base.metadata,
+    Column("event_id", String, ForeignKey("events.id", ondelete="CASCADE"), primary_key=True),
+    Column("category_id", Integer, ForeignKey("categories.id"), primary_key=True, index=True),
+)
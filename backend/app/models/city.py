@@ -0,0 +1,11 @@
+from sqlalchemy import Column, String, Integer, Float
+from app.db.base import Base
+
+class City(Base):
+    """Canonical city names (normalize_location output), referenced by events.city_id"""
+    __tablename__ = "cities"
+
+    id = Column(Integer, primary_key=True)
+    name = Column(String, nullable=False, unique=True)
+    latitude = Column(Float, nullable=True)
+    longitude = Column(Float, nullable=True)
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Integer, ARRAY, JSON
+from sqlalchemy import Column, String, Integer, ARRAY, JSON, Float
 from app.db.base import Base
 
 class Club(Base):
@@ -22,3 +22,7 @@ class Club(Base):
     logo_url = Column(String, nullable=True)
     photos = Column(ARRAY(String), server_default='{}', nullable=True)
     amenities = Column(ARRAY(String), server_default='{}', nullable=True)
+    # Filled in at ingest from the offline gazetteer (app.scrapers.geocoding)
+    latitude = Column(Float, nullable=True)
+    longitude = Column(Float, nullable=True)
+    geohash = Column(String, nullable=True)
@@ -1,6 +1,9 @@
-from sqlalchemy import Column, String, DateTime, ARRAY, func, Boolean, UUID
+from typing import List
+from sqlalchemy import Column, String, DateTime, ARRAY, func, Boolean, UUID, Float, Integer, ForeignKey
 import uuid
 from app.db.base import Base
+from app.models.city import City  # noqa: F401  registers the cities table for the city_id foreign key
+from app.scrapers.normalization import canonical_categories, normalize_location
 
 class Event(Base):
     __tablename__ = "events"
@@ -9,6 +12,7 @@ class Event(Base):
     title = Column(String, nullable=False)
     date = Column(String, nullable=False)
     location = Column(String, nullable=False)
+    city_id = Column(Integer, ForeignKey("cities.id"), nullable=True, index=True)
     address = Column(String, nullable=True)
     categories = Column(ARRAY(String), nullable=False, default=list)
     price = Column(String, nullable=False, default="Price TBD")
@@ -20,4 +24,18 @@ class Event(Base):
     photos = Column(ARRAY(String), server_default='{}', nullable=True)
     created_at = Column(DateTime, nullable=False, default=func.now())
     updated_at = Column(DateTime, nullable=False, default=func.now(), onupdate=func.now())
-    is_verified = Column(Boolean, nullable=False, default=False)
\ No newline at end of file
+    is_verified = Column(Boolean, nullable=False, default=False)
+    # Filled in at ingest from the offline gazetteer (app.scrapers.geocoding)
+    latitude = Column(Float, nullable=True)
+    longitude = Column(Float, nullable=True)
+    geohash = Column(String, nullable=True)
+
+    # location and categories are the display copies as scraped; these are the
+    # canonical names city_id and the category links were resolved from, for filtering
+    @property
+    def city(self) -> str:
+        return normalize_location(self.location)
+
+    @property
+    def canonical_categories(self) -> List[str]:
+        return canonical_categories(self.categories)
@@ -0,0 +1,11 @@
+from sqlalchemy import Column, String, Date, Integer
+from app.db.base import Base
+
+class EventFacetCount(Base):
+    """Number of events per facet value per event day, maintained by app.db.facets"""
+    __tablename__ = "event_facet_counts"
+
+    facet = Column(String, primary_key=True)
+    value = Column(String, primary_key=True)
+    event_date = Column(Date, primary_key=True)
+    count = Column(Integer, nullable=False, default=0)
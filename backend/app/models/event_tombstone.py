@@ -0,0 +1,9 @@
+from sqlalchemy import Column, String, DateTime, func
+from app.db.base import Base
+
+class EventTombstone(Base):
+    """A deleted event, kept so delta-sync clients learn of the deletion; written by a trigger (app.db.changes)"""
+    __tablename__ = "event_tombstones"
+
+    event_id = Column(String, primary_key=True)
+    removed_at = Column(DateTime, nullable=False, default=func.localtimestamp(), index=True)
@@ -45,6 +45,8 @@ class Club(ClubBase):
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
     is_verified: Optional[bool] = False
+    latitude: Optional[float] = None
+    longitude: Optional[float] = None
 
     class Config:
         from_attributes = True
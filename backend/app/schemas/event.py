@@ -24,6 +24,8 @@ class Event(EventBase):
     id: str
     created_at: datetime
     updated_at: datetime
+    latitude: Optional[float] = None
+    longitude: Optional[float] = None
 
     class Config:
         from_attributes = True 
@@ -40,10 +42,36 @@ class ShowEvent(BaseModel):
     description: Optional[str] = None
     registration_closes: Optional[str] = None
     photos: Optional[List[str]] = []
+    latitude: Optional[float] = None
+    longitude: Optional[float] = None
+    # Canonical names (the facet values) to filter on; location/categories are for display
+    city: Optional[str] = None
+    canonical_categories: List[str] = []
 
     class Config:
         from_attributes = True 
         orm_mode = True  # Enable ORM mode for compatibility with SQLAlchemy models
 
+class NearbyEvent(ShowEvent):
+    distance_km: float
+
+class FacetCount(BaseModel):
+    value: str
+    count: int
+
+class EventFacets(BaseModel):
+    city: List[FacetCount]
+    category: List[FacetCount]
+    month: List[FacetCount]
+    price_band: List[FacetCount]
+
+class EventChanges(BaseModel):
+    cursor: str
+    reset: bool
+    inserted: List[ShowEvent]
+    updated: List[ShowEvent]
+    expired: List[str]
+    deleted: List[str]
+
 class EventSubmission(EventBase):
     recaptcha_token: str
\ No newline at end of file
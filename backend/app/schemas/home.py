@@ -0,0 +1,13 @@
+from pydantic import BaseModel
+from typing import List
+from app.schemas.event import ShowEvent, FacetCount
+from app.schemas.club import Club
+
+class HomePage(BaseModel):
+    events: List[ShowEvent]
+    clubs: List[Club]
+    cities: List[FacetCount]
+    categories: List[FacetCount]
+
+    class Config:
+        from_attributes = True
@@ -0,0 +1,18 @@
+from pydantic import BaseModel
+from typing import List, Literal, Optional
+from app.schemas.event import ShowEvent
+from app.schemas.club import Club
+
+class SearchResult(BaseModel):
+    type: Literal["event", "club"]
+    id: str
+    score: float
+    event: Optional[ShowEvent] = None
+    club: Optional[Club] = None
+
+class SearchResponse(BaseModel):
+    query: str
+    total: int
+    limit: int
+    offset: int
+    results: List[SearchResult]
@@ -1,12 +1,23 @@
 from abc import ABC, abstractmethod
 from typing import List, Dict, Any, Optional
+from urllib.parse import urlsplit
+import json as jsonlib
+import os
+import time
 import aiohttp
 from bs4 import BeautifulSoup
 from app.core.logging_config import get_logger
+from app.core.metrics import SCRAPE_BYTES, SCRAPE_PAGES, SCRAPE_PARSE_SECONDS, SCRAPE_RETRIES
+from .resilience import ScrapeError, classify_error, retry_async
+from .replay import get_archive, request_key
 
 logger = get_logger(__name__)
 
 class BaseScraper(ABC):
+    # Send all upstream traffic to this base URL instead (e.g. a local fake upstream
+    # for benchmarks): https://host/path?q becomes {upstream_url}/host/path?q
+    upstream_url: Optional[str] = os.getenv("SCRAPER_UPSTREAM_URL")
+
     def __init__(self, base_url: str):
         self.base_url = base_url
         self.headers = {
@@ -16,13 +27,26 @@ class BaseScraper(ABC):
             'Connection': 'keep-alive',
         }
         self._session: Optional[aiohttp.ClientSession] = None
+        # Attempts per request; transient errors are retried with jittered backoff
+        self.max_attempts = 3
+        # Failures from the current scrape, so callers can tell "no events" from "upstream down"
+        self.request_errors: List[ScrapeError] = []
+        # Pause between paginated requests, to be polite to the upstream
+        self.page_delay = 0.5
         logger.debug(f"BaseScraper initialized for URL: {base_url}")
 
+    @property
+    def source_name(self) -> str:
+        """Source label used for caching, scheduling and metrics"""
+        return self.__class__.__name__.replace('Scraper', '').replace('API', '')
+
     async def get_session(self) -> aiohttp.ClientSession:
         """Get or create an aiohttp session."""
         if self._session is None or self._session.closed:
             logger.debug("Creating new aiohttp ClientSession.")
-            timeout = aiohttp.ClientTimeout(total=30)
+            # A short connect budget makes an unreachable upstream fail in seconds per
+            # attempt; total still bounds slow but live responses
+            timeout = aiohttp.ClientTimeout(total=30, connect=5, sock_connect=5, sock_read=20)
             self._session = aiohttp.ClientSession(headers=self.headers, timeout=timeout)
         else:
             logger.debug("Reusing existing aiohttp ClientSession.")
@@ -36,25 +60,82 @@ class BaseScraper(ABC):
         else:
             logger.debug("aiohttp ClientSession already closed or does not exist.")
 
+    async def request(
+        self,
+        url: str,
+        method: str = "GET",
+        params: Optional[Dict[str, Any]] = None,
+        json: Optional[Any] = None,
+        headers: Optional[Dict[str, str]] = None,
+        as_json: bool = False,
+        ssl: bool = True,
+    ) -> Any:
+        """
+        Send a request through the shared session, retrying transient errors.
+        Returns the response text (or decoded JSON if `as_json`), and raises a
+        ScrapeError once retries are exhausted or the error is fatal.
+
+        With SCRAPER_REPLAY_MODE=record responses are also saved to the scrape
+        archive; with =replay they are served from it and nothing hits the network.
+        """
+        source = self.source_name
+        archive = get_archive()
+        key = request_key(method, url, params, json) if archive is not None else None
+        target = url
+        if self.upstream_url:
+            parts = urlsplit(url)
+            target = f"{self.upstream_url.rstrip('/')}/{parts.netloc}{parts.path}" + (f"?{parts.query}" if parts.query else "")
+        attempts_made = 0
+
+        async def attempt():
+            nonlocal attempts_made
+            attempts_made += 1
+            if attempts_made > 1:
+                SCRAPE_RETRIES.labels(source).inc()
+            try:
+                session = await self.get_session()
+                start = time.perf_counter()
+                async with session.request(method, target, params=params, json=json, headers=headers,
+                                           allow_redirects=True, ssl=ssl) as response:
+                    response.raise_for_status()
+                    logger.debug(f"Fetched {target} with status {response.status}")
+                    text = await response.text()
+                    if archive is not None:
+                        archive.record(key, method, url, response.status, text, (time.perf_counter() - start) * 1000)
+                    return text
+            except Exception as e:
+                raise classify_error(e) from e
+
+        try:
+            if archive is not None and archive.mode == "replay":
+                text = await archive.replay(key, url)
+            else:
+                text = await retry_async(attempt, attempts=self.max_attempts, description=f"{method} {url}")
+            SCRAPE_PAGES.labels(source).inc()
+            SCRAPE_BYTES.labels(source).inc(len(text.encode()))
+            if not as_json:
+                return text
+            try:
+                with SCRAPE_PARSE_SECONDS.labels(source).time():
+                    return jsonlib.loads(text)
+            except ValueError as e:
+                raise classify_error(e) from e
+        except ScrapeError as e:
+            self.request_errors.append(e)
+            raise
+
     async def fetch_page(self, url: str) -> str:
-        """Fetch page content asynchronously."""
+        """Fetch page content asynchronously. Returns "" on failure; see request_errors."""
         logger.debug(f"Fetching page: {url}")
         try:
-            session = await self.get_session()
-            async with session.get(url, allow_redirects=True, ssl=False) as response:
-                response.raise_for_status()
-                logger.info(f"Successfully fetched {url} with status {response.status}")
-                return await response.text()
-        except aiohttp.ClientResponseError as e:
-            logger.error(f"HTTP error fetching {url}: Status {e.status}, Message: {e.message}", exc_info=True)
-            return ""
-        except aiohttp.ClientError as e:
-            logger.error(f"Client error fetching {url}: {e}", exc_info=True)
-            return ""
-        except Exception as e:
-            logger.error(f"Unexpected error fetching {url}: {e}", exc_info=True)
+            return await self.request(url, ssl=False)
+        except ScrapeError as e:
+            logger.error(f"Error fetching {url}: {e}")
             return ""
 
+    def reset_errors(self) -> None:
+        self.request_errors = []
+
     @abstractmethod
     async def scrape_events(self) -> List[Dict[str, Any]]:
         """
@@ -72,9 +153,12 @@ class BaseScraper(ABC):
         """
         pass
 
-    def parse_html(self, html: str) -> BeautifulSoup:
-        """Parse HTML content using BeautifulSoup with lxml parser."""
-        return BeautifulSoup(html, 'lxml')
+    def parse_html(self, html: str, parser: str = 'lxml') -> BeautifulSoup:
+        """Parse HTML content using BeautifulSoup (lxml parser by default)."""
+        start = time.perf_counter()
+        soup = BeautifulSoup(html, parser)
+        SCRAPE_PARSE_SECONDS.labels(self.source_name).observe(time.perf_counter() - start)
+        return soup
 
     async def __aenter__(self):
         """Support for async context manager."""
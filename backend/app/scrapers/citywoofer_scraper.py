@@ -1,11 +1,10 @@
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any
 from .base_scraper import BaseScraper
+from .resilience import ScrapeError
+from .extraction import extract_categories, format_date
 # from bs4 import BeautifulSoup # Not used
-import json
-import re
-import aiohttp # Keep for direct usage if BaseScraper session is not suitable
+import asyncio
 from app.core.logging_config import get_logger # Import the new logger
-from datetime import datetime
 
 logger = get_logger(__name__) # Use the new logger
 
@@ -30,83 +29,75 @@ class CityWooferScraper(BaseScraper):
         
         logger.info(f"Starting event scraping for {source_name} across {len(cities_to_scrape)} cities.")
 
-        # Create a single session for all API calls to these cities for efficiency
-        # BaseScraper.get_session() might be for HTML, API needs specific headers
-        async with aiohttp.ClientSession(headers=self.api_headers) as session:
-            for city in cities_to_scrape:
-                logger.info(f"Fetching events for city: {city.title()} from {source_name}.")
-                api_url = f"{self.base_url}/api/events/search"
-                params = {
-                    'q': 'run marathon race 5k 10k half full ultra', # Broader search query
-                    'city': city,
-                    'category': 'sports', # Sports category usually includes runs
-                    'limit': 50, # Maximize events per city
-                    'offset': 0
-                }
-                
-                try:
-                    async with session.get(api_url, params=params, timeout=30) as response:
-                        response.raise_for_status() # Raise an exception for HTTP errors
+        # API requests share the BaseScraper session; CityWoofer's JSON headers are sent per request
+        for city in cities_to_scrape:
+            logger.info(f"Fetching events for city: {city.title()} from {source_name}.")
+            api_url = f"{self.base_url}/api/events/search"
+            params = {
+                'q': 'run marathon race 5k 10k half full ultra', # Broader search query
+                'city': city,
+                'category': 'sports', # Sports category usually includes runs
+                'limit': 50, # Maximize events per city
+                'offset': 0
+            }
+            
+            try:
+                data = await self.request(api_url, params=params, headers=self.api_headers, as_json=True)
+                if 'events' in data and data['events']:
+                    logger.info(f"Received {len(data['events'])} event items for {city.title()} from {source_name} API.")
+                    for i, event_data in enumerate(data['events']):
                         try:
-                            data = await response.json()
-                            if 'events' in data and data['events']:
-                                logger.info(f"Received {len(data['events'])} event items for {city.title()} from {source_name} API.")
-                                for i, event_data in enumerate(data['events']):
-                                    title = event_data.get('title', 'Title Not Found').strip()
-                                    logger.debug(f"Processing event {i+1}/{len(data['events'])}: '{title}' in {city.title()}")
-                                    
-                                    # Filter for running events more reliably
-                                    if not self._is_running_event(title, event_data.get('description', '')):
-                                        logger.debug(f"Skipping non-running event: '{title}'.")
-                                        continue
-                                        
-                                    parsed_date = self._parse_cw_date(event_data.get('start_date'))
-                                    venue_info = event_data.get('venue', {})
-                                    location_str = f"{venue_info.get('name', '').strip()}, {city.title()}".strip(", ")
-                                    if not venue_info.get('name'): location_str = city.title()
+                            title = event_data.get('title', 'Title Not Found').strip()
+                            logger.debug(f"Processing event {i+1}/{len(data['events'])}: '{title}' in {city.title()}")
+                            
+                            # Filter for running events more reliably
+                            if not self._is_running_event(title, event_data.get('description', '')):
+                                logger.debug(f"Skipping non-running event: '{title}'.")
+                                continue
+                                
+                            parsed_date = format_date(event_data.get('start_date'))
+                            venue_info = event_data.get('venue', {})
+                            location_str = f"{venue_info.get('name', '').strip()}, {city.title()}".strip(", ")
+                            if not venue_info.get('name'): location_str = city.title()
 
-                                    categories = ["Running"] # Default category
-                                    extracted_cats = self._extract_categories_from_title(title)
-                                    if extracted_cats: categories.extend(extracted_cats)
-                                    else: categories.append("Fun Run") # Fallback if no specific distance
-                                    categories = list(set(categories)) # Unique categories
-                                        
-                                    event_url = event_data.get('url') or f"{self.base_url}/e/{event_data.get('slug')}"
-                                    description = await self._fetch_event_details(event_url) if event_url else event_data.get('short_description','')
+                            categories = ["Running"] # Default category
+                            extracted_cats = extract_categories(title)
+                            if extracted_cats: categories.extend(extracted_cats)
+                            else: categories.append("Fun Run") # Fallback if no specific distance
+                            categories = list(set(categories)) # Unique categories
+                                
+                            event_url = event_data.get('url') or f"{self.base_url}/e/{event_data.get('slug')}"
+                            description = await self._fetch_event_details(event_url) if event_url else event_data.get('short_description','')
 
-                                    event_dict = {
-                                        'title': title,
-                                        'date': parsed_date,
-                                        'location': location_str,
-                                        'address': venue_info.get('address', None), # Add address if available
-                                        'categories': categories,
-                                        'price': f"₹{event_data.get('price_starts_at', 'TBD')}",
-                                        'url': event_url,
-                                        'source': source_name,
-                                        'description': description.strip(),
-                                        'photos': event_data.get('photos') # Capture image URL
-                                    }
-                                    
-                                    # Add event if URL is unique to avoid duplicates from different city searches for same event
-                                    if not any(e['url'] == event_dict['url'] for e in all_scraped_events):
-                                        all_scraped_events.append(event_dict)
-                                        logger.debug(f"Added event: '{title}' from {city.title()}.")
-                                    else:
-                                        logger.debug(f"Duplicate event URL skipped: '{title}' ({event_url}).")
+                            event_dict = {
+                                'title': title,
+                                'date': parsed_date,
+                                'location': location_str,
+                                'address': venue_info.get('address', None), # Add address if available
+                                'categories': categories,
+                                'price': f"₹{event_data.get('price_starts_at', 'TBD')}",
+                                'url': event_url,
+                                'source': source_name,
+                                'description': description.strip(),
+                                'photos': event_data.get('photos') # Capture image URL
+                            }
+                            
+                            # Add event if URL is unique to avoid duplicates from different city searches for same event
+                            if not any(e['url'] == event_dict['url'] for e in all_scraped_events):
+                                all_scraped_events.append(event_dict)
+                                logger.debug(f"Added event: '{title}' from {city.title()}.")
                             else:
-                                logger.info(f"No events found for {city.title()} in API response or 'events' key missing/empty.")
-                        except json.JSONDecodeError as e_json:
-                            logger.error(f"Invalid JSON response from {api_url} for city {city.title()}: {e_json}. Response text: {await response.text()[:200]}")
-                        except aiohttp.ClientResponseError as e_http:
-                             logger.error(f"HTTP error for {city.title()} from {api_url}: {e_http.status} - {e_http.message}", exc_info=True)
+                                logger.debug(f"Duplicate event URL skipped: '{title}' ({event_url}).")
                         except Exception as e_parse: # Catch other parsing errors
                             logger.error(f"Error parsing event data for '{event_data.get('title')}' in {city.title()}: {e_parse}", exc_info=True)
-                except aiohttp.ClientError as e_client: # Catch client-side network errors
-                    logger.error(f"Client error fetching events for city {city.title()} from {source_name}: {e_client}", exc_info=True)
-                except Exception as e_city: # Catch any other errors for a specific city
-                    logger.error(f"General error fetching events for city {city.title()} from {source_name}: {e_city}", exc_info=True)
-                await asyncio.sleep(0.5) # Be polite to the API
-                    
+                else:
+                    logger.info(f"No events found for {city.title()} in API response or 'events' key missing/empty.")
+            except ScrapeError as e_request: # Retries already exhausted, or a non-retryable error
+                logger.error(f"Error fetching events for city {city.title()} from {source_name}: {e_request}")
+            except Exception as e_city: # Catch any other errors for a specific city
+                logger.error(f"General error fetching events for city {city.title()} from {source_name}: {e_city}", exc_info=True)
+            await asyncio.sleep(self.page_delay) # Be polite to the API
+                
         logger.info(f"Finished scraping {source_name}. Total unique events found: {len(all_scraped_events)}.")
         return all_scraped_events
 
@@ -122,46 +113,6 @@ class CityWooferScraper(BaseScraper):
             return True
         return False
 
-    def _parse_cw_date(self, date_str: Optional[str]) -> str:
-        """Parse CityWoofer date string (e.g., '2023-10-28') to 'dd Mon YYYY'."""
-        if not date_str:
-            return "Date TBD"
-        try:
-            # Common format from CityWoofer seems to be YYYY-MM-DD
-            dt_object = datetime.strptime(date_str, "%Y-%m-%d")
-            return dt_object.strftime("%d %b %Y")
-        except ValueError:
-            logger.warning(f"Could not parse CityWoofer date: '{date_str}'. Trying other formats.")
-            # Try to handle if it's already in a different common format or includes time
-            try:
-                dt_object = datetime.fromisoformat(date_str.replace('Z', '+00:00'))
-                return dt_object.strftime("%d %b %Y")
-            except ValueError:
-                logger.error(f"Failed to parse CityWoofer date string '{date_str}' with multiple formats.")
-                return "Date TBD"
-
-    def _extract_categories_from_title(self, title: str) -> List[str]:
-        """Extracts potential running categories/distances from event title."""
-        categories = []
-        title_lower = title.lower()
-        # More specific patterns first
-        distance_patterns = {
-            "Half Marathon": [r"half marathon", r"21k", r"21\.1k", r"13\.1\s*miles"],
-            "Full Marathon": [r"full marathon", r"marathon", r"42k", r"42\.2k", r"26\.2\s*miles"],
-            "10K Run": [r"10k", r"10\s*km", r"10000m"],
-            "5K Run": [r"5k", r"5\s*km", r"5000m"],
-            "Ultra Marathon": [r"ultra marathon", r"ultra run", r"50k", r"100k"],
-            "3K Run": [r"3k", r"3\s*km"],
-            "Trail Run": [r"trail run"],
-        }
-        for cat, patterns in distance_patterns.items():
-            for p in patterns:
-                if re.search(p, title_lower):
-                    categories.append(cat)
-                    # Once a major category like "Half Marathon" is found, we might not need to add "10k" if it was part of its name.
-                    # However, some events list multiple distances, so allow multiple categories.
-        return list(set(categories)) # Return unique categories found
-
     async def _fetch_event_details(self, event_url: str) -> str:
         """Fetch detailed description from the event's page using BaseScraper.fetch_page."""
         if not event_url or not event_url.startswith("http"):
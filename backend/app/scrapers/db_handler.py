@@ -1,58 +1,78 @@
 from sqlalchemy.orm import Session
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Union
 from app.models.event import Event
-from datetime import datetime
-import uuid
+from app.scrapers.ingest import EventRecord, validate_events
+from app.scrapers.geocoding import geocode_fields
+from app.core.cache_bus import EVENTS, publish
+from app.db.facets import apply_facet_delta, snapshot_facets
+from app.db.snapshot import refresh_snapshot
+from app.db.taxonomy import assign_city_ids, link_categories
+from sqlalchemy import func
 
 class EventDBHandler:
     def __init__(self, db: Session):
         self.db = db
 
-    def upsert_events(self, events: List[Dict[str, Any]]) -> List[Event]:
+    def upsert_events(self, events: List[Union[EventRecord, Dict[str, Any]]]) -> List[Event]:
         """
         Upsert events into the database.
         If an event with the same URL exists, update it.
         Otherwise, create a new event.
+        Raw scraper dicts go through the ingest stage first, so only valid
+        events and known columns reach the model.
         """
+        records = [e for e in events if isinstance(e, EventRecord)]
+        raw = [e for e in events if not isinstance(e, EventRecord)]
+        if raw:
+            records += validate_events(raw)[0]
+
         result = []
-        for event_data in events:
-            # Process UUID fields
-            if 'id' in event_data:
-                # Convert string UUID to UUID object if it's a string
-                if isinstance(event_data['id'], str):
-                    try:
-                        event_data['id'] = uuid.UUID(event_data['id'])
-                    except ValueError:
-                        # Generate a new UUID if the string is not a valid UUID
-                        event_data['id'] = uuid.uuid4()
-                # If id is missing or None, generate a new UUID
-                elif event_data['id'] is None:
-                    event_data['id'] = uuid.uuid4()
-            else:
-                # Generate a new UUID if no id is provided
-                event_data['id'] = uuid.uuid4()
-            
+        replaced = []
+        rows = []
+        for record in records:
             # Check if event exists
-            existing_event = self.db.query(Event).filter(Event.url == event_data['url']).first()
-            
+            existing_event = self.db.query(Event).filter(Event.url == record.url).first()
+            if existing_event:
+                replaced.append(snapshot_facets(existing_event))
+                # Only what the scraper supplied: a re-scrape without photos, a description
+                # or an address keeps the stored ones. Geocoding needs the merged location.
+                event_data = {"location": existing_event.location, "address": existing_event.address, **record.changes()}
+            else:
+                event_data = record.to_dict()
+            event_data.update(geocode_fields(event_data.get('location'), event_data.get('address')))
+            rows.append((existing_event, event_data))
+        # City ids, resolved once per batch; the location strings are kept as scraped
+        assign_city_ids(self.db, [event_data for _, event_data in rows])
+
+        for existing_event, event_data in rows:
             if existing_event:
                 # Update existing event
                 for key, value in event_data.items():
-                    if key != 'id':  # Don't update the primary key
-                        setattr(existing_event, key, value)
-                existing_event.updated_at = datetime.now()
+                    setattr(existing_event, key, value)
+                # Database clock, like created_at; delta sync cursors compare against it
+                existing_event.updated_at = func.now()
                 result.append(existing_event)
             else:
                 # Create new event
                 new_event = Event(**event_data)
                 self.db.add(new_event)
                 result.append(new_event)
+
+        # Category links and the facet summary change in the same transaction as the events
+        self.db.flush()
+        link_categories(self.db, [{"id": e.id, "categories": e.categories} for e in result])
+        apply_facet_delta(self.db, added=[snapshot_facets(e) for e in result], removed=replaced)
+        # API workers drop their cached event responses once this commits
+        publish(self.db, EVENTS)
         
         try:
             self.db.commit()
         except Exception as e:
             self.db.rollback()
             raise e
+
+        # Republish the static events snapshot from the committed data
+        refresh_snapshot(self.db)
             
         return result 
 
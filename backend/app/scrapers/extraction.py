@@ -0,0 +1,271 @@
+"""
+Shared date, price and category extraction for all scrapers.
+
+Every pattern is compiled once at import. Date formats are a single
+alternation, so one regex pass finds the first date in a string whatever
+its format; parsed results for short strings (card and field values, which
+repeat across pages and runs) are memoized by the raw string.
+"""
+import re
+from datetime import date, datetime
+from functools import lru_cache
+from typing import List, Optional
+
+DATE_FORMAT = "%d %b %Y"
+DATE_TBD = "Date TBD"
+PRICE_TBD = "Price TBD"
+
+MONTHS = {
+    "jan": 1, "january": 1, "feb": 2, "february": 2, "mar": 3, "march": 3,
+    "apr": 4, "april": 4, "may": 5, "jun": 6, "june": 6, "jul": 7, "july": 7,
+    "aug": 8, "august": 8, "sep": 9, "sept": 9, "september": 9, "oct": 10, "october": 10,
+    "nov": 11, "november": 11, "dec": 12, "december": 12,
+}
+_MONTH = r"(?<![a-z])(?:" + "|".join(sorted(MONTHS, key=len, reverse=True)) + r")\b\.?"
+_ORD = r"(?:st|nd|rd|th)?"
+_TO = r"\s*(?:-|–|—|to|till|until)\s*"
+# The end day of a range within one month ("15 - 16 March"); the start day is the date
+_DAY_RANGE = rf"(?:{_TO}\d{{1,2}}{_ORD})?"
+
+# Alternatives are tried left to right at each position, so the formats with
+# a year come before their year-less forms
+DATE_PATTERN = re.compile(
+    rf"(?P<d1>\d{{1,2}}){_ORD}{_DAY_RANGE}[\s\-]+(?P<m1>{_MONTH}),?[\s\-]+(?P<y1>\d{{4}})"  # 31 May 2024, 31-May-2024, 15 - 16 May 2024
+    rf"|(?P<m2>{_MONTH})\s+(?P<d2>\d{{1,2}}){_ORD}{_DAY_RANGE},?\s*(?P<y2>\d{{4}})"         # May 31, 2024, May 15-16, 2024
+    r"|(?P<y3>\d{4})(?P<s3>[-/.])(?P<mo3>\d{1,2})(?P=s3)(?P<d3>\d{1,2})"                     # 2024-05-31(T06:00...), 2024/05/31
+    r"|(?P<d4>\d{1,2})(?P<s4>[/.\-])(?P<mo4>\d{1,2})(?P=s4)(?P<y4>\d{4})"                    # 31/05/2024, 31-05-2024
+    rf"|(?P<m7>{_MONTH}),?\s+(?P<y7>\d{{4}})\b"                                             # Dec 2025 (the 1st)
+    rf"|(?P<d5>\d{{1,2}}){_ORD}{_DAY_RANGE}\s+(?P<m5>{_MONTH})"                              # 31 May
+    rf"|(?P<m6>{_MONTH})\s+(?P<d6>\d{{1,2}}){_ORD}\b",                                       # May 31
+    re.IGNORECASE,
+)
+_YEAR_GROUPS = ("y1", "y2", "y3", "y4", "y7")
+# Between the year-less start of a range and its dated end: "May 31 - Jun 2, 2024"
+_RANGE_SEPARATOR = re.compile(_TO, re.IGNORECASE)
+_TBD = {"", "tbd", "tba", "date tbd", "date tba"}
+_MAX_CACHED = 200
+
+PRICE_PATTERN = re.compile(
+    r"(?:₹|rs\.?|inr)\s*(?P<a>\d[\d,]*(?:\s*-\s*\d[\d,]*)?)"
+    r"|(?P<b>\d[\d,]*)\s*(?:inr|rs\b\.?|₹)"
+    r"|fee[:\-\s]*(?P<c>\d[\d,]*)",
+    re.IGNORECASE,
+)
+_PRICE_CHARS = re.compile(r"[^\d\-,.]+")
+_AMOUNT = re.compile(r"\d[\d,]*(?:\.\d+)?")
+_FREE = re.compile(r"\bfree\b", re.IGNORECASE)
+
+# Category rules as one alternation; names are the ones normalize_category
+# produces. Longer distances are listed first so "half marathon" is not also
+# a "marathon"
+_CATEGORY_GROUPS = {
+    "half": "Half Marathon",
+    "ultra": "Ultra Marathon",
+    "full": "Marathon",
+    "k10": "10K",
+    "k5": "5K",
+    "k3": "3K",
+    "fun": "Fun Run",
+    "women": "Women's Run",
+    "corporate": "Corporate Run",
+    "trail": "Trail Run",
+    "night": "Night Run",
+    "relay": "Relay",
+    "virtual": "Virtual Run",
+}
+_D = r"(?<![\d.])"
+CATEGORY_PATTERN = re.compile(
+    rf"(?P<half>half\s*marathon|{_D}21(?:\.1)?\s*k(?:m|ilometers?)?\b|{_D}13\.1\s*miles)"
+    rf"|(?P<ultra>ultra\s*marathon|ultramarathon|ultra|{_D}(?:50|100)\s*k(?:m|ilometers?)?\b)"
+    rf"|(?P<full>(?:full\s*)?marathon|{_D}42(?:\.2)?\s*k(?:m|ilometers?)?\b|{_D}26\.2\s*miles)"
+    rf"|(?P<k10>{_D}10\s*k(?:m|ilometers?)?\b|{_D}10000\s*m\b)"
+    rf"|(?P<k5>{_D}5\s*k(?:m|ilometers?)?\b|{_D}5000\s*m\b)"
+    rf"|(?P<k3>{_D}3\s*k(?:m|ilometers?)?\b)"
+    r"|(?P<fun>fun\s*(?:run|race))"
+    r"|(?P<women>women'?s?\s*(?:run|race)|shero)"
+    r"|(?P<corporate>corporate\s*(?:run|race))"
+    r"|(?P<trail>trail\s*(?:run|race))"
+    r"|(?P<night>night\s*(?:run|race))"
+    r"|(?P<relay>relay)"
+    r"|(?P<virtual>virtual\s*(?:run|race))",
+    re.IGNORECASE,
+)
+DISTANCE_PATTERN = re.compile(r"(\d+(?:\.\d+)?)\s*(?:k|km|kilometers?)\b", re.IGNORECASE)
+
+TERRAIN_PATTERN = re.compile(
+    r"\b(?:(?P<Trail>trail|mountain|hill|forest|jungle)|(?P<Mixed>mixed|cross[\s-]country)"
+    r"|(?P<Track>track)|(?P<Road>road|street|highway))",
+    re.IGNORECASE,
+)
+AMENITIES = [
+    "water station", "aid station", "medical support", "ambulance",
+    "parking", "toilet", "restroom", "bathroom", "changing room",
+    "refreshment", "energy drink", "recovery zone", "physio",
+    "timing chip", "medal", "t-shirt", "certificate", "goodie bag",
+    "baggage counter", "locker", "shower", "massage", "stretching area",
+]
+AMENITY_PATTERN = re.compile(r"\b(" + "|".join(re.escape(a) for a in AMENITIES) + r")\b", re.IGNORECASE)
+START_TIME_PATTERN = re.compile(r"Start\s*Time\s*[:\-]?\s*([0-9:apmAPM ]+)", re.IGNORECASE)
+CUT_OFF_PATTERN = re.compile(r"Cut[- ]?off\s*[:\-]?\s*([0-9:apmAPM ]+)", re.IGNORECASE)
+ELEVATION_PATTERN = re.compile(r"Elevation\s*(?:Gain)?\s*[:\-]?\s*(\d+(?:\.\d+)?\s*(?:m|meters?|ft|feet))\b", re.IGNORECASE)
+
+
+# --- Dates -------------------------------------------------------------------
+
+def _has_year(match: "re.Match[str]") -> bool:
+    return any(match.group(name) for name in _YEAR_GROUPS)
+
+
+def _range_end(text: str, match: "re.Match[str]", today: date) -> Optional[date]:
+    """The dated end of a range starting with `match`, as in "May 31 - Jun 2, 2024"."""
+    separator = _RANGE_SEPARATOR.match(text, match.end())
+    if not separator:
+        return None
+    end = DATE_PATTERN.match(text, separator.end())
+    return _date_from_match(end, today, text) if end and _has_year(end) else None
+
+
+def _date_from_match(match: "re.Match[str]", today: date, text: str = "") -> Optional[date]:
+    g = match.groupdict()
+    try:
+        if g["d1"]:
+            return date(int(g["y1"]), MONTHS[g["m1"].lower().rstrip(".")], int(g["d1"]))
+        if g["m2"]:
+            return date(int(g["y2"]), MONTHS[g["m2"].lower().rstrip(".")], int(g["d2"]))
+        if g["y3"]:
+            return date(int(g["y3"]), int(g["mo3"]), int(g["d3"]))
+        if g["d4"]:
+            day, month = int(g["d4"]), int(g["mo4"])
+            if month > 12:  # 05/31/2024
+                day, month = month, day
+            return date(int(g["y4"]), month, day)
+        if g["m7"]:
+            return date(int(g["y7"]), MONTHS[g["m7"].lower().rstrip(".")], 1)
+        day, month = (g["d5"], g["m5"]) if g["d5"] else (g["d6"], g["m6"])
+        day, month = int(day), MONTHS[month.lower().rstrip(".")]
+        # The year of a range's dated end, or the year before if the range spans New Year
+        end = _range_end(text, match, today) if text else None
+        if end:
+            start = date(end.year, month, day)
+            return start if start <= end else date(end.year - 1, month, day)
+        # No year at all: the next occurrence of that day, today included
+        parsed = date(today.year, month, day)
+        return parsed if parsed >= today else parsed.replace(year=today.year + 1)
+    except ValueError:
+        return None
+
+
+@lru_cache(maxsize=4096)
+def _parse_date_cached(raw: str, today: date) -> Optional[date]:
+    return find_date(raw, today)
+
+
+def parse_date(raw: Optional[str]) -> Optional[date]:
+    """
+    The first date in a short string such as a card's date field ("31st May
+    2024", "May 31 - Jun 2, 2024", "15 - 16 March 2025", "2024-05-31T06:00:00Z",
+    "2025/04/05", "31/05/2024", "Dec 2025", "31 May"), or None for
+    TBD/unparseable values. Ranges give their start date; a month alone gives
+    its 1st. Memoized per raw string and day.
+    """
+    if not raw or raw.strip().lower() in _TBD:
+        return None
+    if len(raw) > _MAX_CACHED:
+        return find_date(raw)
+    return _parse_date_cached(raw, date.today())
+
+
+def find_date(text: str, today: Optional[date] = None, require_year: bool = False) -> Optional[date]:
+    """
+    The first valid date anywhere in `text`. Use `require_year` on whole
+    pages, where a bare "5 May" is more likely noise than the event date.
+    """
+    today = today or date.today()
+    for match in DATE_PATTERN.finditer(text):
+        if require_year and (match.group("m7") or not (_has_year(match) or _range_end(text, match, today))):
+            # A bare "5 May" or "May 2024" on a whole page is more likely noise than the event date
+            continue
+        parsed = _date_from_match(match, today, text)
+        if parsed:
+            return parsed
+    return None
+
+
+def format_date(raw: Optional[str], default: str = DATE_TBD) -> str:
+    """`raw` as "%d %b %Y" (the format events store), or `default`."""
+    parsed = parse_date(raw)
+    return parsed.strftime(DATE_FORMAT) if parsed else default
+
+
+def format_timestamp(value: Optional[float]) -> str:
+    """A Unix timestamp as a stored event date."""
+    if value in (None, ""):
+        return DATE_TBD
+    return datetime.fromtimestamp(int(value)).strftime(DATE_FORMAT)
+
+
+# --- Prices ------------------------------------------------------------------
+
+def find_price(text: str) -> Optional[str]:
+    """First rupee amount or range in free text as "₹1500" / "₹500-1000", "Free", or None."""
+    match = PRICE_PATTERN.search(text)
+    if match:
+        value = (match.group("a") or match.group("b") or match.group("c")).replace(",", "").replace(" ", "")
+        return f"₹{value}"
+    if _FREE.search(text):
+        return "Free"
+    return None
+
+
+@lru_cache(maxsize=4096)
+def clean_price(raw: Optional[str]) -> str:
+    """A price field ("Rs. 1,500 onwards", "₹ 999") as "₹1,500", or Price TBD."""
+    if not raw:
+        return PRICE_TBD
+    if _FREE.search(raw) and not _AMOUNT.search(raw):
+        return "Free"
+    cleaned = _PRICE_CHARS.sub("", raw).strip("-,.")
+    return f"₹{cleaned}" if cleaned else PRICE_TBD
+
+
+def price_amounts(price: Optional[str]) -> List[float]:
+    """Every amount in a price string: "₹1,200 - ₹2,500" -> [1200.0, 2500.0]."""
+    return [float(n.replace(",", "")) for n in _AMOUNT.findall(price or "")]
+
+
+# --- Categories and details --------------------------------------------------
+
+@lru_cache(maxsize=4096)
+def _categories_cached(text: str) -> List[str]:
+    found = {_CATEGORY_GROUPS[m.lastgroup] for m in CATEGORY_PATTERN.finditer(text)}
+    if not found:
+        distance = DISTANCE_PATTERN.search(text)
+        if distance:
+            km = float(distance.group(1))
+            for minimum, category in ((42, "Marathon"), (21, "Half Marathon"), (10, "10K"), (5, "5K"), (3, "3K")):
+                if km >= minimum:
+                    found.add(category)
+                    break
+    return sorted(found)
+
+
+def extract_categories(*texts: Optional[str]) -> List[str]:
+    """Race categories named in a title/description, e.g. ["10K", "Half Marathon"]."""
+    text = " ".join(t for t in texts if t)
+    if len(text) > _MAX_CACHED:
+        return _categories_cached.__wrapped__(text)
+    return list(_categories_cached(text))
+
+
+def extract_terrain(text: str, default: Optional[str] = None) -> Optional[str]:
+    match = TERRAIN_PATTERN.search(text)
+    return match.lastgroup if match else default
+
+
+def extract_amenities(text: str) -> List[str]:
+    return sorted({m.group(1).lower().title() for m in AMENITY_PATTERN.finditer(text)})
+
+
+def extract_first(pattern: "re.Pattern[str]", text: str) -> Optional[str]:
+    match = pattern.search(text)
+    return match.group(1).strip() if match else None
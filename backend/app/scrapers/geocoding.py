@@ -0,0 +1,286 @@
+"""
+Offline geocoding for event and club locations.
+
+Locations are free-text city names (normalized by normalize_location) and
+optional street addresses, so a small gazetteer of Indian cities and the
+localities events are usually held in is enough; no network lookups.
+"""
+import math
+import re
+from functools import lru_cache
+from typing import Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
+from app.scrapers.normalization import CITY_MAP
+
+GEOHASH_PRECISION = 7  # ~150m cells
+_BASE32 = "0123456789bcdefghjkmnpqrstuvwxyz"
+EARTH_RADIUS_KM = 6371.0
+
+
+class Place(NamedTuple):
+    name: str
+    city: str
+    latitude: float
+    longitude: float
+
+
+# City centres for every city normalize_location produces, plus other cities
+# with regular running events
+CITY_COORDINATES: Dict[str, Tuple[float, float]] = {
+    "Delhi": (28.6139, 77.2090),
+    "Gurgaon": (28.4595, 77.0266),
+    "Noida": (28.5355, 77.3910),
+    "Mumbai": (19.0760, 72.8777),
+    "Pune": (18.5204, 73.8567),
+    "Bangalore": (12.9716, 77.5946),
+    "Chennai": (13.0827, 80.2707),
+    "Kolkata": (22.5726, 88.3639),
+    "Hyderabad": (17.3850, 78.4867),
+    "Ahmedabad": (23.0225, 72.5714),
+    "Jaipur": (26.9124, 75.7873),
+    "Lucknow": (26.8467, 80.9462),
+    "Chandigarh": (30.7333, 76.7794),
+    "Kochi": (9.9312, 76.2673),
+    "Indore": (22.7196, 75.8577),
+    "Bhopal": (23.2599, 77.4126),
+    "Goa": (15.4909, 73.8278),
+    "Faridabad": (28.4089, 77.3178),
+    "Ghaziabad": (28.6692, 77.4538),
+    "Surat": (21.1702, 72.8311),
+    "Vadodara": (22.3072, 73.1812),
+    "Nagpur": (21.1458, 79.0882),
+    "Nashik": (19.9975, 73.7898),
+    "Lonavala": (18.7546, 73.4062),
+    "Coimbatore": (11.0168, 76.9558),
+    "Mysore": (12.2958, 76.6394),
+    "Mangalore": (12.9141, 74.8560),
+    "Ooty": (11.4102, 76.6950),
+    "Madurai": (9.9252, 78.1198),
+    "Thiruvananthapuram": (8.5241, 76.9366),
+    "Visakhapatnam": (17.6868, 83.2185),
+    "Vijayawada": (16.5062, 80.6480),
+    "Bhubaneswar": (20.2961, 85.8245),
+    "Guwahati": (26.1445, 91.7362),
+    "Patna": (25.5941, 85.1376),
+    "Ranchi": (23.3441, 85.3096),
+    "Raipur": (21.2514, 81.6296),
+    "Kanpur": (26.4499, 80.3319),
+    "Varanasi": (25.3176, 82.9739),
+    "Agra": (27.1767, 78.0081),
+    "Dehradun": (30.3165, 78.0322),
+    "Rishikesh": (30.0869, 78.2676),
+    "Shimla": (31.1048, 77.1734),
+    "Manali": (32.2432, 77.1892),
+    "Leh": (34.1526, 77.5771),
+    "Amritsar": (31.6340, 74.8723),
+    "Ludhiana": (30.9010, 75.8573),
+    "Udaipur": (24.5854, 73.7125),
+}
+
+# Spellings not covered by CITY_MAP
+CITY_ALIASES = {
+    "calcutta": "Kolkata",
+    "madras": "Chennai",
+    "trivandrum": "Thiruvananthapuram",
+    "vizag": "Visakhapatnam",
+    "mysuru": "Mysore",
+    "mangaluru": "Mangalore",
+    "baroda": "Vadodara",
+    "panjim": "Goa",
+    "panaji": "Goa",
+}
+
+# Localities, as (name, city, latitude, longitude); more specific than a city match
+LOCALITIES = [
+    ("Thane", "Mumbai", 19.2183, 72.9781),
+    ("Navi Mumbai", "Mumbai", 19.0330, 73.0297),
+    ("Kharghar", "Mumbai", 19.0473, 73.0700),
+    ("Andheri", "Mumbai", 19.1136, 72.8697),
+    ("Bandra", "Mumbai", 19.0596, 72.8295),
+    ("Bandra Kurla Complex", "Mumbai", 19.0674, 72.8679),
+    ("BKC", "Mumbai", 19.0674, 72.8679),
+    ("Powai", "Mumbai", 19.1176, 72.9060),
+    ("Juhu", "Mumbai", 19.1075, 72.8263),
+    ("Goregaon", "Mumbai", 19.1663, 72.8526),
+    ("Aarey", "Mumbai", 19.1551, 72.8730),
+    ("Borivali", "Mumbai", 19.2307, 72.8567),
+    ("Mulund", "Mumbai", 19.1726, 72.9425),
+    ("Worli", "Mumbai", 19.0176, 72.8172),
+    ("Marine Drive", "Mumbai", 18.9430, 72.8238),
+    ("Colaba", "Mumbai", 18.9067, 72.8147),
+    ("Whitefield", "Bangalore", 12.9698, 77.7500),
+    ("Koramangala", "Bangalore", 12.9352, 77.6245),
+    ("Indiranagar", "Bangalore", 12.9719, 77.6412),
+    ("HSR Layout", "Bangalore", 12.9116, 77.6474),
+    ("Jayanagar", "Bangalore", 12.9308, 77.5838),
+    ("Malleshwaram", "Bangalore", 13.0035, 77.5710),
+    ("Cubbon Park", "Bangalore", 12.9763, 77.5929),
+    ("Hebbal", "Bangalore", 13.0358, 77.5970),
+    ("Yelahanka", "Bangalore", 13.1007, 77.5963),
+    ("Electronic City", "Bangalore", 12.8452, 77.6602),
+    ("Sarjapur", "Bangalore", 12.8600, 77.7860),
+    ("Dwarka", "Delhi", 28.5921, 77.0460),
+    ("Rohini", "Delhi", 28.7495, 77.0565),
+    ("Saket", "Delhi", 28.5245, 77.2066),
+    ("Vasant Kunj", "Delhi", 28.5200, 77.1590),
+    ("Connaught Place", "Delhi", 28.6315, 77.2167),
+    ("India Gate", "Delhi", 28.6129, 77.2295),
+    ("Lodhi Garden", "Delhi", 28.5931, 77.2197),
+    ("Jawaharlal Nehru Stadium", "Delhi", 28.5828, 77.2344),
+    ("Cyber City", "Gurgaon", 28.4950, 77.0895),
+    ("Golf Course Road", "Gurgaon", 28.4530, 77.1000),
+    ("Sohna", "Gurgaon", 28.2470, 77.0660),
+    ("Greater Noida", "Noida", 28.4744, 77.5040),
+    ("Hinjewadi", "Pune", 18.5913, 73.7389),
+    ("Wakad", "Pune", 18.5980, 73.7650),
+    ("Baner", "Pune", 18.5590, 73.7868),
+    ("Kothrud", "Pune", 18.5074, 73.8077),
+    ("Koregaon Park", "Pune", 18.5362, 73.8940),
+    ("Viman Nagar", "Pune", 18.5679, 73.9143),
+    ("Kharadi", "Pune", 18.5510, 73.9350),
+    ("Hadapsar", "Pune", 18.5089, 73.9260),
+    ("Pimpri Chinchwad", "Pune", 18.6298, 73.7997),
+    ("Gachibowli", "Hyderabad", 17.4401, 78.3489),
+    ("Hitech City", "Hyderabad", 17.4435, 78.3772),
+    ("HITEC City", "Hyderabad", 17.4435, 78.3772),
+    ("Kondapur", "Hyderabad", 17.4690, 78.3570),
+    ("Jubilee Hills", "Hyderabad", 17.4326, 78.4071),
+    ("Banjara Hills", "Hyderabad", 17.4126, 78.4482),
+    ("Necklace Road", "Hyderabad", 17.4239, 78.4738),
+    ("Secunderabad", "Hyderabad", 17.4399, 78.4983),
+    ("Besant Nagar", "Chennai", 13.0003, 80.2667),
+    ("Marina Beach", "Chennai", 13.0500, 80.2824),
+    ("Adyar", "Chennai", 13.0012, 80.2565),
+    ("Anna Nagar", "Chennai", 13.0850, 80.2101),
+    ("Velachery", "Chennai", 12.9815, 80.2180),
+    ("T Nagar", "Chennai", 13.0418, 80.2341),
+    ("Salt Lake", "Kolkata", 22.5800, 88.4180),
+    ("New Town", "Kolkata", 22.5809, 88.4616),
+    ("Howrah", "Kolkata", 22.5958, 88.2636),
+    ("Gandhinagar", "Ahmedabad", 23.2156, 72.6369),
+    ("Sabarmati Riverfront", "Ahmedabad", 23.0300, 72.5780),
+    ("Ernakulam", "Kochi", 9.9816, 76.2999),
+    ("Fort Kochi", "Kochi", 9.9658, 76.2421),
+    ("Margao", "Goa", 15.2832, 73.9862),
+    ("Vasco", "Goa", 15.3860, 73.8440),
+    ("Mohali", "Chandigarh", 30.7046, 76.7179),
+    ("Panchkula", "Chandigarh", 30.6942, 76.8606),
+    ("Sukhna Lake", "Chandigarh", 30.7421, 76.8188),
+]
+
+
+def _build_gazetteer() -> Tuple[Dict[str, Place], Set[str]]:
+    places: Dict[str, Place] = {}
+    for city, (lat, lon) in CITY_COORDINATES.items():
+        places[city.lower()] = Place(city, city, lat, lon)
+    # Every spelling normalize_location knows resolves to its canonical city
+    for alias, city in {**CITY_MAP, **CITY_ALIASES}.items():
+        if alias not in places:
+            places[alias] = places[city.lower()]
+    localities = set()
+    for name, city, lat, lon in LOCALITIES:
+        places[name.lower()] = Place(name, city, lat, lon)
+        localities.add(name.lower())
+    return places, localities
+
+
+GAZETTEER, _LOCALITY_NAMES = _build_gazetteer()
+_PLACE_PATTERN = re.compile(
+    r"(?<!\w)(" + "|".join(re.escape(n) for n in sorted(GAZETTEER, key=len, reverse=True)) + r")(?!\w)"
+)
+
+
+def _find_places(text: Optional[str]) -> List[str]:
+    return _PLACE_PATTERN.findall(text.lower()) if text else []
+
+
+@lru_cache(maxsize=4096)
+def geocode(location: Optional[str], address: Optional[str] = None) -> Optional[Place]:
+    """
+    Best gazetteer match for a location/address pair: a locality named in the
+    address or location, else the city, else None.
+    """
+    names = _find_places(address) + _find_places(location)
+    for name in names:
+        if name in _LOCALITY_NAMES:
+            return GAZETTEER[name]
+    # Prefer the (normalized) location field over cities mentioned in the address
+    cities = _find_places(location) + _find_places(address)
+    return GAZETTEER[cities[0]] if cities else None
+
+
+def geocode_fields(location: Optional[str], address: Optional[str] = None) -> Dict[str, Optional[float]]:
+    """latitude/longitude/geohash column values for a record."""
+    place = geocode(location, address)
+    if place is None:
+        return {"latitude": None, "longitude": None, "geohash": None}
+    return {
+        "latitude": place.latitude,
+        "longitude": place.longitude,
+        "geohash": geohash_encode(place.latitude, place.longitude),
+    }
+
+
+def haversine_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    dphi = phi2 - phi1
+    dlambda = math.radians(lon2 - lon1)
+    a = math.sin(dphi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(dlambda / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * math.asin(math.sqrt(a))
+
+
+def bounding_box(lat: float, lon: float, radius_km: float) -> Tuple[float, float, float, float]:
+    """(min_lat, min_lon, max_lat, max_lon) enclosing a circle."""
+    dlat = math.degrees(radius_km / EARTH_RADIUS_KM)
+    dlon = math.degrees(radius_km / (EARTH_RADIUS_KM * max(math.cos(math.radians(lat)), 0.01)))
+    return (max(lat - dlat, -90.0), max(lon - dlon, -180.0), min(lat + dlat, 90.0), min(lon + dlon, 180.0))
+
+
+def geohash_encode(lat: float, lon: float, precision: int = GEOHASH_PRECISION) -> str:
+    lat_range, lon_range = [-90.0, 90.0], [-180.0, 180.0]
+    chars, bits, bit_count, even = [], 0, 0, True
+    while len(chars) < precision:
+        rng, value = (lon_range, lon) if even else (lat_range, lat)
+        mid = (rng[0] + rng[1]) / 2
+        bits <<= 1
+        if value >= mid:
+            bits |= 1
+            rng[0] = mid
+        else:
+            rng[1] = mid
+        even = not even
+        bit_count += 1
+        if bit_count == 5:
+            chars.append(_BASE32[bits])
+            bits, bit_count = 0, 0
+    return "".join(chars)
+
+
+def _cell_size(precision: int) -> Tuple[float, float]:
+    """(height, width) in degrees of a geohash cell."""
+    lon_bits = (5 * precision + 1) // 2
+    lat_bits = 5 * precision // 2
+    return 180.0 / 2 ** lat_bits, 360.0 / 2 ** lon_bits
+
+
+def _steps(start: float, stop: float, step: float) -> Iterable[float]:
+    value = start
+    while value < stop:
+        yield value
+        value += step
+    yield stop
+
+
+def geohash_cover(min_lat: float, min_lon: float, max_lat: float, max_lon: float, max_cells: int = 16) -> List[str]:
+    """
+    The geohash prefixes of the finest precision whose cells cover the box in
+    at most `max_cells` cells, for `geohash LIKE 'prefix%'` index scans.
+    """
+    for precision in range(GEOHASH_PRECISION, 0, -1):
+        height, width = _cell_size(precision)
+        if (math.ceil((max_lat - min_lat) / height) + 1) * (math.ceil((max_lon - min_lon) / width) + 1) <= max_cells:
+            break
+    return sorted({
+        geohash_encode(lat, lon, precision)
+        for lat in _steps(min_lat, max_lat, height)
+        for lon in _steps(min_lon, max_lon, width)
+    })
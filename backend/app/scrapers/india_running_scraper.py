@@ -1,12 +1,11 @@
 from typing import List, Dict, Any
 from .base_scraper import BaseScraper
 # from bs4 import BeautifulSoup # No longer directly used here, BaseScraper handles parsing
-from datetime import datetime
-import re
 # import json # No longer used
 from app.core.logging_config import get_logger # Import the new logger
 from sqlalchemy.orm import Session # Keep for type hinting
 from .db_handler import EventDBHandler # Keep if db_handler is used
+from .extraction import DATE_FORMAT, find_date, parse_date
 
 # Set up logging
 # logging.basicConfig(level=logging.INFO) # Remove old logging config
@@ -54,8 +53,8 @@ class IndiaRunningScraper(BaseScraper):
 
                     date_div = event_card.find('div', class_=lambda x: x and 'font-bold text-neutral-600' in x)
                     date_str = date_div.text.strip() if date_div else "Date TBD"
-                    parsed_date = self.parse_date(date_str)
-                    formatted_date = parsed_date.strftime("%d %b %Y") if parsed_date else None
+                    parsed_date = parse_date(date_str)
+                    formatted_date = parsed_date.strftime(DATE_FORMAT) if parsed_date else None
                     logger.debug(f"Initial date string: '{date_str}', Parsed: {formatted_date}")
 
                     if not formatted_date or date_str.lower() in ['tbd', 'tba', 'date tbd', 'date tba']:
@@ -63,13 +62,10 @@ class IndiaRunningScraper(BaseScraper):
                         details_html = await self.fetch_page(event_url)
                         if details_html:
                             details_soup = self.parse_html(details_html)
-                            date_candidates_tags = details_soup.find_all(string=re.compile(r'\b\d{1,2}\s+[A-Za-z]{3,9}\s+20\d{2}\b'))
-                            if date_candidates_tags:
-                                details_date_str = date_candidates_tags[0].strip()
-                                details_parsed_date = self.parse_date(details_date_str)
-                                if details_parsed_date:
-                                    formatted_date = details_parsed_date.strftime("%d %b %Y")
-                                    logger.info(f"Found date '{formatted_date}' on details page for '{title}'.")
+                            details_parsed_date = find_date(details_soup.get_text(' '), require_year=True)
+                            if details_parsed_date:
+                                formatted_date = details_parsed_date.strftime(DATE_FORMAT)
+                                logger.info(f"Found date '{formatted_date}' on details page for '{title}'.")
                             else:
                                 logger.warning(f"No specific date pattern found on details page for '{title}'.")
                         else:
@@ -160,76 +156,6 @@ class IndiaRunningScraper(BaseScraper):
             logger.error(f"Error fetching or parsing event description from {event_url}: {e}", exc_info=True)
             return ""
         
-    def parse_date(self, date_str: str) -> datetime:
-        """Parse date string into datetime object. Handles various formats including ranges and TBD."""
-        if not date_str or date_str.lower().strip() in ['tbd', 'tba', 'date tbd', 'date tba', '']:
-            logger.debug(f"Date string is TBD or empty: '{date_str}'. Returning None.")
-            return None
-
-        original_date_str = date_str # Keep original for logging
-        try:
-            # Handle date ranges, take the start date
-            if " - " in date_str:
-                date_str = date_str.split(" - ")[0].strip()
-                logger.debug(f"Date string '{original_date_str}' is a range. Using start date: '{date_str}'.")
-            
-            # Remove ordinal suffixes (st, nd, rd, th)
-            date_str = re.sub(r'(\d+)(st|nd|rd|th)', r'\1', date_str.strip())
-            
-            # Normalize month abbreviations to full names for consistent parsing
-            month_map = {
-                'Jan': 'January', 'Feb': 'February', 'Mar': 'March', 'Apr': 'April',
-                'May': 'May', 'Jun': 'June', 'Jul': 'July', 'Aug': 'August',
-                'Sep': 'September', 'Oct': 'October', 'Nov': 'November', 'Dec': 'December'
-            }
-            for abbr, full in month_map.items():
-                date_str = re.sub(r'\b' + abbr + r'\b', full, date_str, flags=re.IGNORECASE)
-
-            # Define date formats to try, from more specific to more general
-            # Added year to formats that might miss it, assuming current year or next if past
-            formats_to_try = [
-                "%B %d, %Y",  # January 15, 2024
-                "%d %B %Y",  # 15 January 2024
-                "%b %d, %Y",  # Jan 15, 2024 (covered by normalization, but keep for robustness)
-                "%d %b %Y",  # 15 Jan 2024 (covered by normalization)
-                "%Y-%m-%d",  # 2024-01-15
-                "%d/%m/%Y",  # 15/01/2024
-                "%m/%d/%Y",  # 01/15/2024
-            ]
-
-            parsed_dt = None
-            for fmt in formats_to_try:
-                try:
-                    parsed_dt = datetime.strptime(date_str, fmt)
-                    logger.debug(f"Successfully parsed date string '{original_date_str}' (processed as '{date_str}') using format '{fmt}'. Result: {parsed_dt}")
-                    return parsed_dt
-                except ValueError:
-                    continue # Try next format
-            
-            # Fallback for formats like "Month Day" or "Day Month" (assuming current/next year)
-            year_formats = [
-                ("%B %d", True), # Month Day
-                ("%d %B", False) # Day Month
-            ]
-            current_time = datetime.now()
-            for fmt_str, month_first in year_formats:
-                try:
-                    temp_dt = datetime.strptime(date_str, fmt_str)
-                    # Assume current year, then adjust if the date is in the past for this year
-                    event_dt = temp_dt.replace(year=current_time.year)
-                    if event_dt < current_time.replace(hour=0, minute=0, second=0, microsecond=0) and not (event_dt.month == current_time.month and event_dt.day == current_time.day):
-                        event_dt = event_dt.replace(year=current_time.year + 1)
-                    logger.debug(f"Parsed date string '{original_date_str}' (processed as '{date_str}') using format '{fmt_str}' with year adjustment. Result: {event_dt}")
-                    return event_dt
-                except ValueError:
-                    continue
-
-            logger.warning(f"Unable to parse date string: '{original_date_str}' (processed as '{date_str}') with any known format.")
-            return None
-        except Exception as e:
-            logger.error(f"Unexpected error parsing date string '{original_date_str}': {e}", exc_info=True)
-            return None
-            
     # slugify method seems unused, can be removed or kept if planned for future use.
     # def slugify(self, text: str) -> str:
     #     """Convert text to URL-friendly slug"""
@@ -1,9 +1,9 @@
 import asyncio
-import httpx
-from typing import List, Dict, Any, Optional
-from datetime import datetime
-from app.core.logging_config import get_logger
+from typing import List, Dict, Any
+from app.core.logging_config import get_logger, SAMPLED
 from .base_scraper import BaseScraper 
+from .resilience import ScrapeError
+from .extraction import format_date
 
 logger = get_logger(__name__)
 
@@ -51,9 +51,9 @@ class IndiaRunningAPI(BaseScraper): # Inherit from BaseScraper
             for i, event_data in enumerate(events_data):
                 try:
                     title = event_data.get("title", "Title Not Found")
-                    logger.debug(f"Processing event {i+1}/{len(events_data)} on page {page_number}: '{title}'")
+                    logger.debug("Processing event %s/%s on page %s: '%s'", i + 1, len(events_data), page_number, title, extra=SAMPLED)
                     
-                    parsed_date = self._parse_date(event_data.get("eventDate", {}).get("start"))
+                    parsed_date = format_date(event_data.get("eventDate", {}).get("start"))
                     location_info = event_data.get("locationInfo", {})
                     raw_location_str = self._extract_raw_location(location_info)
                     city = location_info.get("city", "Unknown City") # Keep city separate for potential filtering
@@ -78,11 +78,11 @@ class IndiaRunningAPI(BaseScraper): # Inherit from BaseScraper
                         "url": f"https://registrations.indiarunning.com/{event_data.get('slug', '')}",
                         "source": source_name, # Dynamic source name
                         "description": event_data.get("aboutRace", [{}])[0].get("content", "No description available").strip(),
-                        "registration_closes": self._parse_date(event_data.get("registrationDate", {}).get("end")), # Assuming similar structure
+                        "registration_closes": format_date(event_data.get("registrationDate", {}).get("end")), # Assuming similar structure
                         "photos": event_data.get("eventImage", {}).get("url") # Extract image URL if present
                     }
                     all_events.append(event)
-                    logger.debug(f"Successfully processed event: {event['title']}")
+                    logger.debug("Successfully processed event: %s", event['title'], extra=SAMPLED)
                 except Exception as e:
                     logger.error(f"Error processing event data (title: '{event_data.get('title')}'): {e}. Data: {str(event_data)[:500]}", exc_info=True)
 
@@ -91,7 +91,7 @@ class IndiaRunningAPI(BaseScraper): # Inherit from BaseScraper
                 has_more_events = False
             else:
                 page_number += 1
-                await asyncio.sleep(0.5) # Small delay to be polite to the API
+                await asyncio.sleep(self.page_delay) # Small delay to be polite to the API
         
         logger.info(f"Finished scraping for {source_name} API. Total events processed: {len(all_events)}.")
         return all_events
@@ -107,42 +107,19 @@ class IndiaRunningAPI(BaseScraper): # Inherit from BaseScraper
                 "cities": [], "certifications": [], "eventDateDays": [],
             },
         }
-        # Session is managed by BaseScraper, use its get_session method
-        # client = await self.get_session() # This would get the BaseScraper session, which might not be configured for JSON POST
-        # For direct httpx usage when BaseScraper session isn't suitable:
-        async with httpx.AsyncClient(headers=self.headers, timeout=30.0) as client: # Use headers defined in __init__
-            try:
-                logger.debug(f"Posting to API: {url} with payload for page {page_no}")
-                response = await client.post(url, json=payload) # Removed self.headers as it's in AsyncClient constructor
-                response.raise_for_status()
-                data = response.json()
-                events_list = data.get("events", [])
-                logger.debug(f"API call for page {page_no} successful, received {len(events_list)} events.")
-                return events_list
-            except httpx.HTTPStatusError as e:
-                logger.error(f"HTTP error fetching events from API (page {page_no}): {e.response.status_code} - {e.response.text[:200]}", exc_info=True)
-                return []
-            except httpx.RequestError as e:
-                 logger.error(f"Request error fetching events from API (page {page_no}): {e}", exc_info=True)
-                 return []
-            except Exception as e:
-                logger.error(f"Unexpected error fetching events from API (page {page_no}): {e}", exc_info=True)
-                return []
-
-    def _parse_date(self, date_str: Optional[str]) -> str:
-        """Parse ISO date string into 'dd Mon YYYY' format. Returns 'Date TBD' on failure or if None."""
-        if not date_str:
-            logger.debug("Date string is None or empty, returning 'Date TBD'.")
-            return "Date TBD"
         try:
-            # Handle potential 'Z' for UTC, common in ISO strings
-            dt_object = datetime.fromisoformat(date_str.replace('Z', '+00:00'))
-            formatted_date = dt_object.strftime("%d %b %Y")
-            logger.debug(f"Parsed date string '{date_str}' to '{formatted_date}'.")
-            return formatted_date
-        except ValueError as e:
-            logger.warning(f"Could not parse date string: '{date_str}'. Error: {e}. Returning 'Date TBD'.")
-            return "Date TBD"
+            logger.debug(f"Posting to API: {url} with payload for page {page_no}")
+            # Goes through BaseScraper.request, which uses self.headers and retries transient errors
+            data = await self.request(url, method="POST", json=payload, as_json=True)
+            events_list = data.get("events", [])
+            logger.debug(f"API call for page {page_no} successful, received {len(events_list)} events.")
+            return events_list
+        except ScrapeError as e:
+            logger.error(f"Error fetching events from API (page {page_no}): {e}")
+            return []
+        except Exception as e:
+            logger.error(f"Unexpected error fetching events from API (page {page_no}): {e}", exc_info=True)
+            return []
 
     def _extract_raw_location(self, location_info: Dict[str, Any]) -> str:
         """Extracts a raw, comma-separated location string from locationInfo dictionary."""
@@ -0,0 +1,186 @@
+"""
+Typed ingest stage between the scrapers and the database.
+
+Scrapers yield loosely shaped dicts. validate_events checks a whole batch in
+one pydantic-core call, drops malformed rows (counted by reason), normalizes
+dates and prices, and returns compact EventRecord objects that share a single
+scrape timestamp. Locations and categories are kept as scraped; their
+canonical city and category ids are resolved at upsert (app.db.taxonomy).
+"""
+import uuid
+from collections import Counter
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from pydantic import BeforeValidator, StringConstraints, TypeAdapter, ValidationError
+from typing_extensions import Annotated, Required, TypedDict
+from .extraction import DATE_TBD, PRICE_TBD, clean_price, format_date
+
+SCRAPED_AT_FORMAT = "%Y-%m-%d %H:%M:%S"
+LOCATION_UNKNOWN = "Other"
+
+# Defaults standing in for values a scraper didn't supply; updates leave the stored value alone
+_PLACEHOLDERS = (None, "", [], DATE_TBD, PRICE_TBD, LOCATION_UNKNOWN)
+
+
+def _text(value: Any) -> Any:
+    """Numbers as strings, blank strings as None; anything else is left to the type check."""
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return str(value)
+    if isinstance(value, str):
+        return value.strip() or None
+    return value
+
+
+def _strings(value: Any) -> Any:
+    if value is None:
+        return []
+    if isinstance(value, str):
+        return [value]
+    if isinstance(value, (list, tuple, set)):
+        return [v for v in value if isinstance(v, str) and v]
+    return value
+
+
+def _date(value: Any) -> Any:
+    return format_date(value) if value is None or isinstance(value, str) else value
+
+
+def _optional_date(value: Any) -> Any:
+    return format_date(value, default=None) if value is None or isinstance(value, str) else value
+
+
+def _price(value: Any) -> Any:
+    value = _text(value)
+    return clean_price(value) if value is None or isinstance(value, str) else value
+
+
+def _event_id(value: Any) -> Optional[str]:
+    try:
+        return str(uuid.UUID(str(value))) if value else None
+    except ValueError:
+        return None
+
+
+Text = Annotated[str, StringConstraints(strip_whitespace=True, min_length=1)]
+OptionalText = Annotated[Optional[str], BeforeValidator(_text)]
+Strings = Annotated[List[str], BeforeValidator(_strings)]
+
+
+class ScrapedEvent(TypedDict, total=False):
+    """The shape scrapers must produce; unknown keys are ignored."""
+    title: Required[Text]
+    url: Required[Text]
+    date: Annotated[str, BeforeValidator(_date)]
+    location: OptionalText
+    address: OptionalText
+    categories: Strings
+    price: Annotated[str, BeforeValidator(_price)]
+    source: OptionalText
+    description: OptionalText
+    registration_closes: Annotated[Optional[str], BeforeValidator(_optional_date)]
+    photos: Strings
+    scraped_at: OptionalText
+    id: Annotated[Optional[str], BeforeValidator(_event_id)]
+
+
+_BATCH = TypeAdapter(List[ScrapedEvent])
+
+
+class EventRecord:
+    """One validated event; the fields are exactly the events table's writable columns."""
+    __slots__ = (
+        "id", "title", "url", "date", "location", "address", "categories", "price",
+        "source", "description", "registration_closes", "photos", "scraped_at",
+    )
+
+    def __init__(
+        self,
+        title: str,
+        url: str,
+        source: str,
+        scraped_at: str,
+        date: str = DATE_TBD,
+        location: Optional[str] = None,
+        address: Optional[str] = None,
+        categories: Iterable[str] = (),
+        price: str = PRICE_TBD,
+        description: Optional[str] = None,
+        registration_closes: Optional[str] = None,
+        photos: Optional[List[str]] = None,
+        id: Optional[str] = None,
+    ):
+        self.id = id or str(uuid.uuid4())
+        self.title = title
+        self.url = url
+        self.date = date
+        self.location = location or LOCATION_UNKNOWN
+        # The API schema requires a string; blank rather than NULL when unknown
+        self.address = address or ""
+        self.categories = list(dict.fromkeys(categories))
+        self.price = price
+        self.source = source
+        self.description = description
+        self.registration_closes = registration_closes
+        self.photos = photos or []
+        self.scraped_at = scraped_at
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Every column, defaults included, for inserting a new row."""
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def changes(self) -> Dict[str, Any]:
+        """
+        The columns the scraper actually supplied, for updating an existing
+        row: placeholders such as Date TBD or an empty photo list would erase
+        what is stored. The id is never included.
+        """
+        return {
+            name: value for name in self.__slots__
+            if name != "id" and (value := getattr(self, name)) not in _PLACEHOLDERS
+        }
+
+    def __repr__(self) -> str:
+        return f"EventRecord({self.title!r}, {self.date!r}, {self.url!r})"
+
+
+def _reason(error: Dict[str, Any]) -> str:
+    field = error["loc"][1] if len(error["loc"]) > 1 else "row"
+    return f"{field}:{error['type']}"
+
+
+def validate_events(
+    rows: List[Dict[str, Any]],
+    source: Optional[str] = None,
+    scraped_at: Optional[str] = None,
+) -> Tuple[List[EventRecord], Counter]:
+    """
+    Validate and normalize a batch of scraped event dicts.
+
+    Returns the records and a Counter of rejected rows by "field:error".
+    `source` fills rows without one; `scraped_at` (default: now, taken once)
+    stamps rows that don't carry their own, so pass it explicitly to restamp
+    a fresh scrape.
+    """
+    rejected: Counter = Counter()
+    try:
+        valid = _BATCH.validate_python(rows)
+    except ValidationError as e:
+        # Errors are located by row index; one reason per rejected row
+        bad: Dict[int, str] = {}
+        for error in e.errors():
+            bad.setdefault(error["loc"][0], _reason(error))
+        rejected.update(bad.values())
+        valid = _BATCH.validate_python([row for i, row in enumerate(rows) if i not in bad])
+
+    stamp = scraped_at or datetime.now().strftime(SCRAPED_AT_FORMAT)
+    records = []
+    for row in valid:
+        if scraped_at or not row.get("scraped_at"):
+            row["scraped_at"] = stamp
+        if not row.get("source"):
+            if not source:
+                rejected["source:missing"] += 1
+                continue
+            row["source"] = source
+        records.append(EventRecord(**row))
+    return records, rejected
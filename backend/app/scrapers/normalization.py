@@ -0,0 +1,120 @@
+import re
+from functools import lru_cache
+from typing import Any, Iterable, List, Optional
+
+# Known spellings of Indian city names, mapped to the name we store
+CITY_MAP = {
+    "delhi": "Delhi",
+    "new delhi": "Delhi",
+    "delhi ncr": "Delhi",
+    "gurgaon": "Gurgaon",
+    "gurugram": "Gurgaon",
+    "noida": "Noida",
+    "mumbai": "Mumbai",
+    "bombay": "Mumbai",
+    "thane": "Mumbai",
+    "navi mumbai": "Mumbai",
+    "pune": "Pune",
+    "bengaluru": "Bangalore",
+    "bangalore": "Bangalore",
+    "chennai": "Chennai",
+    "kolkata": "Kolkata",
+    "hyderabad": "Hyderabad",
+    "ahmedabad": "Ahmedabad",
+    "jaipur": "Jaipur",
+    "lucknow": "Lucknow",
+    "chandigarh": "Chandigarh",
+    "kochi": "Kochi",
+    "cochin": "Kochi",
+    "indore": "Indore",
+    "bhopal": "Bhopal",
+    "goa": "Goa",
+}
+
+# Common category variants, mapped to the category we store
+CATEGORY_MAP = {
+    "3k": "3K",
+    "5k": "5K",
+    "10k": "10K",
+    "21.1k": "Half Marathon",
+    "21k": "Half Marathon",
+    "hm": "Half Marathon",
+    "half marathon": "Half Marathon",
+    "42k": "Marathon",
+    "marathon": "Marathon",
+    "m": "Marathon",
+    "ultra": "Ultra Marathon",
+    "50k": "Ultra Marathon",
+    "35k": "Ultra Marathon",
+    "running": "Custom",
+    "run": "Custom",
+    "general": "Custom",
+    "custom": "Custom",
+    "women's run": "Women's Run",
+}
+
+
+def _alias_pattern(aliases) -> "re.Pattern[str]":
+    """One regex matching any alias as a whole word, longest alias first."""
+    return re.compile(r"(?<!\w)(" + "|".join(re.escape(a) for a in sorted(aliases, key=len, reverse=True)) + r")(?!\w)")
+
+
+_CITY_PATTERN = _alias_pattern(CITY_MAP)
+# Catch-all and single-letter aliases only count as exact matches: "Fun Run 5K" is a 5K
+_CATEGORY_PATTERN = _alias_pattern(
+    alias for alias, canonical in CATEGORY_MAP.items() if canonical != "Custom" and len(alias) > 1
+)
+
+
+@lru_cache(maxsize=2048)
+def normalize_location( raw_location: str) -> str:
+    """Standardize known Indian city names, also inside strings like 'Andheri, Mumbai'"""
+    if not raw_location:
+        return "Other"
+
+    raw = raw_location.strip().lower()
+    if raw in CITY_MAP:
+        return CITY_MAP[raw]
+
+    match = _CITY_PATTERN.search(raw)
+    return CITY_MAP[match.group(1)] if match else raw_location.title()
+
+@lru_cache(maxsize=2048)
+def normalize_category( raw_category: str) -> str:
+    """Standardize common category variants, also inside strings like 'Half Marathon (21.1K)'"""
+    if not raw_category:
+        return "Custom"
+
+    raw = raw_category.strip().lower()
+    if raw in CATEGORY_MAP:
+        return CATEGORY_MAP[raw]
+
+    match = _CATEGORY_PATTERN.search(raw)
+    return CATEGORY_MAP[match.group(1)] if match else raw_category.title()
+
+
+def canonical_categories(categories: Optional[Iterable[Any]]) -> List[str]:
+    """Canonical category names for a raw categories list, deduplicated in order."""
+    return list(dict.fromkeys(normalize_category(c) for c in categories or [] if isinstance(c, str)))
+
+
+# Aliases worth expanding in search: the catch-all "Custom" category and
+# single-letter keys would match far too much
+_SEARCH_ALIASES = {
+    alias: canonical
+    for alias, canonical in {**CATEGORY_MAP, **CITY_MAP}.items()
+    if canonical != "Custom" and len(alias) > 1 and alias != canonical.lower()
+}
+_SEARCH_ALIAS_PATTERN = _alias_pattern(_SEARCH_ALIASES)
+
+
+def search_variants(query: str) -> List[str]:
+    """
+    The query plus rewrites with city/category aliases replaced by the names
+    we store, e.g. "bombay hm" -> ["bombay hm", "Mumbai Half Marathon"].
+    """
+    variants = [query]
+    rewritten = _SEARCH_ALIAS_PATTERN.sub(lambda m: _SEARCH_ALIASES[m.group(1)], query.lower())
+    if rewritten != query.lower():
+        variants.append(rewritten)
+    return variants
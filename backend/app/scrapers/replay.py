@@ -0,0 +1,140 @@
+import asyncio
+import gzip
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Any, Dict, Optional
+from urllib.parse import parse_qsl, urlsplit
+from app.core.logging_config import get_logger
+from .resilience import FatalScrapeError
+
+logger = get_logger(__name__)
+
+# "off" (live requests), "record" (live requests, responses saved) or "replay" (archive only, no network)
+REPLAY_MODE = os.getenv("SCRAPER_REPLAY_MODE", "off")
+# Default archive lives next to the scraper cache, at backend/cache/scrape_archive.jsonl.gz
+ARCHIVE_PATH = os.getenv(
+    "SCRAPER_ARCHIVE",
+    os.path.join(Path(__file__).parent.parent.parent, "cache", "scrape_archive.jsonl.gz"),
+)
+# Delay per replayed response: milliseconds, or "recorded" to reuse the latency observed while recording
+REPLAY_LATENCY = os.getenv("SCRAPER_REPLAY_LATENCY", "0")
+
+MODES = ("off", "record", "replay")
+
+
+def request_key(method: str, url: str, params: Optional[Dict[str, Any]] = None, body: Optional[Any] = None) -> str:
+    """Stable identity of a request: method, host+path, sorted query and JSON body."""
+    parts = urlsplit(url)
+    query = sorted(parse_qsl(parts.query) + [(k, str(v)) for k, v in (params or {}).items()])
+    return json.dumps([method.upper(), parts.netloc + parts.path, query, body], sort_keys=True, default=str)
+
+
+class ScrapeArchive:
+    """
+    Upstream responses stored as gzip-compressed JSON lines, one per request.
+    Recording appends a gzip member per response, so an interrupted recording
+    keeps everything written so far; a later record of the same request wins.
+    """
+
+    def __init__(self, path: str, mode: str = "replay", latency: str = "0"):
+        if mode not in MODES:
+            raise ValueError(f"Unknown replay mode '{mode}'. Choose from {MODES}")
+        self.path = path
+        self.mode = mode
+        self.latency = latency
+        self.responses: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        if mode == "replay":
+            self.load()
+
+    def load(self) -> None:
+        if not os.path.exists(self.path):
+            raise FileNotFoundError(f"No scrape archive at {self.path}; record one with SCRAPER_REPLAY_MODE=record")
+        with gzip.open(self.path, "rt", encoding="utf-8") as f:
+            for line in f:
+                entry = json.loads(line)
+                self.responses[entry["key"]] = entry
+        logger.info(f"Loaded {len(self.responses)} recorded responses from {self.path}")
+
+    def record(self, key: str, method: str, url: str, status: int, body: str, elapsed_ms: float) -> None:
+        entry = {"key": key, "method": method, "url": url, "status": status, "body": body,
+                 "elapsed_ms": round(elapsed_ms, 1)}
+        line = json.dumps(entry, ensure_ascii=False) + "\n"
+        with self._lock:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            with gzip.open(self.path, "at", encoding="utf-8") as f:
+                f.write(line)
+            self.responses[key] = entry
+
+    def _delay(self, entry: Dict[str, Any]) -> float:
+        if self.latency == "recorded":
+            return entry.get("elapsed_ms", 0) / 1000
+        return float(self.latency or 0) / 1000
+
+    async def replay(self, key: str, url: str) -> str:
+        """Return the recorded body for a request after the configured latency."""
+        entry = self.responses.get(key)
+        if entry is None:
+            raise FatalScrapeError(f"No recorded response for {url}")
+        delay = self._delay(entry)
+        if delay:
+            await asyncio.sleep(delay)
+        return entry["body"]
+
+
+_archive: Optional[ScrapeArchive] = None
+_configured = False
+
+
+def configure(mode: str = None, path: str = None, latency: Any = None) -> Optional[ScrapeArchive]:
+    """Select the record/replay mode for this process (defaults come from the environment)."""
+    global _archive, _configured
+    mode = mode or REPLAY_MODE
+    _archive = None if mode == "off" else ScrapeArchive(path or ARCHIVE_PATH, mode, str(latency if latency is not None else REPLAY_LATENCY))
+    _configured = True
+    if _archive is not None:
+        logger.info(f"Scraper {mode} mode using archive {_archive.path}")
+    return _archive
+
+
+def get_archive() -> Optional[ScrapeArchive]:
+    if not _configured:
+        configure()
+    return _archive
+
+
+async def _run(mode: str, sources=None, path: str = None, latency: str = None) -> None:
+    """Scrape every source once in `mode`, with a throwaway cache so nothing is served from it."""
+    import tempfile
+    import time
+    from ..cache.cache_manager import CacheManager
+    from ..cache.schedule_manager import SourceScheduleManager
+    from .scraper_manager import ScraperManager
+
+    configure(mode, path, latency)
+    with tempfile.TemporaryDirectory() as cache_dir:
+        manager = ScraperManager(adaptive=False)
+        manager.cache_manager = CacheManager(cache_dir=cache_dir)
+        manager.schedule_manager = SourceScheduleManager(cache_dir=cache_dir)
+        if mode == "replay":
+            for scraper in manager.scrapers:
+                scraper.page_delay = 0
+        start = time.perf_counter()
+        events = await manager.scrape_all_events(sources=sources)
+        print(f"{mode}: {len(events)} events in {time.perf_counter() - start:.2f}s ({get_archive().path})")
+
+
+if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser(description="Record upstream responses to the scrape archive, or replay them offline")
+    parser.add_argument("mode", choices=["record", "replay"])
+    parser.add_argument("--source", action="append", dest="sources", help="Only this source (repeatable)")
+    parser.add_argument("--archive", help=f"Archive path (default {ARCHIVE_PATH})")
+    parser.add_argument("--latency", help="Replay delay per response in ms, or 'recorded'")
+    args = parser.parse_args()
+
+    # Run via the package module, not __main__, so BaseScraper sees the same configured archive
+    from app.scrapers.replay import _run as run
+    asyncio.run(run(args.mode, args.sources, args.archive, args.latency))
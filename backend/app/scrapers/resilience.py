@@ -0,0 +1,169 @@
+from typing import Any, Awaitable, Callable, Dict, Optional
+import asyncio
+import json
+import random
+import time
+import aiohttp
+from app.core.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# HTTP statuses worth retrying; every other 4xx/5xx is treated as deterministic
+RETRYABLE_STATUSES = {408, 425, 429, 500, 502, 503, 504}
+
+
+class ScrapeError(Exception):
+    """Base class for upstream request failures raised by BaseScraper.request"""
+
+    retryable = False
+
+    def __init__(self, message: str, status: Optional[int] = None, retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.status = status
+        self.retry_after = retry_after
+
+
+class RetryableScrapeError(ScrapeError):
+    """Transient failure: timeouts, dropped connections, 429 and most 5xx"""
+
+    retryable = True
+
+
+class FatalScrapeError(ScrapeError):
+    """Deterministic failure: 4xx, bad URLs, unparseable payloads"""
+
+
+class CircuitOpenError(ScrapeError):
+    """Raised instead of calling an upstream whose circuit is open"""
+
+
+def _retry_after_seconds(headers) -> Optional[float]:
+    value = headers.get("Retry-After") if headers else None
+    try:
+        return float(value) if value is not None else None
+    except ValueError:
+        return None
+
+
+def classify_error(exc: BaseException) -> ScrapeError:
+    """Map a client exception onto a retryable or fatal ScrapeError"""
+    if isinstance(exc, ScrapeError):
+        return exc
+    if isinstance(exc, aiohttp.ClientResponseError):
+        error_class = RetryableScrapeError if exc.status in RETRYABLE_STATUSES else FatalScrapeError
+        return error_class(
+            f"HTTP {exc.status} for {exc.request_info.real_url}: {exc.message}",
+            status=exc.status,
+            retry_after=_retry_after_seconds(exc.headers),
+        )
+    if isinstance(exc, (aiohttp.InvalidURL, aiohttp.ContentTypeError, aiohttp.ClientConnectorCertificateError)):
+        return FatalScrapeError(f"{exc.__class__.__name__}: {exc}")
+    if isinstance(exc, (asyncio.TimeoutError, aiohttp.ClientConnectionError, aiohttp.ClientPayloadError)):
+        return RetryableScrapeError(f"{exc.__class__.__name__}: {exc}")
+    if isinstance(exc, (json.JSONDecodeError, UnicodeDecodeError, ValueError)):
+        return FatalScrapeError(f"Invalid response payload: {exc}")
+    if isinstance(exc, aiohttp.ClientError):
+        return RetryableScrapeError(f"{exc.__class__.__name__}: {exc}")
+    return FatalScrapeError(f"Unexpected error: {exc!r}")
+
+
+async def retry_async(
+    operation: Callable[[], Awaitable[Any]],
+    attempts: int = 3,
+    base_delay: float = 0.5,
+    max_delay: float = 8.0,
+    description: str = "request",
+) -> Any:
+    """
+    Run `operation` up to `attempts` times, retrying only RetryableScrapeError
+    with full-jitter exponential backoff (or the server's Retry-After, capped
+    at `max_delay`). Fatal errors are raised immediately.
+    """
+    for attempt in range(attempts):
+        try:
+            return await operation()
+        except RetryableScrapeError as e:
+            if attempt == attempts - 1:
+                logger.error(f"Giving up on {description} after {attempts} attempts: {e}")
+                raise
+            delay = e.retry_after if e.retry_after is not None else random.uniform(0, base_delay * 2 ** attempt)
+            delay = min(delay, max_delay)
+            logger.warning(f"Retryable error on {description} (attempt {attempt + 1}/{attempts}): {e}. Retrying in {delay:.2f}s")
+            await asyncio.sleep(delay)
+        except FatalScrapeError as e:
+            logger.error(f"Fatal error on {description}, not retrying: {e}")
+            raise
+
+
+class CircuitBreaker:
+    """
+    Per-source circuit breaker.
+
+    Closed: requests flow normally. After `failure_threshold` consecutive
+    failed scrapes the circuit opens and the source is skipped for
+    `reset_timeout` seconds. Then a single trial scrape is allowed
+    (half-open); success closes the circuit, failure re-opens it with the
+    timeout doubled, up to `max_reset_timeout`.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, name: str, failure_threshold: int = 2, reset_timeout: float = 1800, max_reset_timeout: float = 6 * 3600):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.base_reset_timeout = reset_timeout
+        self.reset_timeout = reset_timeout
+        self.max_reset_timeout = max_reset_timeout
+        self.state = self.CLOSED
+        self.consecutive_failures = 0
+        self.opened_at: Optional[float] = None
+
+    def allow_request(self) -> bool:
+        if self.state == self.OPEN:
+            if time.monotonic() - self.opened_at >= self.reset_timeout:
+                logger.info(f"Circuit for {self.name} half-open, allowing a trial scrape.")
+                self.state = self.HALF_OPEN
+                return True
+            return False
+        return True
+
+    def seconds_until_retry(self) -> float:
+        if self.state != self.OPEN:
+            return 0.0
+        return max(0.0, self.reset_timeout - (time.monotonic() - self.opened_at))
+
+    def record_success(self) -> None:
+        if self.state != self.CLOSED:
+            logger.info(f"Circuit for {self.name} closed after successful scrape.")
+        self.state = self.CLOSED
+        self.consecutive_failures = 0
+        self.reset_timeout = self.base_reset_timeout
+        self.opened_at = None
+
+    def record_failure(self) -> None:
+        self.consecutive_failures += 1
+        if self.state == self.HALF_OPEN:
+            self.reset_timeout = min(self.reset_timeout * 2, self.max_reset_timeout)
+            self._open()
+        elif self.consecutive_failures >= self.failure_threshold:
+            self._open()
+
+    def _open(self) -> None:
+        self.state = self.OPEN
+        self.opened_at = time.monotonic()
+        logger.warning(
+            f"Circuit for {self.name} opened after {self.consecutive_failures} consecutive failures; "
+            f"skipping for {self.reset_timeout:.0f}s."
+        )
+
+
+# Breakers outlive ScraperManager instances, which are created per API call / scheduler run
+_circuit_breakers: Dict[str, CircuitBreaker] = {}
+
+
+def get_circuit_breaker(source: str) -> CircuitBreaker:
+    if source not in _circuit_breakers:
+        _circuit_breakers[source] = CircuitBreaker(source)
+    return _circuit_breakers[source]
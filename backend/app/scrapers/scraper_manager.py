@@ -1,99 +1,153 @@
-from typing import List, Dict, Any
-import uuid
+from typing import List, Dict, Any, Optional
 from .india_running_scraper import IndiaRunningScraper
 from .india_running_scraper_w_api import IndiaRunningAPI
 from .citywoofer_scraper import CityWooferScraper
 from .bhaago_india_scraper import BhaagoIndiaScraper
 from ..cache.cache_manager import CacheManager
+from ..cache.schedule_manager import SourceScheduleManager
+from .resilience import ScrapeError, get_circuit_breaker
+from .ingest import SCRAPED_AT_FORMAT, EventRecord, validate_events
 import asyncio
+import time
 from datetime import datetime
 from app.core.logging_config import get_logger
+from app.core.metrics import SCRAPE_CACHE_LOOKUPS, SCRAPE_EVENTS, SCRAPE_FAILURES, SCRAPE_REJECTS, SCRAPE_SECONDS
+from app.core.profiling import profile_scrape_if_armed
 
 logger = get_logger(__name__)
 
+# Fields that decide whether a re-scraped event counts as changed
+CHANGE_FIELDS = ('title', 'date', 'price', 'location')
+
+
+def count_changed_events(previous: List[Dict[str, Any]], current: List[Dict[str, Any]]) -> int:
+    """Count events in `current` that are new or differ from `previous`, keyed by URL"""
+    previous_by_url = {
+        event.get('url'): tuple(event.get(field) for field in CHANGE_FIELDS)
+        for event in previous
+    }
+    return sum(
+        1 for event in current
+        if previous_by_url.get(event.get('url')) != tuple(event.get(field) for field in CHANGE_FIELDS)
+    )
+
+
 class ScraperManager:
-    def __init__(self, cache_duration_hours: int = 24, max_retries: int = 3):
+    def __init__(self, cache_duration_hours: int = 24, max_retries: int = 3, adaptive: bool = True):
         self.scrapers = [
             IndiaRunningAPI(),
             # CityWooferScraper(), 
             BhaagoIndiaScraper()
         ]
         self.cache_manager = CacheManager(cache_duration_hours=cache_duration_hours)
-        self.max_retries = max_retries
+        self.schedule_manager = SourceScheduleManager(
+            cache_dir=self.cache_manager.cache_dir,
+            default_interval_hours=cache_duration_hours,
+        )
+        self.adaptive = adaptive
+        self.max_retries = max_retries  # attempts per upstream request
         logger.info(f"ScraperManager initialized with {len(self.scrapers)} scrapers and cache duration {cache_duration_hours} hours.")
+
+    @staticmethod
+    def source_name(scraper) -> str:
+        return scraper.source_name
+
+    def due_sources(self) -> List[str]:
+        """Sources whose adaptive crawl interval has elapsed"""
+        return self.schedule_manager.due_sources([self.source_name(s) for s in self.scrapers])
     
-    async def _scrape_with_retry(self, scraper) -> List[Dict[str, Any]]:
-        """Attempt to scrape with retries on failure"""
-        source = scraper.__class__.__name__.replace('Scraper', '').replace('API', '')
+    def _validate(self, source: str, events: List[Dict[str, Any]], scraped_at: Optional[str] = None) -> List[EventRecord]:
+        """Run a batch through the ingest stage, counting rejected rows"""
+        records, rejected = validate_events(events, source, scraped_at)
+        for reason, count in rejected.items():
+            SCRAPE_REJECTS.labels(source, reason).inc(count)
+        if rejected:
+            logger.warning(f"Rejected {sum(rejected.values())} malformed events from {source}: {dict(rejected)}")
+        return records
+
+    async def _scrape_with_retry(self, scraper) -> List[EventRecord]:
+        """Scrape a source once (requests retry individually), failing fast while its circuit is open"""
+        source = self.source_name(scraper)
+        ttl_hours = self.schedule_manager.cache_ttl_hours(source) if self.adaptive else None
         
         # Check cache first
-        if self.cache_manager.is_cache_valid(source):
+        if self.cache_manager.is_cache_valid(source, ttl_hours=ttl_hours):
             logger.info(f"Using cached data for {source}.")
             try:
                 cached_data = self.cache_manager.get_cached_events(source)
                 if cached_data:
                     logger.debug(f"Retrieved {len(cached_data)} events from cache for {source}.")
-                    return cached_data
+                    SCRAPE_CACHE_LOOKUPS.labels(source, "hit").inc()
+                    return self._validate(source, cached_data)
                 else:
                     logger.warning(f"Cache for {source} is valid but returned no data. Will attempt scrape.")
             except Exception as e:
                 logger.error(f"Error reading cache for {source}: {e}. Clearing corrupt cache and attempting scrape.", exc_info=True)
                 self.cache_manager.clear_cache(source)
                 # Continue to scrape
+        SCRAPE_CACHE_LOOKUPS.labels(source, "miss").inc()
             
-        for attempt in range(self.max_retries):
-            try:
-                logger.info(f"Scraping {source} (Attempt {attempt + 1}/{self.max_retries}).")
-                async with scraper:  # Use context manager to handle session
-                    events = await scraper.scrape_events()
-                
-                # Add timestamp and source to events
-                for event in events:
-                    event['scraped_at'] = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-                    if 'source' not in event:
-                        event['source'] = source
-                    if "id" not in event:
-                        event["id"] = str(uuid.uuid4())
-                
-                if events:
-                    logger.info(f"Successfully scraped {len(events)} events from {source}.")
-                    logger.info(f"Caching {len(events)} events for {source}.")
-                    self.cache_manager.cache_events(source, events)
-                    return events
-                else:
-                    logger.warning(f"No events found for {source} on attempt {attempt + 1}.")
-                
-                if attempt < self.max_retries - 1:
-                    wait_time = 2 ** attempt
-                    logger.info(f"Retrying {source} in {wait_time} seconds...")
-                    await asyncio.sleep(wait_time)  # Exponential backoff
-                else:
-                    logger.error(f"All {self.max_retries} attempts failed for {source}. No events retrieved.")
-                    return []
-                    
-            except Exception as e:
-                logger.error(f"Error scraping {source} (Attempt {attempt + 1}/{self.max_retries}): {e}", exc_info=True)
-                if attempt < self.max_retries - 1:
-                    wait_time = 2 ** attempt
-                    logger.info(f"Retrying {source} in {wait_time} seconds due to error...")
-                    await asyncio.sleep(wait_time)
-                else:
-                    logger.error(f"All {self.max_retries} attempts failed for {source} due to error: {e}", exc_info=True)
-                    return []
+        breaker = get_circuit_breaker(source)
+        if not breaker.allow_request():
+            logger.warning(f"Circuit open for {source}, skipping scrape for another {breaker.seconds_until_retry():.0f}s.")
+            SCRAPE_FAILURES.labels(source).inc()
+            return []
+
+        # Requests are retried individually inside the scraper, so the source is scraped once
+        scraper.max_attempts = self.max_retries
+        scraper.reset_errors()
+        start = time.perf_counter()
+        try:
+            logger.info(f"Scraping {source}.")
+            async with scraper:  # Use context manager to handle session
+                events = await scraper.scrape_events()
+        except Exception as e:
+            logger.error(f"Error scraping {source}: {e}", exc_info=not isinstance(e, ScrapeError))
+            breaker.record_failure()
+            SCRAPE_FAILURES.labels(source).inc()
+            return []
+        finally:
+            SCRAPE_SECONDS.labels(source).observe(time.perf_counter() - start)
+
+        if not events and scraper.request_errors:
+            # Scrapers swallow request errors, so an empty result with errors means the upstream failed
+            logger.error(f"No events from {source} after {len(scraper.request_errors)} failed request(s); last error: {scraper.request_errors[-1]}")
+            breaker.record_failure()
+            SCRAPE_FAILURES.labels(source).inc()
+            return []
+        breaker.record_success()
+        SCRAPE_EVENTS.labels(source).inc(len(events))
+
+        # Validate the batch once; every event shares the scrape timestamp
+        records = self._validate(source, events, scraped_at=datetime.now().strftime(SCRAPED_AT_FORMAT))
+        rows = [record.to_dict() for record in records]
+
+        changed = count_changed_events(self.cache_manager.get_cached_events(source), rows)
+        self.schedule_manager.record_run(source, len(rows), changed)
+        if rows:
+            logger.info(f"Successfully scraped {len(rows)} events from {source}.")
+            logger.info(f"Caching {len(rows)} events for {source}.")
+            self.cache_manager.cache_events(source, rows)
+        else:
+            logger.warning(f"No events found for {source}.")
+        return records
 
-    async def scrape_all_events(self) -> List[Dict[str, Any]]:
+    async def scrape_all_events(self, sources: Optional[List[str]] = None) -> List[EventRecord]:
         logger.info("Starting scrape_all_events process.")
-        """Scrape events from all configured sources"""
+        """Scrape events from all configured sources, or only from `sources` if given"""
         all_events = []
-        tasks = []
+        scrapers = self.scrapers
+        if sources is not None:
+            scrapers = [s for s in self.scrapers if self.source_name(s) in sources]
+            logger.info(f"Restricting scrape to sources: {[self.source_name(s) for s in scrapers]}")
 
-        for scraper in self.scrapers:
-            tasks.append(self._scrape_with_retry(scraper))
+        tasks = [self._scrape_with_retry(scraper) for scraper in scrapers]
         
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        with profile_scrape_if_armed("scrape_all_events"):
+            results = await asyncio.gather(*tasks, return_exceptions=True)
         
         for i, result in enumerate(results):
-            scraper_name = self.scrapers[i].__class__.__name__
+            scraper_name = scrapers[i].__class__.__name__
             if isinstance(result, Exception):
                 logger.error(f"Exception during scrape for {scraper_name}: {result}", exc_info=result)
             elif isinstance(result, list):
@@ -105,7 +159,15 @@ class ScraperManager:
         logger.info(f"Total events scraped from all sources: {len(all_events)}.")
         return all_events
 
-    async def scrape_events_from_source(self, source_name_param: str) -> List[Dict[str, Any]]:
+    async def scrape_due_events(self) -> List[EventRecord]:
+        """Scrape only the sources whose adaptive crawl interval has elapsed"""
+        due = self.due_sources()
+        if not due:
+            logger.info("No sources due for scraping.")
+            return []
+        return await self.scrape_all_events(sources=due)
+
+    async def scrape_events_from_source(self, source_name_param: str) -> List[EventRecord]:
         logger.info(f"Starting scrape_events_from_source for source: {source_name_param}.")
         """Scrape events from a specific source"""
         normalized_source_name = source_name_param.lower().replace('scraper', '').replace('api', '')
@@ -120,7 +182,8 @@ class ScraperManager:
             
         logger.info(f"Found scraper: {scraper.__class__.__name__} for source: {source_name_param}.")
         try:
-            events = await self._scrape_with_retry(scraper)
+            with profile_scrape_if_armed(f"scrape {self.source_name(scraper)}"):
+                events = await self._scrape_with_retry(scraper)
             logger.info(f"Retrieved {len(events)} events from source: {source_name_param}.")
             return events
         except Exception as e:
@@ -0,0 +1,43 @@
+#!/usr/bin/env python
+"""
+Export events or clubs to a file or stdout without loading the table into memory.
+
+    python -m app.scripts.export events --format csv --source BhaagoIndia --from 2026-01-01 -o events.csv
+"""
+import argparse
+import sys
+from datetime import date
+
+from app.db.export import FORMATS, ExportFilters, stream_export
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Stream a bulk export of events or clubs")
+    parser.add_argument("kind", choices=["events", "clubs"])
+    parser.add_argument("--format", choices=list(FORMATS), default="ndjson")
+    parser.add_argument("--source", help="Events from this source only")
+    parser.add_argument("--from", dest="date_from", type=date.fromisoformat, help="Events on or after this date (YYYY-MM-DD)")
+    parser.add_argument("--to", dest="date_to", type=date.fromisoformat, help="Events on or before this date (YYYY-MM-DD)")
+    verified = parser.add_mutually_exclusive_group()
+    verified.add_argument("--verified", dest="verified", action="store_const", const=True, help="Only verified events")
+    verified.add_argument("--unverified", dest="verified", action="store_const", const=False, help="Only unverified events")
+    parser.add_argument("-o", "--output", help="Output file (default: stdout)")
+    args = parser.parse_args(argv)
+
+    filters = ExportFilters(source=args.source, date_from=args.date_from, date_to=args.date_to, verified=args.verified)
+    try:
+        chunks = stream_export(args.kind, args.format, filters)
+    except ValueError as e:
+        parser.error(str(e))
+
+    out = open(args.output, "wb") if args.output else sys.stdout.buffer
+    try:
+        for chunk in chunks:
+            out.write(chunk)
+    finally:
+        if args.output:
+            out.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -2,7 +2,6 @@
 import schedule
 import time
 import asyncio
-import logging
 import os
 import sys
 from pathlib import Path
@@ -12,13 +11,12 @@ sys.path.append(str(Path(__file__).parent.parent.parent))
 
 # Import our scraper
 from app.scripts.smart_scraper import run_smart_scraper
+from app.scrapers.scraper_manager import ScraperManager
+from app.db.base import SessionLocal
+from app.db.facets import refresh_facets
+from app.core.logging_config import get_logger
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-)
-logger = logging.getLogger(__name__)
+logger = get_logger(__name__)
 
 def job():
     """Run the smart scraper as a scheduled job"""
@@ -29,21 +27,67 @@ def job():
     except Exception as e:
         logger.error(f"Error in scheduled scraping job: {e}")
 
+def adaptive_job():
+    """Run the smart scraper for sources whose adaptive crawl interval has elapsed"""
+    try:
+        due_sources = ScraperManager().due_sources()
+        if not due_sources:
+            logger.debug("No sources due for scraping")
+            return
+        logger.info(f"Running adaptive scraping job for sources: {due_sources}")
+        asyncio.run(run_smart_scraper(sources=due_sources))
+        logger.info("Adaptive scraping job completed successfully")
+    except Exception as e:
+        logger.error(f"Error in adaptive scraping job: {e}")
+
+def facets_job():
+    """Rebuild the event facet summary from scratch, dropping days that have passed"""
+    try:
+        with SessionLocal() as db:
+            refresh_facets(db)
+    except Exception as e:
+        logger.error(f"Error refreshing event facets: {e}")
+
 def main():
-    # Schedule the job
-    schedule_time = os.getenv("SCRAPER_SCHEDULE", "01:00")  # Default to 1:00 AM
-    
-    logger.info(f"Setting up scheduler to run smart scraper at {schedule_time} daily")
-    schedule.every().day.at(schedule_time).do(job)
-    
-    # Run once at startup
-    logger.info("Running initial scraping job on startup")
-    job()
-    
+    adaptive = os.getenv("SCRAPER_ADAPTIVE", "true").lower() in ("1", "true", "yes")
+
+    # The scheduler runs outside the API process, so it serves its own scrape metrics
+    metrics_port = os.getenv("SCRAPER_METRICS_PORT")
+    if metrics_port:
+        from prometheus_client import start_http_server
+        start_http_server(int(metrics_port))
+        logger.info(f"Serving scraper metrics on port {metrics_port}")
+
+    if adaptive:
+        # Check every few minutes which sources are due; each source's interval
+        # adapts to how often it actually yields new or changed events
+        check_minutes = int(os.getenv("SCRAPER_CHECK_MINUTES", "15"))
+        logger.info(f"Setting up adaptive scheduler, checking for due sources every {check_minutes} minutes")
+        schedule.every(check_minutes).minutes.do(adaptive_job)
+
+        logger.info("Running initial adaptive scraping job on startup")
+        adaptive_job()
+    else:
+        # Schedule the job
+        schedule_time = os.getenv("SCRAPER_SCHEDULE", "01:00")  # Default to 1:00 AM
+
+        logger.info(f"Setting up scheduler to run smart scraper at {schedule_time} daily")
+        schedule.every().day.at(schedule_time).do(job)
+
+        # Run once at startup
+        logger.info("Running initial scraping job on startup")
+        job()
+
+    # Writers keep the facet summary current; the nightly rebuild prunes past
+    # days and corrects any drift
+    facets_time = os.getenv("FACETS_REFRESH_TIME", "00:05")
+    logger.info(f"Setting up event facet rebuild at {facets_time} daily")
+    schedule.every().day.at(facets_time).do(facets_job)
+
     # Keep the script running
     while True:
         schedule.run_pending()
         time.sleep(60)  # Check schedule every minute
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    main()
@@ -1,90 +1,19 @@
 import asyncio
-import logging
+import time
 from datetime import datetime
-from typing import List, Dict, Any, Set
+from typing import List, Dict, Any, Set, Optional
 from sqlalchemy.orm import Session
 from rapidfuzz import fuzz
-from dateutil import parser as date_parser
 
 from app.scrapers.scraper_manager import ScraperManager
 from app.db.session import SessionLocal
 from app.models.event import Event
 from app.scrapers.db_handler import EventDBHandler
+from app.core.logging_config import get_logger, SAMPLED
+from app.core.metrics import SMART_SCRAPER_STAGE_SECONDS
+from app.scrapers.extraction import parse_date
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
-logger = logging.getLogger(__name__)
-
-def normalize_location( raw_location: str) -> str:
-    """Standardize known Indian city names"""
-    if not raw_location:
-        return "Other"
-    
-    raw = raw_location.strip().lower()
-
-    city_map = {
-        "delhi": "Delhi",
-        "new delhi": "Delhi",
-        "delhi ncr": "Delhi",
-        "gurgaon": "Gurgaon",
-        "gurugram": "Gurgaon",
-        "noida": "Noida",
-        "mumbai": "Mumbai",
-        "bombay": "Mumbai",
-        "thane": "Mumbai",
-        "navi mumbai": "Mumbai",
-        "pune": "Pune",
-        "bengaluru": "Bangalore",
-        "bangalore": "Bangalore",
-        "chennai": "Chennai",
-        "kolkata": "Kolkata",
-        "hyderabad": "Hyderabad",
-        "ahmedabad": "Ahmedabad",
-        "jaipur": "Jaipur",
-        "lucknow": "Lucknow",
-        "chandigarh": "Chandigarh",
-        "kochi": "Kochi",
-        "cochin": "Kochi",
-        "indore": "Indore",
-        "bhopal": "Bhopal",
-        "goa": "Goa",
-    }
-
-    return city_map.get(raw, raw_location.title())
-
-def normalize_category( raw_category: str) -> str:
-    """Standardize common category variants"""
-    if not raw_category:
-        return "Custom"
-    
-    raw = raw_category.strip().lower()
-
-    category_map = {
-        "3k": "3K",
-        "5k": "5K",
-        "10k": "10K",
-        "21.1k": "Half Marathon",
-        "21k": "Half Marathon",
-        "hm": "Half Marathon",
-        "half marathon": "Half Marathon",
-        "42k": "Marathon",
-        "marathon": "Marathon",
-        "m": "Marathon",
-        "ultra": "Ultra Marathon",
-        "50k": "Ultra Marathon",
-        "35k": "Ultra Marathon",
-        "running": "Custom",
-        "run": "Custom",
-        "general": "Custom",
-        "custom": "Custom",
-        "women's run": "Women's Run",
-    }
-
-    return category_map.get(raw, raw_category.title())
-
+logger = get_logger(__name__)
 
 class SmartScraper:
     def __init__(self, debug=False):
@@ -111,9 +40,9 @@ class SmartScraper:
             logger.error(f"Error fetching existing titles: {e}")
             return set()
 
-    async def smart_scrape_events(self) -> Dict[str, Any]:
+    async def smart_scrape_events(self, sources: Optional[List[str]] = None) -> Dict[str, Any]:
         """
-        Scrape events intelligently:
+        Scrape events intelligently (optionally only from `sources`):
         1. Get existing URLs and titles from database
         2. Pass them to scrapers to avoid re-scraping
         3. Process only new or updated events
@@ -134,12 +63,14 @@ class SmartScraper:
                 self.manager.clear_cache()
 
             # Get existing URLs and titles from database
-            existing_urls = await self.get_existing_urls()
-            existing_titles = await self.get_all_titles()
+            with SMART_SCRAPER_STAGE_SECONDS.labels("load_existing").time():
+                existing_urls = await self.get_existing_urls()
+                existing_titles = await self.get_all_titles()
             logger.info(f"Found {len(existing_urls)} existing URLs and {len(existing_titles)} titles in database")
 
             # Get all events from scrapers
-            all_events = await self.manager.scrape_all_events()
+            with SMART_SCRAPER_STAGE_SECONDS.labels("scrape").time():
+                all_events = await self.manager.scrape_all_events(sources=sources)
             logger.info(f"Scraped {len(all_events)} total events from all sources")
 
             # Process events and handle duplicates
@@ -147,35 +78,21 @@ class SmartScraper:
             urls_processed = set()
 
             today = datetime.now().date()
+            dedupe_start = time.perf_counter()
 
+            # Events arrive validated and normalized by the ingest stage (app.scrapers.ingest)
             for event in all_events:
 
-                url = event.get('url')
-                title = (event.get('title') or "").title()
-                event['title'] = title
+                url = event.url
+                title = event.title = event.title.title()
 
-                if 'location' in event :
-                    event['location'] = normalize_location(event['location'])
-                if 'categories' in event :
-                    event['categories'] = [normalize_category(cat) for cat in event['categories'] if isinstance(cat, str)]
-    
-                # Skip events without URL
-                if not url:
-                    logger.warning(f"Skipping event without URL: {title}")
+                # Validate date (must be today or in future); TBD dates are allowed
+                event_date = parse_date(event.date)
+                if event_date and event_date < today:
+                    logger.info("Skipping past event: %s (%s)", title, event_date, extra=SAMPLED)
+                    results["skipped_urls"] += 1
                     continue
 
-                # Validate date (must be today or in future)
-                try:
-                    event_date_str = event.get('date')
-                    if event_date_str:
-                        event_date = date_parser.parse(event_date_str).date()
-                        if event_date < today:
-                            logger.info(f"Skipping past event: {title} ({event_date})")
-                            results["skipped_urls"] += 1
-                            continue
-                except Exception as e:
-                    logger.warning(f"Invalid or missing date for event '{title}', allowing it: {e}")
-
                 # Skip duplicate URLs within current scrape batch
                 if url in urls_processed:
                     results["skipped_urls"] += 1
@@ -184,17 +101,17 @@ class SmartScraper:
 
                 # Check if URL exists in database
                 if url in existing_urls:
-                    print(f"Found existing URL: {url}")
+                    logger.info("Found existing URL: %s", url, extra=SAMPLED)
                     existing_event = self.db.query(Event).filter(Event.url == url).first()
 
-                    if (existing_event.title != event.get('title') or
-                        existing_event.date != event.get('date') or
-                        existing_event.price != event.get('price')):
+                    if (existing_event.title != event.title or
+                        existing_event.date != event.date or
+                        existing_event.price != event.price):
                         new_or_updated_events.append(event)
                         results["updated_events"] += 1
                         results["details"].append({
                             "action": "updated",
-                            "title": event.get('title'),
+                            "title": event.title,
                             "url": url
                         })
                 else:
@@ -203,7 +120,7 @@ class SmartScraper:
                     for existing_title in existing_titles:
                         if fuzz.ratio(title.lower(), existing_title.lower()) >= 90:
                             matched = True
-                            logger.info(f"Skipping event due to fuzzy title match: '{title}' ~ '{existing_title}'")
+                            logger.info("Skipping event due to fuzzy title match: '%s' ~ '%s'", title, existing_title, extra=SAMPLED)
                             results["skipped_urls"] += 1
                             break
 
@@ -216,10 +133,13 @@ class SmartScraper:
                             "url": url
                         })
                 
+            SMART_SCRAPER_STAGE_SECONDS.labels("dedupe").observe(time.perf_counter() - dedupe_start)
+
             # Bulk upsert events to database
             if new_or_updated_events:
                 logger.info(f"Upserting {len(new_or_updated_events)} events to database")
-                self.db_handler.upsert_events(new_or_updated_events)
+                with SMART_SCRAPER_STAGE_SECONDS.labels("upsert").time():
+                    self.db_handler.upsert_events(new_or_updated_events)
 
             logger.info(f"Smart scraping completed: {results['new_events']} new, "
                         f"{results['updated_events']} updated, {results['skipped_urls']} skipped")
@@ -240,13 +160,13 @@ class SmartScraper:
             self.db.close()
 
 
-async def run_smart_scraper(debug=False):
+async def run_smart_scraper(debug=False, sources: Optional[List[str]] = None):
     """Run the smart scraper"""
     logger.info("Starting smart scraper...")
     scraper = SmartScraper(debug=debug)
     
     try:
-        results = await scraper.smart_scrape_events()
+        results = await scraper.smart_scrape_events(sources=sources)
         logger.info(f"Smart scraper results: {results}")
         
         # Print summary
@@ -274,6 +194,7 @@ if __name__ == "__main__":
     import argparse
     parser = argparse.ArgumentParser(description='Run smart scraper')
     parser.add_argument('--debug', action='store_true', help='Enable debug mode')
+    parser.add_argument('--source', action='append', dest='sources', help='Only scrape this source (repeatable)')
     args = parser.parse_args()
     
-    asyncio.run(run_smart_scraper(debug=args.debug)) 
\ No newline at end of file
+    asyncio.run(run_smart_scraper(debug=args.debug, sources=args.sources)) 
\ No newline at end of file
@@ -0,0 +1,193 @@
+"""Deterministic synthetic rows and upstream fixtures for the benchmark suite."""
+import json
+import os
+import random
+from datetime import date, timedelta
+from typing import Any, Dict, List
+
+CITIES = ["Mumbai", "Delhi", "Bangalore", "Pune", "Chennai", "Hyderabad", "Kolkata", "Ahmedabad",
+          "Jaipur", "Kochi", "Goa", "Chandigarh", "Lucknow", "Indore", "Noida", "Gurgaon"]
+CATEGORIES = ["3K", "5K", "10K", "Half Marathon", "Marathon", "Ultra Marathon", "Custom"]
+WORDS = ["City", "Night", "Heritage", "Monsoon", "Coastal", "Hill", "Sunrise", "Trail", "Royal",
+         "Green", "Lake", "River", "Fort", "Winter", "Spring", "Freedom", "Unity", "Corporate"]
+# Filler for descriptions; avoids words the scrapers turn into extra fields (terrain, amenities, ...)
+FILLER = ["run", "race", "city", "morning", "runners", "join", "course", "finish", "start", "line",
+          "community", "fitness", "celebrate", "annual", "edition", "scenic", "route", "friends"]
+SOURCES = ["IndiaRunning", "BhaagoIndia.com", "User Submitted"]
+SKILL_LEVELS = ["Beginner", "Intermediate", "Advanced", "All Levels"]
+
+
+def _title(rng: random.Random, i: int) -> str:
+    return f"{rng.choice(WORDS)} {rng.choice(WORDS)} {rng.choice(CITIES)} Run {i}"
+
+
+def event_rows(count: int, seed: int = 42) -> List[Dict[str, Any]]:
+    """Events spread from a year ago to a year ahead, so roughly half are upcoming."""
+    from app.scrapers.geocoding import geocode_fields
+
+    rng = random.Random(seed)
+    today = date.today()
+    rows = []
+    for i in range(count):
+        city = rng.choice(CITIES)
+        event_date = today + timedelta(days=rng.randint(-365, 365))
+        rows.append({
+            "id": f"bench-event-{i}",
+            "title": _title(rng, i),
+            "date": event_date.strftime("%d %b %Y"),
+            "location": city,
+            "address": f"{rng.randint(1, 200)} {rng.choice(WORDS)} Road, {city}",
+            "categories": rng.sample(CATEGORIES, rng.randint(1, 3)),
+            "price": f"₹{rng.randint(2, 40) * 100}",
+            "url": f"https://example.com/events/bench-{i}",
+            "source": rng.choice(SOURCES),
+            "description": " ".join(rng.choice(WORDS) for _ in range(40)),
+            "registration_closes": (event_date - timedelta(days=7)).strftime("%d %b %Y"),
+            "scraped_at": today.strftime("%Y-%m-%d 00:00:00"),
+            "photos": [],
+            "is_verified": rng.random() < 0.8,
+            **geocode_fields(city),
+        })
+    return rows
+
+
+def club_rows(count: int, seed: int = 42) -> List[Dict[str, Any]]:
+    from app.scrapers.geocoding import geocode_fields
+
+    rng = random.Random(seed + 1)
+    rows = []
+    for i in range(count):
+        city = rng.choice(CITIES)
+        rows.append({
+            "id": f"bench-club-{i}",
+            "name": f"{rng.choice(WORDS)} {city} Runners {i}",
+            "location": city,
+            "address": f"{rng.randint(1, 200)} {rng.choice(WORDS)} Park, {city}",
+            "description": " ".join(rng.choice(WORDS) for _ in range(30)),
+            "established_year": str(rng.randint(1990, 2024)),
+            "meeting_times": ["Sat 06:00", "Sun 06:00"],
+            "contact_email": f"club{i}@example.com",
+            "contact_phone": None,
+            "website_url": f"https://example.com/clubs/{i}",
+            "social_media": {"instagram": f"@club{i}"},
+            "membership_fee": "Free",
+            "skill_level": rng.choice(SKILL_LEVELS),
+            "typical_routes": None,
+            "group_size": "20-50",
+            "logo_url": None,
+            "photos": [],
+            "amenities": [],
+            **geocode_fields(city),
+        })
+    return rows
+
+
+def seed_database(engine, events: int, clubs: int, seed: int = 42, chunk_size: int = 5000) -> None:
+    """Recreate the events, clubs and derived tables with synthetic rows."""
+    from app.db.base import Base
+    from app.models.event import Event
+    from app.models.club import Club
+    from app.models.event_facet import EventFacetCount
+    from app.models.event_tombstone import EventTombstone
+    from app.models.city import City
+    from app.models.category import Category, event_categories
+    from app.db.search import ensure_search_indexes
+    from app.db.geo import ensure_geo_columns
+    from app.db.facets import refresh_facets
+    from app.db.taxonomy import ensure_taxonomy
+    from app.db.home import ensure_event_day_index
+    from app.db.changes import ensure_change_tracking
+    from sqlalchemy.orm import Session
+
+    tables = [Event.__table__, Club.__table__, EventFacetCount.__table__, EventTombstone.__table__, City.__table__, Category.__table__, event_categories]
+    Base.metadata.drop_all(bind=engine, tables=tables)
+    Base.metadata.create_all(bind=engine, tables=tables)
+    with engine.begin() as conn:
+        for table, rows in ((Event.__table__, event_rows(events, seed)), (Club.__table__, club_rows(clubs, seed))):
+            for start in range(0, len(rows), chunk_size):
+                conn.execute(table.insert(), rows[start:start + chunk_size])
+    ensure_search_indexes(engine)
+    ensure_geo_columns(engine)
+    ensure_taxonomy(engine)
+    ensure_event_day_index(engine)
+    ensure_change_tracking(engine)
+    with Session(engine) as db:
+        refresh_facets(db)
+
+
+def _write(directory: str, name: str, content: str) -> str:
+    with open(os.path.join(directory, name), "w") as f:
+        f.write(content)
+    return name
+
+
+def make_scraper_fixtures(directory: str, events_per_source: int = 120, seed: int = 42) -> str:
+    """
+    Write synthetic upstream responses for every ScraperManager source, in the
+    index.json format FakeUpstream serves. Event dates are in the future so
+    SmartScraper keeps them.
+    """
+    rng = random.Random(seed)
+    os.makedirs(directory, exist_ok=True)
+    today = date.today()
+    index = []
+
+    # IndiaRunning: paginated JSON API, 12 events per page, a short page ends the scrape
+    page_size = 12
+    pages = events_per_source // page_size + 1
+    for page in range(1, pages + 1):
+        count = page_size if page < pages else events_per_source % page_size
+        events = []
+        for i in range(count):
+            n = (page - 1) * page_size + i
+            city = rng.choice(CITIES)
+            events.append({
+                "title": _title(rng, n),
+                "slug": f"bench-ir-{n}",
+                "eventDate": {"start": f"{today + timedelta(days=rng.randint(1, 300))}T06:00:00Z"},
+                "registrationDate": {"end": f"{today + timedelta(days=1)}T23:59:00Z"},
+                "locationInfo": {"addressLine1": f"{rng.randint(1, 99)} Main Road", "city": city, "state": "State"},
+                "categories": [{"category": c} for c in rng.sample(CATEGORIES, 2)],
+                "price": f"₹{rng.randint(2, 40) * 100}",
+                "aboutRace": [{"content": " ".join(rng.choice(FILLER) for _ in range(40))}],
+            })
+        index.append({
+            "method": "POST",
+            "url": "https://registrations-api.indiarunning.com/ir/events/filters",
+            "match_json": {"pageNo": page},
+            "content_type": "application/json",
+            "file": _write(directory, f"indiarunning_page_{page}.json", json.dumps({"events": events})),
+        })
+
+    # BhaagoIndia: one JSON search listing plus an HTML detail page per event
+    listing = []
+    for n in range(events_per_source):
+        city = rng.choice(CITIES)
+        path = f"/events/bench-bhaago-{n}/"
+        listing.append({"datatype": "event", "content": _title(rng, n), "url": path})
+        event_date = today + timedelta(days=rng.randint(1, 300))
+        html = (
+            "<html><body><div class='event-description'>"
+            + " ".join(rng.choice(FILLER) for _ in range(60))
+            + "</div>"
+            f"<div class='event-date'>{event_date.strftime('%d %b %Y')}</div>"
+            f"<div class='event-price'>₹ {rng.randint(2, 40) * 100}</div>"
+            f"<div class='event-location'>{city}</div>"
+            "</body></html>"
+        )
+        index.append({
+            "method": "GET",
+            "url": f"https://bhaagoindia.com{path}",
+            "content_type": "text/html",
+            "file": _write(directory, f"bhaago_event_{n}.html", html),
+        })
+    index.append({
+        "method": "GET",
+        "url": "https://bhaagoindia.com/search/?format=json",
+        "content_type": "application/json",
+        "file": _write(directory, "bhaago_search.json", json.dumps(listing)),
+    })
+
+    with open(os.path.join(directory, "index.json"), "w") as f:
+        json.dump(index, f, indent=1)
+    return directory
@@ -0,0 +1,87 @@
+"""Local HTTP server replaying saved upstream responses to the scrapers."""
+import asyncio
+import json
+import os
+import threading
+from typing import Any, Dict, List, Optional
+from urllib.parse import urlsplit
+from aiohttp import web
+
+
+class FakeUpstream:
+    """
+    Serves the responses listed in `<fixtures_dir>/index.json`:
+
+        [{"method": "GET", "url": "https://host/path?q", "file": "page.html",
+          "content_type": "text/html", "status": 200,
+          "match_json": {"pageNo": 1}}, ...]
+
+    Scrapers reach it through BaseScraper.upstream_url, which turns
+    https://host/path?q into {server}/host/path?q. `match_json` (optional)
+    must be a subset of the request's JSON body. Each response is delayed
+    by `latency_ms` to approximate a real network round trip.
+    """
+
+    def __init__(self, fixtures_dir: str, latency_ms: float = 0.0):
+        with open(os.path.join(fixtures_dir, "index.json")) as f:
+            entries = json.load(f)
+        self.routes: Dict[tuple, List[Dict[str, Any]]] = {}
+        for entry in entries:
+            parts = urlsplit(entry["url"])
+            target = parts.netloc + parts.path + (f"?{parts.query}" if parts.query else "")
+            with open(os.path.join(fixtures_dir, entry["file"]), "rb") as f:
+                entry = {**entry, "body": f.read()}
+            self.routes.setdefault((entry["method"].upper(), target), []).append(entry)
+        self.latency = latency_ms / 1000
+        self.requests_served = 0
+        self.url: Optional[str] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._runner: Optional[web.AppRunner] = None
+        self._thread: Optional[threading.Thread] = None
+
+    async def handle(self, request: web.Request) -> web.Response:
+        target = request.path_qs.lstrip("/")
+        candidates = self.routes.get((request.method, target), [])
+        body = None
+        if any("match_json" in c for c in candidates):
+            body = await request.json()
+        for entry in candidates:
+            wanted = entry.get("match_json")
+            if wanted and not all(body.get(k) == v for k, v in wanted.items()):
+                continue
+            if self.latency:
+                await asyncio.sleep(self.latency)
+            self.requests_served += 1
+            return web.Response(body=entry["body"], status=entry.get("status", 200),
+                                content_type=entry.get("content_type", "text/html"), charset="utf-8")
+        return web.Response(status=404, text=f"No fixture for {request.method} {target}")
+
+    def start(self) -> str:
+        """Run the server on its own thread and event loop, so it doesn't compete with the code under test."""
+        ready = threading.Event()
+
+        def run():
+            self._loop = asyncio.new_event_loop()
+            asyncio.set_event_loop(self._loop)
+            app = web.Application()
+            app.router.add_route("*", "/{tail:.*}", self.handle)
+            self._runner = web.AppRunner(app, access_log=None)
+            self._loop.run_until_complete(self._runner.setup())
+            site = web.TCPSite(self._runner, "127.0.0.1", 0)
+            self._loop.run_until_complete(site.start())
+            port = site._server.sockets[0].getsockname()[1]
+            self.url = f"http://127.0.0.1:{port}"
+            ready.set()
+            self._loop.run_forever()
+
+        self._thread = threading.Thread(target=run, name="fake-upstream", daemon=True)
+        self._thread.start()
+        ready.wait()
+        return self.url
+
+    def stop(self) -> None:
+        if self._loop is None:
+            return
+        asyncio.run_coroutine_threadsafe(self._runner.cleanup(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
@@ -0,0 +1,344 @@
+"""
+Benchmark the read API and the scrape pipeline against a throwaway database.
+
+    python -m benchmarks.run --database-url postgresql://localhost/bench --output results.json
+
+The database is wiped and reseeded, so never point this at a real one.
+See benchmarks/README.md for the full set of options.
+"""
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import shutil
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+# Mix of plain words, aliases, prefixes and misspellings
+SEARCH_TERMS = ["marathon", "bombay hm", "pune 10k", "bengal", "trail", "mumbay", "night run", "ultra"]
+
+
+def percentile(values: List[float], pct: float) -> float:
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def summarize(latencies: List[float], elapsed: float, errors: int) -> Dict[str, Any]:
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "throughput_rps": round(len(latencies) / elapsed, 2) if elapsed else 0.0,
+        "p50_ms": round(percentile(latencies, 50) * 1000, 2),
+        "p99_ms": round(percentile(latencies, 99) * 1000, 2),
+        "mean_ms": round(statistics.fmean(latencies) * 1000, 2) if latencies else 0.0,
+    }
+
+
+def git_commit() -> str:
+    try:
+        return subprocess.check_output(["git", "rev-parse", "HEAD"], cwd=BACKEND_DIR, text=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+# --- API ---------------------------------------------------------------------
+
+def start_api_server(database_url: str, server: str = "uvicorn", workers: int = 0) -> tuple:
+    """A single uvicorn process, or the gunicorn production profile (gunicorn.conf.py)."""
+    port = free_port()
+    env = {**os.environ, "DATABASE_URL": database_url, "LOG_LEVEL": "WARNING", "PORT": str(port)}
+    if server == "gunicorn":
+        if workers:
+            env["WEB_CONCURRENCY"] = str(workers)
+        command = [sys.executable, "-m", "gunicorn", "-c", "gunicorn.conf.py", "--bind", f"127.0.0.1:{port}", "app.main:app"]
+    else:
+        command = [sys.executable, "-m", "uvicorn", "app.main:app", "--host", "127.0.0.1", "--port", str(port), "--log-level", "warning"]
+    process = subprocess.Popen(command, cwd=BACKEND_DIR, env=env, stdout=subprocess.DEVNULL)
+    return process, f"http://127.0.0.1:{port}"
+
+
+async def wait_until_ready(session, base_url: str, timeout: float = 60) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            async with session.get(f"{base_url}/") as response:
+                if response.status == 200:
+                    return
+        except Exception:
+            pass
+        await asyncio.sleep(0.25)
+    raise RuntimeError("API server did not start")
+
+
+async def load_test(session, make_url, requests: int, concurrency: int, max_seconds: float, warmup: int = 3) -> Dict[str, Any]:
+    """Issue `requests` GETs (or as many as fit in max_seconds) from `concurrency` workers."""
+    for _ in range(warmup):
+        async with session.get(make_url()) as response:
+            await response.read()
+
+    latencies: List[float] = []
+    errors = 0
+    issued = 0
+    deadline = time.monotonic() + max_seconds
+
+    async def worker():
+        nonlocal issued, errors
+        while issued < requests and time.monotonic() < deadline:
+            issued += 1
+            start = time.perf_counter()
+            try:
+                async with session.get(make_url()) as response:
+                    await response.read()
+                    if response.status != 200:
+                        errors += 1
+            except Exception:
+                errors += 1
+            latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return summarize(latencies, time.perf_counter() - start, errors)
+
+
+async def bench_api(database_url: str, size: int, args) -> List[Dict[str, Any]]:
+    import aiohttp
+
+    process, base_url = start_api_server(database_url, args.server, args.workers)
+    rng = random.Random(size)
+    endpoints = {
+        "/api/events": lambda: f"{base_url}/api/events",
+        "/api/clubs": lambda: f"{base_url}/api/clubs",
+        "/api/home": lambda: f"{base_url}/api/home",
+        "/api/events/{id}": lambda: f"{base_url}/api/events/bench-event-{rng.randrange(size)}",
+        "/api/search": lambda: f"{base_url}/api/search?q={rng.choice(SEARCH_TERMS)}",
+    }
+    results = []
+    try:
+        connector = aiohttp.TCPConnector(limit=args.concurrency)
+        async with aiohttp.ClientSession(connector=connector, timeout=aiohttp.ClientTimeout(total=300)) as session:
+            await wait_until_ready(session, base_url)
+            for endpoint, make_url in endpoints.items():
+                stats = await load_test(session, make_url, args.requests, args.concurrency, args.max_seconds)
+                results.append({"size": size, "endpoint": endpoint, "concurrency": args.concurrency, "server": args.server, **stats})
+                print(f"  {endpoint:<18} {stats['throughput_rps']:>9} req/s  p50 {stats['p50_ms']} ms  p99 {stats['p99_ms']} ms", file=sys.stderr)
+    finally:
+        process.terminate()
+        process.wait()
+    return results
+
+
+# --- Scrape pipeline ---------------------------------------------------------
+
+def stage_totals() -> Dict[str, float]:
+    from prometheus_client import REGISTRY
+    stages = ("load_existing", "scrape", "dedupe", "upsert")
+    return {s: REGISTRY.get_sample_value("smart_scraper_stage_duration_seconds_sum", {"stage": s}) or 0.0 for s in stages}
+
+
+def isolated_manager(work_dir: str):
+    """A ScraperManager with its own cache and schedule files and no politeness delay."""
+    from app.cache.cache_manager import CacheManager
+    from app.cache.schedule_manager import SourceScheduleManager
+    from app.scrapers.scraper_manager import ScraperManager
+
+    shutil.rmtree(work_dir, ignore_errors=True)
+    manager = ScraperManager(adaptive=False)
+    manager.cache_manager = CacheManager(cache_dir=work_dir)
+    manager.schedule_manager = SourceScheduleManager(cache_dir=work_dir)
+    for scraper in manager.scrapers:
+        scraper.page_delay = 0
+    return manager
+
+
+async def bench_scrape(size: int, args, work_dir: str) -> Dict[str, Any]:
+    from app.scripts.smart_scraper import SmartScraper
+
+    scrape_runs = []
+    for _ in range(args.scrape_runs):
+        manager = isolated_manager(work_dir)
+        start = time.perf_counter()
+        events = await manager.scrape_all_events()
+        scrape_runs.append({"seconds": round(time.perf_counter() - start, 4), "events": len(events)})
+
+    smart_runs = []
+    for run in range(args.scrape_runs):
+        smart = SmartScraper()
+        smart.manager = isolated_manager(work_dir)
+        before = stage_totals()
+        start = time.perf_counter()
+        results = await smart.smart_scrape_events()
+        elapsed = time.perf_counter() - start
+        after = stage_totals()
+        smart_runs.append({
+            "run": run + 1,
+            "seconds": round(elapsed, 4),
+            "new_events": results["new_events"],
+            "updated_events": results["updated_events"],
+            "skipped": results["skipped_urls"],
+            "errors": results["errors"],
+            "stages_seconds": {s: round(after[s] - before[s], 4) for s in after},
+        })
+
+    summary = {
+        "size": size,
+        "scrape_all_events": scrape_runs,
+        "scrape_all_events_median_s": statistics.median(r["seconds"] for r in scrape_runs),
+        "smart_scrape_events": smart_runs,
+    }
+    print(f"  scrape_all_events median {summary['scrape_all_events_median_s']} s; "
+          f"smart_scrape_events {[r['seconds'] for r in smart_runs]} s", file=sys.stderr)
+    return summary
+
+
+# --- Startup -----------------------------------------------------------------
+
+# Modules the API process should only load on first use
+LAZY_MODULES = ["aiohttp", "bs4", "lxml", "rapidfuzz", "supabase", "psycopg2", "apscheduler", "httpx", "requests"]
+
+STARTUP_PROBE = """
+import json, resource, sys, time
+start = time.perf_counter()
+import app.main
+elapsed = time.perf_counter() - start
+rss_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+lazy = %r
+print(json.dumps({"seconds": elapsed, "max_rss_mb": rss_kb / 1024,
+                  "modules": len(sys.modules), "loaded_lazy_modules": [m for m in lazy if m in sys.modules]}))
+"""
+
+
+def bench_startup(database_url: str, runs: int) -> Dict[str, Any]:
+    """Cold `import app.main` in fresh interpreters: wall time, peak RSS and what got imported."""
+    env = {**os.environ, "DATABASE_URL": database_url, "LOG_LEVEL": "WARNING"}
+    samples = []
+    for _ in range(runs):
+        output = subprocess.check_output(
+            [sys.executable, "-c", STARTUP_PROBE % LAZY_MODULES], cwd=BACKEND_DIR, env=env, text=True,
+        )
+        samples.append(json.loads(output.strip().splitlines()[-1]))
+    summary = {
+        "runs": runs,
+        "import_median_s": round(statistics.median(s["seconds"] for s in samples), 4),
+        "import_min_s": round(min(s["seconds"] for s in samples), 4),
+        "max_rss_mb": round(max(s["max_rss_mb"] for s in samples), 1),
+        "modules": samples[-1]["modules"],
+        "loaded_lazy_modules": samples[-1]["loaded_lazy_modules"],
+    }
+    print(f"  import app.main median {summary['import_median_s']} s, peak RSS {summary['max_rss_mb']} MB", file=sys.stderr)
+    return summary
+
+
+# --- Entry point -------------------------------------------------------------
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the read API and scrape pipeline")
+    parser.add_argument("--database-url", default=os.getenv("BENCH_DATABASE_URL"),
+                        help="Throwaway Postgres database; it is wiped and reseeded (or BENCH_DATABASE_URL)")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000], help="Event rows to seed per round")
+    parser.add_argument("--clubs-ratio", type=float, default=0.1, help="Clubs seeded per event row")
+    parser.add_argument("--requests", type=int, default=200, help="Requests per endpoint")
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--server", choices=["uvicorn", "gunicorn"], default="uvicorn",
+                        help="Single uvicorn process, or the multi-worker production profile")
+    parser.add_argument("--workers", type=int, default=0, help="Workers for --server gunicorn (default: one per core)")
+    parser.add_argument("--max-seconds", type=float, default=30, help="Time cap per endpoint")
+    parser.add_argument("--fixtures", help="Saved upstream responses (index.json format); synthetic ones are generated if omitted")
+    parser.add_argument("--archive", help="Replay a recorded scrape archive (app.scrapers.replay) instead of a fake upstream")
+    parser.add_argument("--scrape-events", type=int, default=120, help="Events per source in generated fixtures")
+    parser.add_argument("--latency-ms", default="20", help="Latency added to each upstream response, or 'recorded' with --archive")
+    parser.add_argument("--scrape-runs", type=int, default=3)
+    parser.add_argument("--startup-runs", type=int, default=5, help="Fresh interpreters timed importing app.main")
+    parser.add_argument("--skip-startup", action="store_true")
+    parser.add_argument("--skip-api", action="store_true")
+    parser.add_argument("--skip-scrape", action="store_true")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", help="Write JSON results here instead of stdout")
+    args = parser.parse_args()
+
+    if not args.database_url:
+        parser.error("--database-url (or BENCH_DATABASE_URL) is required")
+
+    # Must be set before app modules create their engines
+    os.environ["DATABASE_URL"] = args.database_url
+    os.environ.setdefault("LOG_LEVEL", "WARNING")
+    sys.path.insert(0, str(BACKEND_DIR))
+
+    from sqlalchemy import create_engine
+    from app.scrapers.base_scraper import BaseScraper
+    from benchmarks.datasets import make_scraper_fixtures, seed_database
+    from benchmarks.fake_upstream import FakeUpstream
+
+    engine = create_engine(args.database_url)
+    temp_dir = tempfile.mkdtemp(prefix="bench-")
+    upstream = None
+    if args.archive and not args.skip_scrape:
+        from app.scrapers import replay
+        replay.configure("replay", args.archive, args.latency_ms)
+    elif not args.skip_scrape:
+        fixtures = args.fixtures or make_scraper_fixtures(os.path.join(temp_dir, "fixtures"), args.scrape_events, args.seed)
+        upstream = FakeUpstream(fixtures, latency_ms=float(args.latency_ms))
+        BaseScraper.upstream_url = upstream.start()
+
+    report = {
+        "meta": {
+            "started_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "git_commit": git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "args": {k: v for k, v in vars(args).items() if k != "database_url"},
+        },
+        "startup": None,
+        "api": [],
+        "scrape": [],
+    }
+    try:
+        if not args.skip_startup:
+            print("Timing API cold start...", file=sys.stderr)
+            report["startup"] = bench_startup(args.database_url, args.startup_runs)
+        for size in args.sizes:
+            clubs = max(1, int(size * args.clubs_ratio))
+            print(f"Seeding {size} events and {clubs} clubs...", file=sys.stderr)
+            seed_database(engine, size, clubs, seed=args.seed)
+            if not args.skip_api:
+                report["api"].extend(asyncio.run(bench_api(args.database_url, size, args)))
+            if not args.skip_scrape:
+                report["scrape"].append(asyncio.run(bench_scrape(size, args, os.path.join(temp_dir, "cache"))))
+        if upstream is not None:
+            report["meta"]["upstream_requests_served"] = upstream.requests_served
+    finally:
+        if upstream is not None:
+            upstream.stop()
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(output + "\n")
+        print(f"Results written to {args.output}", file=sys.stderr)
+    else:
+        print(output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""
+Production server profile: gunicorn managing uvicorn workers.
+
+    gunicorn -c gunicorn.conf.py app.main:app
+
+Each worker is a separate process with its own engine, caches and event loop
+(uvloop and httptools, picked up automatically when installed). The app is
+imported once in the master and forked, so module state and bytecode are
+shared copy-on-write. Tune with WEB_CONCURRENCY, PORT and
+GUNICORN_TIMEOUT.
+"""
+import math
+import os
+import shutil
+import tempfile
+
+
+def available_cpus() -> int:
+    """CPUs this container may actually use: the cgroup quota if set, else the affinity mask."""
+    try:
+        with open("/sys/fs/cgroup/cpu.max") as f:  # cgroup v2: "<quota> <period>" or "max <period>"
+            quota, period = f.read().split()
+        if quota != "max":
+            return max(1, math.ceil(int(quota) / int(period)))
+    except (OSError, ValueError):
+        pass
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+bind = f"0.0.0.0:{os.getenv('PORT', '8000')}"
+# Async workers don't block on I/O, so one per core is enough
+workers = int(os.getenv("WEB_CONCURRENCY", available_cpus()))
+worker_class = "uvicorn.workers.UvicornWorker"
+preload_app = True
+timeout = int(os.getenv("GUNICORN_TIMEOUT", "60"))
+graceful_timeout = 30
+keepalive = 5
+# Recycle workers now and then so slow leaks can't accumulate
+max_requests = 5000
+max_requests_jitter = 500
+accesslog = None
+
+# Per-worker Prometheus samples are written here and merged by /metrics; must
+# be set before prometheus_client is imported, i.e. before the app is preloaded
+_metrics_dir = os.environ.setdefault("PROMETHEUS_MULTIPROC_DIR", os.path.join(tempfile.gettempdir(), "runzaar-metrics"))
+shutil.rmtree(_metrics_dir, ignore_errors=True)
+os.makedirs(_metrics_dir, exist_ok=True)
+
+
+def child_exit(server, worker):
+    from prometheus_client import multiprocess
+    multiprocess.mark_process_dead(worker.pid)
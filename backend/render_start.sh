@@ -1,6 +1,13 @@
 #!/bin/bash
 set -e
 
-# Start the FastAPI application
-echo "Starting FastAPI application..."
-exec uvicorn app.main:app --host 0.0.0.0 --port $PORT 
+# Start the FastAPI application. SERVER_PROFILE=dev runs a single uvicorn
+# process; the default production profile runs gunicorn with one uvicorn
+# worker per available core (see gunicorn.conf.py).
+if [ "${SERVER_PROFILE:-production}" = "dev" ]; then
+    echo "Starting FastAPI application (single process)..."
+    exec uvicorn app.main:app --host 0.0.0.0 --port $PORT
+fi
+
+echo "Starting FastAPI application (gunicorn, ${WEB_CONCURRENCY:-auto} workers)..."
+exec gunicorn -c gunicorn.conf.py app.main:app
@@ -0,0 +1,63 @@
+from datetime import date
+
+import pytest
+
+from app.scrapers.extraction import find_date, format_date, parse_date
+
+TODAY = date(2026, 10, 19)
+
+
+@pytest.mark.parametrize("raw, expected", [
+    ("31st May 2024", date(2024, 5, 31)),
+    ("31 May 2024", date(2024, 5, 31)),
+    ("31-May-2024", date(2024, 5, 31)),
+    ("Sun, 5th Jan 2025", date(2025, 1, 5)),
+    ("May 31, 2024", date(2024, 5, 31)),
+    ("2024-05-31T06:00:00Z", date(2024, 5, 31)),
+    ("2025/04/05", date(2025, 4, 5)),
+    ("31/05/2024", date(2024, 5, 31)),
+    ("05/31/2024", date(2024, 5, 31)),
+    ("31-05-2024", date(2024, 5, 31)),
+    ("Dec 2025", date(2025, 12, 1)),
+    ("September 2024", date(2024, 9, 1)),
+])
+def test_dates_with_a_year(raw, expected):
+    assert find_date(raw, TODAY) == expected
+
+
+@pytest.mark.parametrize("raw, expected", [
+    ("May 31 - Jun 2, 2024", date(2024, 5, 31)),
+    ("31 May - 2 Jun 2024", date(2024, 5, 31)),
+    ("15 - 16 March 2025", date(2025, 3, 15)),
+    ("March 15-16, 2025", date(2025, 3, 15)),
+    ("Dec 30 - Jan 2, 2025", date(2024, 12, 30)),
+])
+def test_ranges_give_the_start_date_in_the_trailing_year(raw, expected):
+    assert find_date(raw, TODAY) == expected
+
+
+@pytest.mark.parametrize("raw, expected", [
+    ("31 May", date(2027, 5, 31)),
+    ("May 31", date(2027, 5, 31)),
+    ("19 Oct", date(2026, 10, 19)),
+    ("Dec 5th", date(2026, 12, 5)),
+    ("15-16 March", date(2027, 3, 15)),
+])
+def test_year_less_dates_are_the_next_occurrence(raw, expected):
+    assert find_date(raw, TODAY) == expected
+
+
+@pytest.mark.parametrize("raw", [None, "", "Date TBD", "TBA", "coming soon", "31 Feb 2025"])
+def test_unparseable_dates(raw):
+    assert parse_date(raw) is None
+    assert format_date(raw) == "Date TBD"
+
+
+def test_page_scans_skip_year_less_and_month_only_dates():
+    text = "Updated Nov 2024. Join us on 5 May for the run. Race day: 12 Jan 2025"
+    assert find_date(text, TODAY, require_year=True) == date(2025, 1, 12)
+    assert find_date("Race weekend May 31 - Jun 2, 2024", TODAY, require_year=True) == date(2024, 5, 31)
+
+
+def test_format_date():
+    assert format_date("May 31 - Jun 2, 2024") == "31 May 2024"
@@ -14,9 +14,16 @@ import ClubsPage from './pages/ClubsPage'
 import ClubDetailPage from './pages/ClubDetailPage'
 import ScrollToTop from './components/ScrollToTop'
 import AnalyticsWrapper from './components/AnalyticsWrapper'
+import LiveUpdates from './components/LiveUpdates'
 // import ClubSubmissionForm from './components/ClubSubmissionForm'
 
-const queryClient = new QueryClient()
+// The live update stream (see useLiveUpdates) invalidates changed data, so
+// lists are not refetched just because the window regained focus
+const queryClient = new QueryClient({
+  defaultOptions: {
+    queries: { refetchOnWindowFocus: false },
+  },
+})
 
 
 function App() {
@@ -26,6 +33,7 @@ function App() {
         <Router>
           <ScrollToTop />
           <AnalyticsWrapper />
+          <LiveUpdates />
           <Routes>
             <Route element={<MainLayout />}>
               <Route path="/" element={<HomePage />} />
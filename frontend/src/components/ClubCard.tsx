@@ -4,6 +4,7 @@ import React from 'react';
 import { Link } from 'react-router-dom';
 import { animatedGlassCard } from '../styles/commonStyles';
 import { UsersIcon, ClockIcon, PriceIcon } from './Icons';
+import { getImageVariant, fallbackToOriginal } from '../utils/imageUtils';
 
 interface RunningClub {
   id: string;
@@ -47,7 +48,8 @@ const ClubCard: React.FC<ClubCardProps> = ({ club, index }) => {
         <div className="h-40 w-full rounded-t-2xl overflow-hidden">
           {imageUrl ? (
             <img
-              src={imageUrl}
+              src={getImageVariant(imageUrl)}
+              onError={fallbackToOriginal(imageUrl)}
               alt={`${club.name} image`}
               className="h-full w-full object-cover transition-transform duration-300 group-hover:scale-105"
             />
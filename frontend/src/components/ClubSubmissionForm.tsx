@@ -1,7 +1,7 @@
 import React, { useState } from 'react';
 import { useMutation } from '@tanstack/react-query';
 import { useNavigate } from 'react-router-dom';
-import api from '../services/api';
+import api, { uploadImage } from '../services/api';
 import '../styles/custom.css'; // Ensure custom styles are imported
 import { MAJOR_CITIES } from '../config/constants'; // Corrected import path
 import ReCAPTCHA from 'react-google-recaptcha';
@@ -214,28 +214,16 @@ export default function ClubSubmissionForm({ onSuccess }: ClubSubmissionFormProp
       try {
         for (let i = 0; i < selectedImages.length; i++) {
           const file = selectedImages[i];
-          const fileExt = file.name.split('.').pop() || 'jpeg';
-
-          const formDataToSend = new FormData();
-          formDataToSend.append('type', 'club');  
-          // Use current date for 'event_date' as clubs don't have a specific event date
-          formDataToSend.append('event_date', new Date().toISOString().slice(0, 10)); 
-          formDataToSend.append('event_name', formData.name.trim()); // Use club name
-          formDataToSend.append('file_ext', fileExt);
-          formDataToSend.append('index', (i + 1).toString());
-          formDataToSend.append('file', file);
-
-          const { data } = await api.post('/media/generate-upload-url/', formDataToSend, {
-            headers: { 'Content-Type': 'multipart/form-data' }
-          });
 
-          await fetch(data.upload_url, {
-            method: 'PUT',
-            headers: { 'Content-Type': file.type },
-            body: file,
+          const publicUrl = await uploadImage(file, {
+            type: 'club',
+            // Use current date for 'event_date' as clubs don't have a specific event date
+            event_date: new Date().toISOString().slice(0, 10),
+            event_name: formData.name.trim(), // Use club name
+            index: i + 1,
           });
 
-          uploadedImageUrls.push(data.public_url);
+          uploadedImageUrls.push(publicUrl);
 
           setImageUploadProgress(prev => {
             const copy = [...prev];
@@ -2,7 +2,7 @@
 import { Link } from 'react-router-dom';
 import { formatDate } from '../utils/dateUtils';
 import { Event } from '../services/api';
-import { getRandomEventImage } from '../utils/imageUtils';
+import { getRandomEventImage, getImageVariant, fallbackToOriginal } from '../utils/imageUtils';
 import { animatedGlassCard } from '../styles/commonStyles';
 import { CalendarIcon, LocationIcon } from './Icons';
 import { formatPrice } from '../utils/currencyUtils';
@@ -31,7 +31,8 @@ export default function EventCard({ event, index = 0 }: EventCardProps) {
       {/* Event Image */}
       <div className="relative h-48 w-full overflow-hidden">
         <img
-          src={imageUrl}
+          src={getImageVariant(imageUrl)}
+          onError={fallbackToOriginal(imageUrl)}
           alt={event.title || 'Event image'}
           loading="lazy"
           className="absolute inset-0 w-full h-full object-cover"
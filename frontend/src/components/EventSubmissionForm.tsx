@@ -5,7 +5,7 @@ import ReCAPTCHA from 'react-google-recaptcha';
 import { MAJOR_CITIES, PREDEFINED_EVENT_CATEGORIES } from '../config/constants';
 import { formatDate } from '../utils/dateUtils';
 import '../styles/custom.css';
-import api from '../services/api';
+import api, { uploadImage } from '../services/api';
 
 
 interface EventSubmissionFormProps {
@@ -116,7 +116,6 @@ export default function EventSubmissionForm({ onSuccess }: EventSubmissionFormPr
       try {
         for (let i = 0; i < selectedImages.length; i++) {
           const file = selectedImages[i];
-          const fileExt = file.name.split('.').pop() || 'jpeg';
 
           // Simulate progress for demonstration. In a real app, you'd use a progress event listener.
           // For actual upload, keep the `api.post` and `fetch` part.
@@ -126,39 +125,14 @@ export default function EventSubmissionForm({ onSuccess }: EventSubmissionFormPr
             return copy;
           });
 
-          const uploadForm = new FormData();
-          uploadForm.append('type', 'event');
-          uploadForm.append('event_date', formData.date);
-          uploadForm.append('event_name', formData.title);
-          uploadForm.append('file_ext', fileExt);
-          uploadForm.append('index', (i + 1).toString());
-          uploadForm.append('file', file);
-
-          const { data } = await api.post('/media/generate-upload-url/', uploadForm, {
-            headers: { 'Content-Type': 'multipart/form-data' },
-          });
-
-          // Simulate upload progress with a delay (remove in production)
-          // const interval = setInterval(() => {
-          //   setImageUploadProgress(prev => {
-          //     const copy = [...prev];
-          //     if (copy[i] < 95) {
-          //       copy[i] += 5; // Increment by 5%
-          //     }
-          //     return copy;
-          //   });
-          // }, 100);
-
-          await fetch(data.upload_url, {
-            method: 'PUT',
-            headers: { 'Content-Type': file.type },
-            body: file,
-            // You would normally add an onUploadProgress callback here if using libraries like Axios
-            // and update imageUploadProgress more dynamically.
+          const publicUrl = await uploadImage(file, {
+            type: 'event',
+            event_date: formData.date,
+            event_name: formData.title,
+            index: i + 1,
           });
 
-          // clearInterval(interval); // Clear simulation interval
-          uploadedImageUrls.push(data.public_url);
+          uploadedImageUrls.push(publicUrl);
           setImageUploadProgress(prev => {
             const copy = [...prev];
             copy[i] = 100; // Mark as 100% complete
@@ -0,0 +1,9 @@
+// src/components/LiveUpdates.tsx
+import useLiveUpdates from '../hooks/useLiveUpdates'
+
+const LiveUpdates = () => {
+  useLiveUpdates()
+  return null
+}
+
+export default LiveUpdates
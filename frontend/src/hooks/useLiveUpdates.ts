@@ -0,0 +1,33 @@
+import { useEffect } from 'react'
+import { useQueryClient } from '@tanstack/react-query'
+import api from '../services/api'
+
+// Query keys holding data for each server-side topic
+const TOPIC_QUERIES: Record<string, string[][]> = {
+  events: [['allEvents'], ['event'], ['eventFacets'], ['eventSearch'], ['home']],
+  clubs: [['clubs'], ['club'], ['home']],
+}
+
+// Listens to the API's live update stream and refetches only the queries
+// whose data changed, instead of polling the full lists
+const useLiveUpdates = () => {
+  const queryClient = useQueryClient()
+
+  useEffect(() => {
+    if (typeof EventSource === 'undefined') return
+    const source = new EventSource(`${api.defaults.baseURL}/events/live`)
+
+    source.addEventListener('change', (message) => {
+      const { topics } = JSON.parse((message as MessageEvent).data) as { topics: string[] }
+      topics.forEach((topic) => {
+        (TOPIC_QUERIES[topic] ?? []).forEach((queryKey) => queryClient.invalidateQueries({ queryKey }))
+      })
+    })
+    // Updates may have been missed (slow connection or server reconnect)
+    source.addEventListener('resync', () => queryClient.invalidateQueries())
+
+    return () => source.close()
+  }, [queryClient])
+}
+
+export default useLiveUpdates
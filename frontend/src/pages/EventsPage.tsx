@@ -1,6 +1,6 @@
 import { useState, useMemo, useEffect } from 'react'
 import { useQuery } from '@tanstack/react-query'
-import { getEvents, Event } from '../services/api'
+import { getEvents, getEventFacets, searchCatalog, Event } from '../services/api'
 import { compareDates } from '../utils/dateUtils'
 import '../styles/custom.css'
 import PageContainer from '../components/PageContainer'
@@ -13,18 +13,51 @@ interface ExtendedEvent extends Event {
   description?: string;
 }
 
+// Filter on the canonical names, which is what the facet counts are keyed on
+const eventCity = (event: ExtendedEvent) => event.city ?? event.location
+const eventCategories = (event: ExtendedEvent) => event.canonical_categories ?? event.categories
+
 export default function EventsPage() {
   const [searchParams, setSearchParams] = useSearchParams();
   const [searchTerm, setSearchTerm] = useState('')
   const [selectedCategory, setSelectedCategory] = useState<string>(searchParams.get('category') || '')
   const [selectedLocation, setSelectedLocation] = useState<string>(searchParams.get('location') || '')
   const [isFilterVisible, setIsFilterVisible] = useState(false)
+  const [debouncedSearch, setDebouncedSearch] = useState('')
 
   const { data: allEvents = [], isLoading: isLoadingAllEvents, error: allError } = useQuery<ExtendedEvent[]>({
     queryKey: ['allEvents'],
     queryFn: getEvents,
   })
 
+  // Upcoming-event counts for the filter dropdowns, precomputed server side
+  const { data: facets } = useQuery({
+    queryKey: ['eventFacets'],
+    queryFn: getEventFacets,
+    staleTime: 5 * 60_000,
+  })
+  const facetCounts = useMemo(() => ({
+    category: new Map((facets?.category ?? []).map((f) => [f.value, f.count])),
+    city: new Map((facets?.city ?? []).map((f) => [f.value, f.count])),
+  }), [facets]);
+
+  useEffect(() => {
+    const timer = setTimeout(() => setDebouncedSearch(searchTerm.trim()), 250);
+    return () => clearTimeout(timer);
+  }, [searchTerm]);
+
+  // Server-side search (synonyms, typos, descriptions); falls back to a local
+  // title match while it loads or if it fails
+  const { data: searchMatches } = useQuery<Set<string>>({
+    queryKey: ['eventSearch', debouncedSearch],
+    queryFn: async () => {
+      const response = await searchCatalog(debouncedSearch, { type: 'event', limit: 50 });
+      return new Set(response.results.map((result) => result.id));
+    },
+    enabled: debouncedSearch.length >= 2,
+    staleTime: 60_000,
+  })
+
   // Update URL when filters change
   useEffect(() => {
     const params = new URLSearchParams();
@@ -44,8 +77,8 @@ export default function EventsPage() {
     const categoriesSet = new Set<string>()
     const locationsSet = new Set<string>()
     sortedAllEvents.forEach((event: ExtendedEvent) => {
-      event.categories.forEach((category: string) => categoriesSet.add(category))
-      locationsSet.add(event.location)
+      eventCategories(event).forEach((category: string) => categoriesSet.add(category))
+      locationsSet.add(eventCity(event))
     })
     return {
       categories: Array.from(categoriesSet).sort(),
@@ -62,13 +95,15 @@ export default function EventsPage() {
       const eventDate = new Date(event.date);
       eventDate.setHours(0, 0, 0, 0); // also normalize event date
       const isUpcoming = eventDate >= today;
-      const matchesSearch = event.title.toLowerCase().includes(searchTerm.toLowerCase());
-      const matchesCategory = !selectedCategory || event.categories.includes(selectedCategory);
-      const matchesLocation = !selectedLocation || event.location.toLowerCase() === selectedLocation.toLowerCase();
+      const matchesSearch = searchMatches && debouncedSearch.length >= 2
+        ? searchMatches.has(event.id)
+        : event.title.toLowerCase().includes(searchTerm.toLowerCase());
+      const matchesCategory = !selectedCategory || eventCategories(event).includes(selectedCategory);
+      const matchesLocation = !selectedLocation || eventCity(event).toLowerCase() === selectedLocation.toLowerCase();
 
       return isUpcoming && matchesSearch && matchesCategory && matchesLocation;
     });
-  }, [sortedAllEvents, searchTerm, selectedCategory, selectedLocation]);
+  }, [sortedAllEvents, searchTerm, debouncedSearch, searchMatches, selectedCategory, selectedLocation]);
 
   if (isLoadingAllEvents) {
     return (
@@ -170,7 +205,7 @@ export default function EventsPage() {
                   <option value="">All Categories</option>
                   {categories.map((category: string) => (
                     <option key={category} value={category}>
-                      {category}
+                      {category}{facetCounts.category.has(category) ? ` (${facetCounts.category.get(category)})` : ''}
                     </option>
                   ))}
                 </select>
@@ -188,7 +223,7 @@ export default function EventsPage() {
                   <option value="">All Locations</option>
                   {locations.map((location: string) => (
                     <option key={location} value={location}>
-                      {location}
+                      {location}{facetCounts.city.has(location) ? ` (${facetCounts.city.get(location)})` : ''}
                     </option>
                   ))}
                 </select>
@@ -210,7 +245,7 @@ export default function EventsPage() {
                   <option value="">All Categories</option>
                   {categories.map((category: string) => (
                     <option key={category} value={category}>
-                      {category}
+                      {category}{facetCounts.category.has(category) ? ` (${facetCounts.category.get(category)})` : ''}
                     </option>
                   ))}
                 </select>
@@ -228,7 +263,7 @@ export default function EventsPage() {
                   <option value="">All Locations</option>
                   {locations.map((location: string) => (
                     <option key={location} value={location}>
-                      {location}
+                      {location}{facetCounts.city.has(location) ? ` (${facetCounts.city.get(location)})` : ''}
                     </option>
                   ))}
                 </select>
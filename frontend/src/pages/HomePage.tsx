@@ -2,15 +2,13 @@
 // src/pages/HomePage.tsx
 import { Link } from 'react-router-dom';
 import { useQuery } from '@tanstack/react-query';
-import { getEvents, Event } from '../services/api';
-import { compareDates } from '../utils/dateUtils';
+import { getHome, Event } from '../services/api';
 import '../styles/custom.css';
 import PageContainer from '../components/PageContainer';
 import { useEffect, useRef, useState } from 'react';
 import { cityImages, PREDEFINED_EVENT_CATEGORIES, MAJOR_CITIES } from '../config/constants';
 import EventCard from '../components/EventCard';
 import ClubCard from '../components/ClubCard'; 
-import api from '../services/api'; 
 import { CalendarIcon, UsersIcon } from '../components/Icons';
 
 interface AnimatedElementProps {
@@ -79,33 +77,25 @@ interface RunningClub {
 }
 
 export default function HomePage() {
-  const { data: events = [] } = useQuery<ExtendedEvent[]>({
-    queryKey: ['events'],
-    queryFn: getEvents,
-  });
-
-  const { data: clubs = [], isLoading: isLoadingClubs, error: clubsError } = useQuery<RunningClub[]>({
-    queryKey: ['clubs'],
+  const { data: home, isLoading: isLoadingClubs, error: clubsError } = useQuery({
+    queryKey: ['home'],
     queryFn: async () => {
       try {
-        const response = await api.get('/clubs');
-        return response.data;
+        return await getHome(8, 3);
       } catch (error: any) {
         throw new Error(error?.response?.data?.message || 'Failed to load running clubs');
       }
     },
   });
-  
-  // Sort upcoming events by date, show up to 8 for marquee
-  const upcomingEvents = events
-    .sort((a, b) => compareDates(a.date, b.date))
-    .slice(0, 8);
 
-  const featuredClubs = clubs.slice(0, 3);
+  // The API returns the next 8 upcoming events, soonest first, for the marquee
+  const upcomingEvents: ExtendedEvent[] = home?.events ?? [];
+
+  const featuredClubs: RunningClub[] = home?.clubs ?? [];
 
-  // Calculate event counts per city for major cities only
+  // Event counts per city for major cities only
   const eventCountsByCity = MAJOR_CITIES.reduce((acc, city) => {
-    const count = events.filter(event => event.location.toLowerCase() === city.toLowerCase()).length;
+    const count = home?.cities.find(c => c.value.toLowerCase() === city.toLowerCase())?.count ?? 0;
     if (count > 0) {
       acc[city] = count;
     }
@@ -118,9 +108,9 @@ export default function HomePage() {
     .slice(0, 6)
     .map(([city]) => city);
 
-  // Calculate event counts per category
+  // Event counts per category
   const eventCountsByCategory = PREDEFINED_EVENT_CATEGORIES.reduce((acc, category) => {
-    const count = events.filter(event => event.categories.includes(category)).length;
+    const count = home?.categories.find(c => c.value === category)?.count ?? 0;
     if (count > 0) {
       acc[category] = count;
     }
@@ -11,6 +11,9 @@ export interface Event {
   url: string;
   source: string;
   registration_closes: string;
+  // Canonical names the facets are keyed on; location/categories are for display
+  city?: string;
+  canonical_categories?: string[];
 }
 
 // Determine the API base URL based on environment or hostname
@@ -40,9 +43,24 @@ api.interceptors.request.use((config) => {
   return config;
 });
 
+interface SnapshotManifest {
+  date: string;
+  events: { file: string; count: number };
+  clubs: { file: string; count: number };
+}
+
+// Upcoming events come from the static snapshot the backend republishes after
+// each ingest: the manifest is tiny and the content-hashed file it names is
+// cached by the browser until the data changes. Falls back to the live API.
 export const getEvents = async (): Promise<Event[]> => {
-  const response = await api.get('/events')
-  return response.data
+  try {
+    const { data: manifest } = await api.get<SnapshotManifest>('/snapshots/manifest.json')
+    const response = await api.get(`/snapshots/${manifest.events.file}`)
+    return response.data
+  } catch {
+    const response = await api.get('/events')
+    return response.data
+  }
 }
 
 export const getEventById = async (id: string): Promise<Event> => {
@@ -55,4 +73,100 @@ export const getEventsBySource = async (source: string): Promise<Event[]> => {
   return response.data
 }
 
-export default api 
\ No newline at end of file
+export interface FacetCount {
+  value: string;
+  count: number;
+}
+
+export interface EventFacets {
+  city: FacetCount[];
+  category: FacetCount[];
+  month: FacetCount[];
+  price_band: FacetCount[];
+}
+
+export const getEventFacets = async (): Promise<EventFacets> => {
+  const response = await api.get('/events/facets')
+  return response.data
+}
+
+export interface HomeData {
+  events: Event[];
+  clubs: any[];
+  cities: FacetCount[];
+  categories: FacetCount[];
+}
+
+// Everything the homepage renders in one small, server-cached response
+export const getHome = async (events = 8, clubs = 3): Promise<HomeData> => {
+  const response = await api.get('/home', { params: { events, clubs } })
+  return response.data
+}
+
+export interface SearchResult {
+  type: 'event' | 'club';
+  id: string;
+  score: number;
+  event?: Event;
+  club?: { id: string; name: string; location: string };
+}
+
+export interface SearchResponse {
+  query: string;
+  total: number;
+  limit: number;
+  offset: number;
+  results: SearchResult[];
+}
+
+// Ranked, typo-tolerant search over events and clubs; also understands
+// city/category aliases such as "bombay" or "hm"
+export const searchCatalog = async (
+  q: string,
+  options: { type?: 'all' | 'event' | 'club'; limit?: number; offset?: number } = {}
+): Promise<SearchResponse> => {
+  const response = await api.get('/search', { params: { q, ...options } })
+  return response.data
+}
+
+export default api 
+
+export interface ImageUploadTarget {
+  type: 'club' | 'event';
+  event_date: string;
+  event_name: string;
+  index: number;
+}
+
+// Upload an image straight to storage through a short-lived signed URL,
+// then ask the API to build the resized variants. Returns the public URL.
+export const uploadImage = async (file: File, target: ImageUploadTarget): Promise<string> => {
+  const fileExt = file.name.split('.').pop() || 'jpeg';
+  const { data } = await api.post('/media/presign-upload/', {
+    ...target,
+    file_ext: fileExt,
+    content_type: file.type,
+    size: file.size,
+  });
+
+  let uploadResponse: Response;
+  if (data.method === 'POST') {
+    // Presigned POST: the policy fields go first, the file last
+    const form = new FormData();
+    Object.entries(data.fields as Record<string, string>).forEach(([key, value]) => form.append(key, value));
+    form.append('file', file);
+    uploadResponse = await fetch(data.upload_url, { method: 'POST', body: form });
+  } else {
+    uploadResponse = await fetch(data.upload_url, {
+      method: data.method,
+      headers: data.headers,
+      body: file,
+    });
+  }
+  if (!uploadResponse.ok) {
+    throw new Error(`Upload failed with status ${uploadResponse.status}`);
+  }
+
+  await api.post('/media/complete-upload/', { path: data.path, upload_token: data.upload_token });
+  return data.public_url;
+}
@@ -1,3 +1,4 @@
+import type { SyntheticEvent } from 'react';
 import  {EVENT_IMAGES} from '../config/constants';
 
 // Function to get a random image URL from the predefined list
@@ -7,4 +8,22 @@ export function getRandomEventImage() {
     return EVENT_IMAGES[randomIndex];
     }
     return getRandomImageUrl();
-}
\ No newline at end of file
+}
+
+// Uploaded images have resized variants stored next to the original,
+// e.g. events/2025-01-01/Run_1.jpeg -> events/2025-01-01/Run_1_thumb.webp
+export function getImageVariant(url: string, variant: 'thumb' | 'display' = 'thumb', format: 'webp' | 'avif' = 'webp') {
+    if (!url.includes('/storage/v1/object/public/')) {
+        return url;
+    }
+    return url.replace(/\.[a-z0-9]+$/i, `_${variant}.${format}`);
+}
+
+// Older uploads have no variants, so fall back to the original image once
+export function fallbackToOriginal(originalUrl: string) {
+    return (e: SyntheticEvent<HTMLImageElement>) => {
+        if (e.currentTarget.src !== originalUrl) {
+            e.currentTarget.src = originalUrl;
+        }
+    };
+}